@@ -0,0 +1,151 @@
+"""Microbenchmark of the CPU cost of one API request in RemiApiClient.
+
+Runs ``RemiApiClient._send`` against an in-memory session that answers with a
+realistic Remi payload, once with the legacy pipeline (headers rebuilt per
+request, URLs formatted per call, every body decoded with stdlib JSON) and
+once with the current one, which skips decoding bodies identical to the
+previous poll. Network time is excluded; only client-side CPU time is
+measured.
+
+Usage, from the repository root::
+
+    python -m benchmarks.request_pipeline [iterations]
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+import time
+from typing import Any
+from unittest.mock import patch
+
+from custom_components.urbanhello_remi_unofficial import api
+from custom_components.urbanhello_remi_unofficial.api import RemiApiClient
+from custom_components.urbanhello_remi_unofficial.const import API_BASE_URL
+from custom_components.urbanhello_remi_unofficial.resilience import (
+    CircuitBreaker,
+    RateLimiter,
+)
+
+REMI = {
+    "objectId": "abc123",
+    "name": "Bedroom",
+    "temp": 215,
+    "luminosity": 12,
+    "volume": 40,
+    "brightness": 60,
+    "light_min": 10,
+    "light_max": 100,
+    "face": {"__type": "Pointer", "className": "Face", "objectId": "face1"},
+    "current_firmware_version": 1234,
+    "uniqueID": "0a:1b:2c:3d:4e:5f",
+    "ipv4Address": "192.168.1.20",
+    "rssi": -52,
+    "updatedAt": "2024-01-01T00:00:00.000Z",
+}
+EVENTS = [
+    {
+        "objectId": f"event{i}",
+        "name": f"Alarm {i}",
+        "enabled": bool(i % 2),
+        "event_time": {"__type": "Date", "iso": "2024-01-01T07:00:00.000Z"},
+        "recurrence": [1, 2, 3, 4, 5],
+        "volume": 40,
+        "brightness": 60,
+        "length_min": 30,
+        "updatedAt": "2024-01-01T00:00:00.000Z",
+    }
+    for i in range(10)
+]
+BODY = json.dumps({"results": [REMI], "events": EVENTS}).encode()
+QUERY = {"where": {"objectId": "abc123"}, "limit": "1", "_method": "GET"}
+
+
+class _Response:
+    status = 200
+    headers: dict[str, str] = {}
+
+    async def __aenter__(self) -> _Response:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        return None
+
+    async def read(self) -> bytes:
+        return BODY
+
+    async def text(self) -> str:
+        return BODY.decode()
+
+
+class _Session:
+    """Stand-in for aiohttp.ClientSession that also pays for encoding bodies."""
+
+    def __init__(self, dumps: Any) -> None:
+        self._dumps = dumps
+
+    def request(self, method: str, url: str, **kwargs: Any) -> _Response:
+        if kwargs.get("json") is not None:
+            self._dumps(kwargs["json"])
+        dict(kwargs["headers"])
+        return _Response()
+
+
+def _legacy_decode(
+    self: RemiApiClient, method: str, path: str, payload: Any, body: bytes
+) -> Any:
+    return json.loads(body)
+
+
+def _legacy_headers(self: RemiApiClient, authenticated: bool = True) -> dict[str, str]:
+    headers = dict(self._anonymous_headers)
+    if authenticated and self._session_token:
+        headers["X-Parse-Session-Token"] = self._session_token
+    return headers
+
+
+async def _run(client: RemiApiClient, iterations: int) -> float:
+    started = time.process_time()
+    for _ in range(iterations):
+        await client._send("POST", "/parse/classes/Remi", QUERY)
+    return (time.process_time() - started) / iterations * 1e6
+
+
+def _client(dumps: Any) -> RemiApiClient:
+    client = RemiApiClient(
+        "user",
+        "password",
+        _Session(dumps),
+        "install",
+        circuit_breaker=CircuitBreaker(),
+        # Never throttle: the benchmark measures CPU, not the request rate.
+        rate_limiter=RateLimiter(requests_per_minute=1e9, hourly_budget=10**9, burst=10**9),
+    )
+    client.set_session_token("r:token")
+    return client
+
+
+async def main(iterations: int) -> None:
+    with patch.object(api, "json_loads", json.loads), patch.object(
+        api, "_url", lambda path: f"{API_BASE_URL}{path}"
+    ), patch.object(RemiApiClient, "_base_headers", _legacy_headers), patch.object(
+        RemiApiClient, "_decode", _legacy_decode
+    ):
+        before = await _run(_client(json.dumps), iterations)
+
+    try:
+        import orjson
+    except ImportError:
+        fast_dumps = json.dumps
+    else:
+        fast_dumps = orjson.dumps
+    after = await _run(_client(fast_dumps), iterations)
+
+    print(f"legacy pipeline:  {before:8.1f} µs/request")
+    print(f"current pipeline: {after:8.1f} µs/request")
+    print(f"speed-up:         {before / after:8.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000))
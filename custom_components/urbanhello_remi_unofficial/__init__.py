@@ -4,17 +4,51 @@ from __future__ import annotations
 import logging
 from typing import Any
 
+import aiohttp
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, Platform
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, ServiceCall, callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.json import json_dumps
+from homeassistant.util import ssl as ssl_util
 
-from .api import RemiApiClient
-from .const import CONF_INSTALLATION_ID, CONF_REMI_ID, CONF_SESSION_TOKEN, DOMAIN
-from .coordinator import RemiDataUpdateCoordinator
+from .api import RemiApiClient, RemiApiError, RemiBatch, RemiBatchError
+from .const import (
+    CONF_ADAPTIVE_TIMEOUTS,
+    CONF_ALARM_POLLING,
+    CONF_CONDITIONAL_POLLING,
+    CONF_DEDICATED_CONNECTION,
+    CONF_HEDGED_READS,
+    CONF_HOURLY_REQUEST_BUDGET,
+    CONF_INSTALLATION_ID,
+    CONF_LIVE_QUERY,
+    CONF_OFFLINE_WRITE_QUEUE,
+    CONF_REMI_ID,
+    CONF_REQUESTS_PER_MINUTE,
+    CONF_SESSION_TOKEN,
+    CONF_VALIDATE_SESSION,
+    CONNECTION_KEEPALIVE_SECONDS,
+    CONNECTION_POOL_LIMIT,
+    DATA_ACCOUNT_FETCHERS,
+    DATA_DEDICATED_SESSIONS,
+    DNS_CACHE_TTL_SECONDS,
+    DOMAIN,
+    HOURLY_REQUEST_BUDGET,
+    RATE_LIMIT_REQUESTS_PER_MINUTE,
+    SESSION_TOKEN_SAVE_DELAY_SECONDS,
+)
+from .coordinator import RemiAccountFetcher, RemiDataUpdateCoordinator
+from .livequery import RemiLiveQuery
+from .resilience import get_rate_limiter
+from .write_queue import (
+    RemiWriteQueue,
+    async_drain_write_queue,
+    async_remove_write_queue,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -46,7 +80,7 @@ SERVICE_CREATE_ALARM_SCHEMA = vol.Schema(
 
 SERVICE_UPDATE_ALARM_SCHEMA = vol.Schema(
     {
-        vol.Required("event_id"): cv.string,
+        vol.Required("event_id"): vol.All(cv.ensure_list, [cv.string]),
         vol.Optional("name"): cv.string,
         vol.Optional("time"): cv.string,
         vol.Optional("enabled"): cv.boolean,
@@ -58,24 +92,61 @@ SERVICE_UPDATE_ALARM_SCHEMA = vol.Schema(
 
 SERVICE_DELETE_ALARM_SCHEMA = vol.Schema(
     {
-        vol.Required("event_id"): cv.string,
+        vol.Required("event_id"): vol.All(cv.ensure_list, [cv.string]),
     }
 )
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Remi from a config entry."""
-    session = async_get_clientsession(hass)
+    dedicated_connection = entry.options.get(CONF_DEDICATED_CONNECTION, False)
+    if dedicated_connection:
+        session = _async_get_dedicated_session(hass, entry)
+    else:
+        session = async_get_clientsession(hass)
+    # Every entry of the account shares one limiter; the last loaded entry's
+    # options apply.
+    rate_limiter = get_rate_limiter(entry.data[CONF_USERNAME].lower())
+    rate_limiter.configure(
+        entry.options.get(CONF_REQUESTS_PER_MINUTE, RATE_LIMIT_REQUESTS_PER_MINUTE),
+        entry.options.get(CONF_HOURLY_REQUEST_BUDGET, HOURLY_REQUEST_BUDGET),
+    )
     client = RemiApiClient(
         entry.data[CONF_USERNAME],
         entry.data[CONF_PASSWORD],
         session,
         entry.data.get(CONF_INSTALLATION_ID, ""),
+        rate_limiter=rate_limiter,
+        adaptive_timeouts=entry.options.get(CONF_ADAPTIVE_TIMEOUTS, False),
+        hedged_reads=entry.options.get(CONF_HEDGED_READS, False),
     )
-    client._session_token = entry.data.get(CONF_SESSION_TOKEN)
-    client._remi_id = entry.data[CONF_REMI_ID]
+    client.set_session_token(entry.data.get(CONF_SESSION_TOKEN))
+    client.set_remi_id(entry.data[CONF_REMI_ID])
+    _async_persist_session_tokens(hass, entry, client)
 
-    coordinator = RemiDataUpdateCoordinator(hass, client)
+    if entry.options.get(CONF_VALIDATE_SESSION, True):
+        await _async_validate_session(client)
+
+    write_queue = None
+    if entry.options.get(CONF_OFFLINE_WRITE_QUEUE, False):
+        write_queue = RemiWriteQueue(hass, client, entry.entry_id)
+        await write_queue.async_load()
+    else:
+        await async_drain_write_queue(hass, client, entry.entry_id)
+
+    account_fetcher = _async_get_account_fetcher(hass, entry)
+    coordinator = RemiDataUpdateCoordinator(
+        hass,
+        client,
+        conditional_polling=entry.options.get(CONF_CONDITIONAL_POLLING, False),
+        prewarm=dedicated_connection,
+        account_fetcher=account_fetcher,
+        write_queue=write_queue,
+        alarm_polling=entry.options.get(CONF_ALARM_POLLING, False),
+    )
+    entry.async_on_unload(
+        _async_register_account_device(hass, entry, account_fetcher, coordinator)
+    )
     await coordinator.async_setup()
     await coordinator.async_config_entry_first_refresh()
 
@@ -85,9 +156,146 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     _register_services(hass, coordinator)
 
+    if entry.options.get(CONF_LIVE_QUERY, False):
+        live_query = RemiLiveQuery(
+            session,
+            client,
+            coordinator.async_apply_push,
+            coordinator.async_set_push_connected,
+        )
+        # Background tasks of the entry are cancelled when it is unloaded.
+        entry.async_create_background_task(
+            hass, live_query.async_run(), f"{DOMAIN} LiveQuery {entry.entry_id}"
+        )
+
+    setup_options = dict(entry.options)
+
+    async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Reload the config entry when its options change."""
+        # Saving a refreshed session token also updates the entry; skip those.
+        if entry.options != setup_options:
+            await hass.config_entries.async_reload(entry.entry_id)
+
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+
     return True
 
 
+@callback
+def _async_get_account_fetcher(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> RemiAccountFetcher:
+    """Return the fetcher shared by every configured Remi of the entry's account."""
+    fetchers = hass.data.setdefault(DATA_ACCOUNT_FETCHERS, {})
+    return fetchers.setdefault(
+        entry.data[CONF_USERNAME].lower(), RemiAccountFetcher()
+    )
+
+
+@callback
+def _async_register_account_device(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    fetcher: RemiAccountFetcher,
+    coordinator: RemiDataUpdateCoordinator,
+) -> CALLBACK_TYPE:
+    """Add the device to its account's shared polls; return a removal callback."""
+    unregister = fetcher.async_register(coordinator)
+
+    @callback
+    def _async_unregister() -> None:
+        unregister()
+        if not fetcher.devices:
+            hass.data[DATA_ACCOUNT_FETCHERS].pop(entry.data[CONF_USERNAME].lower(), None)
+
+    return _async_unregister
+
+
+@callback
+def _async_get_dedicated_session(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> aiohttp.ClientSession:
+    """Return the dedicated session shared by the entries of the entry's account.
+
+    The session is closed when the last entry using it unloads.
+    """
+    account = entry.data[CONF_USERNAME].lower()
+    sessions = hass.data.setdefault(DATA_DEDICATED_SESSIONS, {})
+    if account not in sessions:
+        sessions[account] = (_create_dedicated_session(), set())
+    session, entry_ids = sessions[account]
+    entry_ids.add(entry.entry_id)
+
+    async def _async_release() -> None:
+        entry_ids.discard(entry.entry_id)
+        if not entry_ids:
+            sessions.pop(account, None)
+            await session.close()
+
+    entry.async_on_unload(_async_release)
+    return session
+
+
+def _create_dedicated_session() -> aiohttp.ClientSession:
+    """Create a session with its own connection pool for the Remi API.
+
+    Connections are kept alive across polls and DNS answers are cached, so
+    the account does not compete with other integrations for sockets.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=CONNECTION_POOL_LIMIT,
+        ttl_dns_cache=DNS_CACHE_TTL_SECONDS,
+        keepalive_timeout=CONNECTION_KEEPALIVE_SECONDS,
+        ssl=ssl_util.get_default_context(),
+    )
+    # Encode request bodies with orjson, as Home Assistant's shared session does.
+    return aiohttp.ClientSession(connector=connector, json_serialize=json_dumps)
+
+
+@callback
+def _async_persist_session_tokens(
+    hass: HomeAssistant, entry: ConfigEntry, client: RemiApiClient
+) -> None:
+    """Write session tokens refreshed by the client back to the entry data."""
+
+    @callback
+    def _async_save_session_token() -> None:
+        token = client.session_token
+        if token and token != entry.data.get(CONF_SESSION_TOKEN):
+            hass.config_entries.async_update_entry(
+                entry, data={**entry.data, CONF_SESSION_TOKEN: token}
+            )
+
+    debouncer = Debouncer(
+        hass,
+        _LOGGER,
+        cooldown=SESSION_TOKEN_SAVE_DELAY_SECONDS,
+        immediate=False,
+        function=_async_save_session_token,
+    )
+    client.set_session_token_listener(lambda _token: debouncer.async_schedule_call())
+
+    @callback
+    def _async_flush_session_token() -> None:
+        client.set_session_token_listener(None)
+        debouncer.async_cancel()
+        _async_save_session_token()
+
+    entry.async_on_unload(_async_flush_session_token)
+
+
+async def _async_validate_session(client: RemiApiClient) -> None:
+    """Replace a stored session token the server no longer accepts.
+
+    This avoids paying a failed request followed by a login on the first poll.
+    """
+    try:
+        if not await client.validate_session():
+            await client.refresh_session()
+    except RemiApiError as err:
+        _LOGGER.debug("Could not validate the stored Remi session: %s", err)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
@@ -96,6 +304,11 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the data stored for a removed config entry."""
+    await async_remove_write_queue(hass, entry.entry_id)
+
+
 def _register_services(hass: HomeAssistant, coordinator: RemiDataUpdateCoordinator) -> None:
     """Register alarm CRUD services."""
 
@@ -119,14 +332,15 @@ def _register_services(hass: HomeAssistant, coordinator: RemiDataUpdateCoordinat
         if "volume" in call.data:
             event_data["volume"] = call.data["volume"]
 
-        await coordinator.client.create_event(event_data)
-        await coordinator.async_request_refresh()
+        response = await coordinator.client.create_event(event_data)
+        coordinator.async_record_activity()
+        coordinator.async_expire_events()
+        coordinator.async_apply_write("create", "Event", event_data, response)
 
     async def handle_update_alarm(call: ServiceCall) -> None:
         """Handle update_alarm service call."""
         from .const import FACE_DEFINE_TO_OBJECT_ID
 
-        event_id = call.data["event_id"]
         fields: dict[str, Any] = {}
 
         if "name" in call.data:
@@ -147,13 +361,21 @@ def _register_services(hass: HomeAssistant, coordinator: RemiDataUpdateCoordinat
                 "objectId": FACE_DEFINE_TO_OBJECT_ID[face_define],
             }
 
-        await coordinator.client.update_event(event_id, fields)
-        await coordinator.async_request_refresh()
+        batch = coordinator.client.batch()
+        for event_id in call.data["event_id"]:
+            batch.update_event(event_id, fields)
+        await _async_commit_event_writes(
+            coordinator, batch, "update", call.data["event_id"], fields
+        )
 
     async def handle_delete_alarm(call: ServiceCall) -> None:
         """Handle delete_alarm service call."""
-        await coordinator.client.delete_event(call.data["event_id"])
-        await coordinator.async_request_refresh()
+        batch = coordinator.client.batch()
+        for event_id in call.data["event_id"]:
+            batch.delete_event(event_id)
+        await _async_commit_event_writes(
+            coordinator, batch, "delete", call.data["event_id"]
+        )
 
     if not hass.services.has_service(DOMAIN, SERVICE_CREATE_ALARM):
         hass.services.async_register(
@@ -176,3 +398,36 @@ def _register_services(hass: HomeAssistant, coordinator: RemiDataUpdateCoordinat
             handle_delete_alarm,
             schema=SERVICE_DELETE_ALARM_SCHEMA,
         )
+
+
+async def _async_commit_event_writes(
+    coordinator: RemiDataUpdateCoordinator,
+    batch: RemiBatch,
+    op: str,
+    event_ids: list[str],
+    fields: dict[str, Any] | None = None,
+) -> None:
+    """Commit a batch of event writes and apply those that succeeded.
+
+    When only some operations fail, the successful ones are still applied to
+    the cached events before the batch error is raised.
+    """
+    results: list[Any] = []
+    try:
+        results = await batch.commit()
+    except RemiBatchError as err:
+        results = err.results
+        raise
+    finally:
+        coordinator.async_expire_events()
+        written = [
+            (event_id, result)
+            for event_id, result in zip(event_ids, results)
+            if not isinstance(result, RemiApiError)
+        ]
+        if written:
+            coordinator.async_record_activity()
+        for event_id, result in written:
+            coordinator.async_apply_write(
+                op, "Event", {**(fields or {}), "objectId": event_id}, result
+            )
@@ -1,11 +1,29 @@
 """API client for the UrbanHello Remi integration."""
 from __future__ import annotations
 
+import asyncio
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache, partial
+import hashlib
+import itertools
+import json
 import logging
+import time
+from types import MappingProxyType
 from typing import Any
 
 import aiohttp
 
+try:
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    from json import loads as json_loads
+
 from .const import (
     API_APP_BUILD_VERSION,
     API_APP_DISPLAY_VERSION,
@@ -14,29 +32,196 @@ from .const import (
     API_CLIENT_VERSION,
     API_OS_VERSION,
     API_USER_AGENT,
+    LOGIN_BACKOFF_BASE_SECONDS,
+    LOGIN_BACKOFF_MAX_SECONDS,
+    LOGIN_TIMEOUT_SECONDS,
+    PARSE_BATCH_MAX_OPERATIONS,
+    PARSE_ERROR_INVALID_LOGIN,
+    PARSE_ERROR_INVALID_SESSION_TOKEN,
+    RESPONSE_FINGERPRINT_CACHE_SIZE,
+    QUERY_PAGE_SIZE,
+    RATE_LIMIT_DEFAULT_RETRY_SECONDS,
+    READ_DEADLINE_SECONDS,
+    READ_TIMEOUT_SECONDS,
+    REQUEST_MAX_RETRIES,
+    WRITE_TIMEOUT_SECONDS,
+)
+from .resilience import (
+    CircuitBreaker,
+    HedgeBudget,
+    LatencyTracker,
+    RateLimiter,
+    backoff_delay,
+    get_circuit_breaker,
+    get_rate_limiter,
+)
+from .scheduler import (
+    RequestPriority,
+    RequestScheduler,
+    RequestSupersededError,
+    get_request_scheduler,
 )
+from .transport import AiohttpTransport, RemiTransport
 
 _LOGGER = logging.getLogger(__name__)
 
-
-class RemiAuthError(Exception):
-    """Raised when authentication fails."""
+# Set while a coordinator polls, so its reads are scheduled as background work.
+_background_requests: ContextVar[bool] = ContextVar(
+    "remi_background_requests", default=False
+)
+# Generation of the superseding poll that made the current background reads.
+_poll_generation: ContextVar[int | None] = ContextVar(
+    "remi_poll_generation", default=None
+)
 
 
 class RemiApiError(Exception):
     """Raised when an API call fails."""
 
 
+class RemiAuthError(RemiApiError):
+    """Raised when authentication fails."""
+
+
+class RemiTransientError(RemiApiError):
+    """Raised when a request fails on the network or times out."""
+
+
+class RemiTimeoutError(RemiTransientError):
+    """Raised when a request or its overall deadline times out."""
+
+
+class RemiRateLimitError(RemiTransientError):
+    """Raised when the server or the client-side limits hold requests back."""
+
+    def __init__(self, message: str, retry_after: float) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class RemiCircuitOpenError(RemiTransientError):
+    """Raised when requests are suspended after repeated failures."""
+
+
+class RemiSupersededError(RemiApiError):
+    """Raised when a queued background poll is replaced by a newer one."""
+
+
+class RemiServerError(RemiApiError):
+    """Raised when the server answers with a 5xx status."""
+
+
+class RemiClientError(RemiApiError):
+    """Raised when the server rejects a request with a 4xx status."""
+
+    def __init__(self, message: str, status: int) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+class RemiBatchError(RemiApiError):
+    """Raised when one or more operations in a batch fail.
+
+    ``results`` holds one entry per queued operation: the Parse success payload,
+    or a ``RemiApiError`` for operations that failed.
+    """
+
+    def __init__(self, message: str, results: list[Any]) -> None:
+        super().__init__(message)
+        self.results = results
+
+
+class RemiBatch:
+    """Queue of write operations sent together in one ``/parse/batch`` request."""
+
+    def __init__(self, client: RemiApiClient) -> None:
+        self._client = client
+        self._operations: list[dict[str, Any]] = []
+
+    def __len__(self) -> int:
+        return len(self._operations)
+
+    def update_remi(self, fields: dict[str, Any]) -> None:
+        """Queue an update of Remi device fields."""
+        self._operations.append(self._client._update_remi_operation(fields))
+
+    def create_event(self, event_data: dict[str, Any]) -> None:
+        """Queue the creation of an alarm event."""
+        self._operations.append(self._client._create_event_operation(event_data))
+
+    def update_event(self, event_id: str, fields: dict[str, Any]) -> None:
+        """Queue an update of an alarm event."""
+        self._operations.append(self._client._update_event_operation(event_id, fields))
+
+    def delete_event(self, event_id: str) -> None:
+        """Queue the deletion of an alarm event."""
+        self._operations.append(self._client._delete_event_operation(event_id))
+
+    async def commit(self) -> list[Any]:
+        """Send all queued operations and return one result per operation."""
+        operations, self._operations = self._operations, []
+        if not operations:
+            return []
+        if len(operations) == 1:
+            return [await self._client._execute(operations[0])]
+        return await self._client._send_batch(operations)
+
+
 class RemiApiClient:
     """Client for the UrbanHello Remi Parse Server API."""
 
-    def __init__(self, username: str, password: str, session: aiohttp.ClientSession, installation_id: str = "") -> None:
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        session: aiohttp.ClientSession | None,
+        installation_id: str = "",
+        circuit_breaker: CircuitBreaker | None = None,
+        scheduler: RequestScheduler | None = None,
+        rate_limiter: RateLimiter | None = None,
+        adaptive_timeouts: bool = False,
+        hedged_reads: bool = False,
+        transport: RemiTransport | None = None,
+    ) -> None:
         self._username = username
         self._password = password
-        self._session = session
+        # A custom transport, e.g. a cassette replay, needs no session.
+        self._transport = transport or AiohttpTransport(session)
         self._installation_id = installation_id
         self._session_token: str | None = None
         self._remi_id: str | None = None
+        self._login_lock = asyncio.Lock()
+        self._login_failures = 0
+        self._login_blocked_until = 0.0
+        self._session_token_listener: Callable[[str], None] | None = None
+        self._circuit_breaker = circuit_breaker or get_circuit_breaker(API_BASE_URL)
+        self._scheduler = scheduler or get_request_scheduler(API_BASE_URL)
+        self._poll_generations = itertools.count(1)
+        self._rate_limiter = rate_limiter or get_rate_limiter(username.lower())
+        self._adaptive_timeouts = adaptive_timeouts
+        self._latency: dict[str, LatencyTracker] = {}
+        self._hedged_reads = hedged_reads
+        self._hedge_budget = HedgeBudget()
+        self._in_flight: dict[tuple[Any, ...], asyncio.Task[Any]] = {}
+        self._fingerprints: OrderedDict[tuple[str, ...], tuple[bytes, Any]] = OrderedDict()
+        self._anonymous_headers: Mapping[str, str] = MappingProxyType(
+            {
+                "X-Parse-Client-Version": API_CLIENT_VERSION,
+                "X-Parse-Application-Id": API_APP_ID,
+                "X-Parse-Installation-Id": installation_id,
+                "X-Parse-OS-Version": API_OS_VERSION,
+                "X-Parse-App-Build-Version": API_APP_BUILD_VERSION,
+                "X-Parse-App-Display-Version": API_APP_DISPLAY_VERSION,
+                "Accept": "*/*",
+                "Accept-Language": "en-gb",
+                "Accept-Encoding": "gzip, deflate, br",
+                "Content-Type": "application/json; charset=utf-8",
+                "User-Agent": API_USER_AGENT,
+                "Connection": "keep-alive",
+            }
+        )
+        self._authenticated_headers = self._anonymous_headers
+        self._authenticated_headers_token: str | None = None
 
     @property
     def remi_id(self) -> str | None:
@@ -46,45 +231,107 @@ class RemiApiClient:
     def session_token(self) -> str | None:
         return self._session_token
 
-    def _base_headers(self, authenticated: bool = True) -> dict[str, str]:
-        headers = {
-            "X-Parse-Client-Version": API_CLIENT_VERSION,
-            "X-Parse-Application-Id": API_APP_ID,
-            "X-Parse-Installation-Id": self._installation_id,
-            "X-Parse-OS-Version": API_OS_VERSION,
-            "X-Parse-App-Build-Version": API_APP_BUILD_VERSION,
-            "X-Parse-App-Display-Version": API_APP_DISPLAY_VERSION,
-            "Accept": "*/*",
-            "Accept-Language": "en-gb",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Content-Type": "application/json; charset=utf-8",
-            "User-Agent": API_USER_AGENT,
-            "Connection": "keep-alive",
-        }
-        if authenticated and self._session_token:
-            headers["X-Parse-Session-Token"] = self._session_token
-        return headers
+    @property
+    def installation_id(self) -> str:
+        return self._installation_id
+
+    @property
+    def budget_low(self) -> bool:
+        """Return true when the account's hourly request budget is running out."""
+        return self._rate_limiter.budget_low
+
+    def _base_headers(self, authenticated: bool = True) -> Mapping[str, str]:
+        """Return the request headers, rebuilt only when the session token changes."""
+        if not authenticated or not self._session_token:
+            return self._anonymous_headers
+        if self._authenticated_headers_token != self._session_token:
+            self._authenticated_headers = MappingProxyType(
+                {
+                    **self._anonymous_headers,
+                    "X-Parse-Session-Token": self._session_token,
+                }
+            )
+            self._authenticated_headers_token = self._session_token
+        return self._authenticated_headers
+
+    def latency_tracker(self, method: str, path: str) -> LatencyTracker:
+        """Return the latency statistics of the endpoint serving ``path``."""
+        endpoint = _endpoint(method, path)
+        if endpoint not in self._latency:
+            self._latency[endpoint] = LatencyTracker()
+        return self._latency[endpoint]
+
+    @contextmanager
+    def background_requests(self, supersede: bool = False) -> Iterator[None]:
+        """Schedule reads made in this context, and tasks it starts, as background polls.
+
+        Background reads yield to interactive requests. With ``supersede``, the
+        context is a new poll generation: reads of an older superseding poll
+        still queued are dropped with ``RemiSupersededError``, whatever they ask.
+        """
+        token = _background_requests.set(True)
+        generation_token = _poll_generation.set(
+            next(self._poll_generations) if supersede else _poll_generation.get()
+        )
+        try:
+            yield
+        finally:
+            _poll_generation.reset(generation_token)
+            _background_requests.reset(token)
 
     def set_remi_id(self, remi_id: str) -> None:
         """Set the active Remi device ID."""
         self._remi_id = remi_id
 
+    def set_session_token(self, session_token: str | None) -> None:
+        """Set a previously issued session token."""
+        self._session_token = session_token
+
+    def set_session_token_listener(self, listener: Callable[[str], None] | None) -> None:
+        """Set a callback invoked with the new token after re-authentication."""
+        self._session_token_listener = listener
+
+    async def validate_session(self) -> bool:
+        """Return whether the current session token is still accepted."""
+        if not self._session_token:
+            return False
+        try:
+            await self._request("GET", "/parse/users/me", retry_auth=False)
+        except RemiAuthError:
+            return False
+        return True
+
+    async def refresh_session(self) -> None:
+        """Log in again, replacing the current session token."""
+        await self._reauthenticate(self._session_token)
+
     async def login(self) -> tuple[str, str, list[str]]:
         """Authenticate and return (session_token, current_remi_id, all_remi_ids)."""
-        url = f"{API_BASE_URL}/parse/login"
+        url = _url("/parse/login")
         payload = {
             "_method": "GET",
             "username": self._username,
             "password": self._password,
         }
-        async with self._session.post(
-            url, json=payload, headers=self._base_headers(authenticated=False)
-        ) as resp:
-            if resp.status == 401:
-                raise RemiAuthError("Invalid username or password")
-            if resp.status != 200:
-                raise RemiApiError(f"Login failed with status {resp.status}")
-            data = await resp.json()
+        try:
+            resp = await self._transport.request(
+                "POST",
+                url,
+                payload,
+                self._base_headers(authenticated=False),
+                LOGIN_TIMEOUT_SECONDS,
+            )
+        except asyncio.TimeoutError as err:
+            raise RemiTimeoutError("Login request timed out") from err
+        except aiohttp.ClientError as err:
+            raise RemiTransientError(f"Login request failed: {err!r}") from err
+        if resp.status == 401 or (
+            resp.status == 404 and _parse_error_code(resp.body) == PARSE_ERROR_INVALID_LOGIN
+        ):
+            raise RemiAuthError("Invalid username or password")
+        if resp.status != 200:
+            raise RemiApiError(f"Login failed with status {resp.status}")
+        data = json_loads(resp.body)
 
         session_token = data.get("sessionToken")
         current_remi = data.get("currentRemi", {})
@@ -107,44 +354,394 @@ class RemiApiClient:
         path: str,
         payload: dict[str, Any] | None = None,
         retry_auth: bool = True,
+        hedge: bool = False,
+    ) -> Any:
+        """Make an authenticated API request.
+
+        Identical idempotent reads made while one is in flight wait for it
+        and share its decoded result instead of sending another request.
+        """
+        if not _is_idempotent(method, payload):
+            return await self._request_with_retries(
+                method, path, payload, retry_auth, hedge=hedge
+            )
+        key = (method, path, retry_auth, json.dumps(payload, sort_keys=True))
+        if (shared := self._in_flight.get(key)) is None:
+            shared = asyncio.create_task(
+                self._request_with_retries(
+                    method, path, payload, retry_auth, hedge=hedge
+                )
+            )
+            self._in_flight[key] = shared
+            shared.add_done_callback(partial(self._async_in_flight_done, key))
+        # A cancelled caller must not cancel the read for the others.
+        return await asyncio.shield(shared)
+
+    def _async_in_flight_done(
+        self, key: tuple[Any, ...], task: asyncio.Task[Any]
+    ) -> None:
+        """Forget a finished shared read."""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            # Mark the error as retrieved in case every caller went away.
+            task.exception()
+
+    async def _request_with_retries(
+        self,
+        method: str,
+        path: str,
+        payload: dict[str, Any] | None = None,
+        retry_auth: bool = True,
+        deadline: float | None = None,
+        hedge: bool = False,
+    ) -> Any:
+        """Send a request, retrying and re-authenticating as needed.
+
+        Idempotent reads are retried with jittered backoff after transient and
+        server errors, and a 401 triggers a single re-login. Every attempt,
+        retry delay and the request after re-login share one deadline, so the
+        total time of an operation stays bounded. With ``hedge`` and hedged
+        reads enabled, slow attempts are raced against a duplicate request.
+        """
+        idempotent = _is_idempotent(method, payload)
+        if deadline is None:
+            deadline = time.monotonic() + (
+                READ_DEADLINE_SECONDS if idempotent else WRITE_TIMEOUT_SECONDS
+            )
+        attempts = 1 + (REQUEST_MAX_RETRIES if idempotent else 0)
+        for attempt in range(attempts):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise RemiTimeoutError(f"Deadline exceeded for {path}")
+            timeout = min(self._attempt_timeout(method, path, idempotent), remaining)
+            token = self._session_token
+            try:
+                if hedge and idempotent and self._hedged_reads:
+                    return await self._send_hedged(method, path, payload, timeout)
+                return await self._send(method, path, payload, timeout)
+            except RemiAuthError:
+                if not retry_auth:
+                    raise
+                break
+            except (RemiTransientError, RemiServerError) as err:
+                if attempt + 1 >= attempts or isinstance(err, RemiCircuitOpenError):
+                    raise
+                delay = backoff_delay(attempt)
+                if isinstance(err, RemiRateLimitError):
+                    delay = max(delay, err.retry_after)
+                if time.monotonic() + delay >= deadline:
+                    raise
+                _LOGGER.debug("Retrying %s in %.1fs after: %s", path, delay, err)
+                await asyncio.sleep(delay)
+
+        # _send has released the 401 response, so its connection is not held
+        # while logging in again.
+        _LOGGER.debug("Session expired, re-authenticating")
+        await self._reauthenticate(token)
+        return await self._request_with_retries(
+            method, path, payload, retry_auth=False, deadline=deadline, hedge=hedge
+        )
+
+    def _attempt_timeout(self, method: str, path: str, idempotent: bool) -> float:
+        """Return the timeout of a single attempt.
+
+        Only reads use adaptive timeouts: a write that times out may still have
+        been applied, so writes keep the fixed, generous timeout.
+        """
+        if not idempotent:
+            return WRITE_TIMEOUT_SECONDS
+        if self._adaptive_timeouts:
+            return self.latency_tracker(method, path).timeout(READ_TIMEOUT_SECONDS)
+        return READ_TIMEOUT_SECONDS
+
+    async def _send_hedged(
+        self,
+        method: str,
+        path: str,
+        payload: dict[str, Any] | None,
+        timeout: float,
     ) -> Any:
-        """Make an authenticated API request, re-logging in on 401."""
-        url = f"{API_BASE_URL}{path}"
-        async with self._session.request(
-            method, url, json=payload, headers=self._base_headers()
-        ) as resp:
-            if resp.status == 401 and retry_auth:
-                _LOGGER.debug("Session expired, re-authenticating")
+        """Send a read and, once it outlasts the p95 latency, a duplicate of it.
+
+        The first successful answer wins and the other request is cancelled.
+        Hedges are rationed by the hedge budget and skipped while the hourly
+        request budget is running low.
+        """
+        hedge_after = self.latency_tracker(method, path).p95
+        if hedge_after is None or hedge_after >= timeout or self.budget_low:
+            return await self._send(method, path, payload, timeout)
+
+        pending = {asyncio.create_task(self._send(method, path, payload, timeout))}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=hedge_after)
+            if done:
+                return done.pop().result()
+            if not self._hedge_budget.try_acquire():
+                return await pending.pop()
+            _LOGGER.debug("Hedging %s after %.2fs", path, hedge_after)
+            pending.add(
+                asyncio.create_task(
+                    self._send(method, path, payload, timeout - hedge_after)
+                )
+            )
+            while True:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                succeeded = [task for task in done if task.exception() is None]
+                if succeeded:
+                    return succeeded[0].result()
+                if not pending:
+                    # Both requests failed; report the last failure.
+                    raise done.pop().exception()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        payload: dict[str, Any] | None = None,
+        timeout: float = READ_TIMEOUT_SECONDS,
+        metered: bool = True,
+    ) -> Any:
+        """Send one request through the circuit breaker and decode the reply.
+
+        ``timeout`` covers the whole attempt: waiting for the rate limiter,
+        queueing for a scheduler slot and the HTTP exchange each get only
+        the time the earlier stages left. Requests that are not ``metered``
+        only honour server-requested pauses.
+        """
+        if not self._circuit_breaker.allow_request():
+            raise RemiCircuitOpenError(
+                f"Requests to {API_BASE_URL} suspended for "
+                f"{self._circuit_breaker.retry_after:.0f}s after repeated failures"
+            )
+        attempt_deadline = time.monotonic() + timeout
+        await self._wait_for_rate_limit(path, timeout, metered)
+        await self._acquire_slot(method, path, payload, attempt_deadline - time.monotonic())
+        retry_after: float | None = None
+        started = time.monotonic()
+        try:
+            remaining = attempt_deadline - started
+            if remaining <= 0:
+                raise RemiTimeoutError(
+                    f"Request to {path} waited {timeout:.1f}s without being sent"
+                )
+            resp = await self._transport.request(
+                method, _url(path), payload, self._base_headers(), remaining
+            )
+        except asyncio.TimeoutError as err:
+            # The answer took at least this long; without the sample, a timeout
+            # learned from fast reads could never grow again.
+            self.latency_tracker(method, path).record(time.monotonic() - started)
+            self._circuit_breaker.record_failure()
+            raise RemiTimeoutError(f"Request to {path} timed out after {timeout:.1f}s") from err
+        except aiohttp.ClientError as err:
+            self._circuit_breaker.record_failure()
+            raise RemiTransientError(f"Request to {path} failed: {err!r}") from err
+        finally:
+            self._scheduler.release()
+        self.latency_tracker(method, path).record(time.monotonic() - started)
+
+        status = resp.status
+        if status not in (200, 201):
+            text = resp.text
+            retry_after = _retry_after(resp.headers.get("Retry-After"))
+        if status == 429 or (status == 503 and retry_after is not None):
+            if retry_after is None:
+                retry_after = RATE_LIMIT_DEFAULT_RETRY_SECONDS
+            self._rate_limiter.pause(retry_after)
+            raise RemiRateLimitError(
+                f"API error {status} on {path}, retry after {retry_after:.0f}s",
+                retry_after,
+            )
+        if status >= 500:
+            self._circuit_breaker.record_failure()
+            raise RemiServerError(f"API error {status} on {path}: {text}")
+        self._circuit_breaker.record_success()
+        if status in (200, 201):
+            return self._decode(method, path, payload, resp.body)
+        if status == 401 or (
+            status in (400, 403)
+            and _parse_error_code(resp.body) == PARSE_ERROR_INVALID_SESSION_TOKEN
+        ):
+            raise RemiAuthError(f"API error {status} on {path}: {text}")
+        raise RemiClientError(f"API error {status} on {path}: {text}", status)
+
+    def _decode(
+        self, method: str, path: str, payload: dict[str, Any] | None, body: bytes
+    ) -> Any:
+        """Decode a response body, reusing the last result if a read is unchanged.
+
+        Reads are fingerprinted per endpoint and query. A body identical to
+        the previous one returns the previously decoded object, so callers
+        can tell nothing changed by identity or a cheap equality check.
+        """
+        if not body.strip():
+            return None
+        if not _is_idempotent(method, payload):
+            return json_loads(body)
+        key = (method, path, json.dumps(payload, sort_keys=True))
+        fingerprint = hashlib.blake2b(body, digest_size=16).digest()
+        cached = self._fingerprints.get(key)
+        if cached is not None and cached[0] == fingerprint:
+            self._fingerprints.move_to_end(key)
+            return cached[1]
+        data = json_loads(body)
+        self._fingerprints[key] = (fingerprint, data)
+        self._fingerprints.move_to_end(key)
+        if len(self._fingerprints) > RESPONSE_FINGERPRINT_CACHE_SIZE:
+            self._fingerprints.popitem(last=False)
+        return data
+
+    async def _wait_for_rate_limit(
+        self, path: str, timeout: float, metered: bool = True
+    ) -> None:
+        """Wait for the account's token bucket, within ``timeout``.
+
+        Requests are refused while the server asked to pause, and background
+        polls are refused once the hourly budget is spent. Requests that are
+        not ``metered`` skip the token bucket and the budget.
+        """
+        limiter = self._rate_limiter
+        if (retry_after := limiter.retry_after) > 0:
+            raise RemiRateLimitError(
+                f"Requests paused for {retry_after:.0f}s at the server's request",
+                retry_after,
+            )
+        if not metered:
+            return
+        if _background_requests.get() and limiter.budget_remaining == 0:
+            raise RemiRateLimitError(
+                "Hourly request budget spent, deferring background poll",
+                limiter.budget_resets_in,
+            )
+        while (delay := limiter.try_acquire()) > 0:
+            if delay > timeout:
+                raise RemiRateLimitError(
+                    f"Request rate limit reached for {path}", delay
+                )
+            timeout -= delay
+            await asyncio.sleep(delay)
+
+    async def _acquire_slot(
+        self,
+        method: str,
+        path: str,
+        payload: dict[str, Any] | None,
+        timeout: float,
+    ) -> None:
+        """Wait for the host scheduler to let this request through.
+
+        Writes go first, then interactive reads, then background polls.
+        """
+        if self._scheduler.try_acquire():
+            return
+        supersede_group = None
+        generation = 0
+        if not _is_idempotent(method, payload):
+            priority = RequestPriority.INTERACTIVE_WRITE
+        elif _background_requests.get():
+            priority = RequestPriority.BACKGROUND
+            if (poll := _poll_generation.get()) is not None:
+                supersede_group, generation = id(self), poll
+        else:
+            priority = RequestPriority.INTERACTIVE_READ
+        try:
+            await asyncio.wait_for(
+                self._scheduler.acquire(priority, supersede_group, generation),
+                timeout,
+            )
+        except asyncio.TimeoutError as err:
+            raise RemiTimeoutError(
+                f"Request to {path} queued for more than {timeout:.1f}s"
+            ) from err
+        except RequestSupersededError as err:
+            raise RemiSupersededError(
+                f"Request to {path} superseded by a newer poll"
+            ) from err
+
+    async def _reauthenticate(self, stale_token: str | None) -> None:
+        """Log in again once for all requests that failed with ``stale_token``.
+
+        Concurrent callers wait for a single login and reuse its token. After
+        failed logins, further attempts are refused with an exponentially
+        growing delay so a changed password does not hammer /parse/login.
+        """
+        async with self._login_lock:
+            if self._session_token != stale_token:
+                return
+
+            remaining = self._login_blocked_until - time.monotonic()
+            if remaining > 0:
+                raise RemiAuthError(
+                    f"Re-authentication suspended for {remaining:.0f}s after failed logins"
+                )
+
+            remi_id = self._remi_id
+            try:
                 await self.login()
-                return await self._request(method, path, payload, retry_auth=False)
-            if resp.status not in (200, 201):
-                text = await resp.text()
-                raise RemiApiError(f"API error {resp.status} on {path}: {text}")
-            return await resp.json()
-
-    async def get_remi(self) -> dict[str, Any]:
-        """Fetch the Remi device state."""
+            except RemiApiError:
+                self._login_failures += 1
+                self._login_blocked_until = time.monotonic() + min(
+                    LOGIN_BACKOFF_BASE_SECONDS * 2 ** (self._login_failures - 1),
+                    LOGIN_BACKOFF_MAX_SECONDS,
+                )
+                raise
+            self._login_failures = 0
+            self._login_blocked_until = 0.0
+            # login() selects the account's current Remi; keep the configured one.
+            if remi_id:
+                self._remi_id = remi_id
+            if self._session_token_listener is not None and self._session_token:
+                self._session_token_listener(self._session_token)
+
+    async def warm_up(self) -> None:
+        """Open a connection to the API host ahead of the next request.
+
+        The unauthenticated health check moves DNS resolution and the TLS
+        handshake off the critical path of the following request. It does not
+        take a rate-limit token or count against the hourly budget.
+        """
+        await self._send("GET", "/parse/health", metered=False)
+
+    async def get_remi(self, keys: Iterable[str] | None = None) -> dict[str, Any]:
+        """Fetch the Remi device state, optionally limited to the given fields."""
         data = await self._request(
-            "POST",
-            "/parse/classes/Remi",
-            {
-                "limit": "1",
-                "where": {"objectId": self._remi_id},
-                "_method": "GET",
-            },
+            "POST", "/parse/classes/Remi", self._remi_query(keys), hedge=True
         )
         results = data.get("results", [])
         if not results:
             raise RemiApiError("No Remi device found")
         return results[0]
 
+    async def get_remi_changes(
+        self, updated_since: str, keys: Iterable[str] | None = None
+    ) -> dict[str, Any] | None:
+        """Fetch the Remi device state if it changed after ``updated_since``."""
+        data = await self._request(
+            "POST", "/parse/classes/Remi", self._remi_query(keys, updated_since)
+        )
+        results = data.get("results", [])
+        return results[0] if results else None
+
+    def _remi_query(
+        self, keys: Iterable[str] | None = None, updated_since: str | None = None
+    ) -> dict[str, Any]:
+        where: dict[str, Any] = {"objectId": self._remi_id}
+        if updated_since:
+            where["updatedAt"] = _updated_after(updated_since)
+        payload: dict[str, Any] = {"limit": "1", "where": where, "_method": "GET"}
+        if keys:
+            payload["keys"] = ",".join(keys)
+        return payload
+
     async def update_remi(self, fields: dict[str, Any]) -> dict[str, Any]:
         """Update Remi device fields via PUT."""
-        return await self._request(
-            "PUT",
-            f"/parse/classes/Remi/{self._remi_id}",
-            fields,
-        )
+        return await self._execute(self._update_remi_operation(fields))
 
     async def get_faces(self) -> list[dict[str, Any]]:
         """Fetch all available clock faces."""
@@ -152,47 +749,243 @@ class RemiApiClient:
             "POST",
             "/parse/classes/Face",
             {"order": "index", "_method": "GET"},
+            hedge=True,
         )
         return data.get("results", [])
 
     async def get_config(self) -> dict[str, Any]:
         """Fetch server config (used for firmware update version)."""
-        return await self._request("GET", "/parse/config")
+        return await self._request("GET", "/parse/config", hedge=True)
+
+    async def get_events(
+        self,
+        keys: Iterable[str] | None = None,
+        updated_since: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Fetch alarms/events for this Remi.
 
-    async def get_events(self) -> list[dict[str, Any]]:
-        """Fetch all alarms/events for this Remi."""
+        Results can be limited to the given fields and, with ``updated_since``,
+        to events changed after that ISO timestamp.
+        """
+        return [event async for event in self.iter_events(keys, updated_since)]
+
+    def iter_events(
+        self,
+        keys: Iterable[str] | None = None,
+        updated_since: str | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield alarms/events for this Remi, fetching them a page at a time."""
+        where = self._events_where()
+        if updated_since:
+            where["updatedAt"] = _updated_after(updated_since)
+        return self._iter_objects("/parse/classes/Event", where, keys)
+
+    async def _iter_objects(
+        self, path: str, where: dict[str, Any], keys: Iterable[str] | None = None
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield the objects matching ``where``, one page per request.
+
+        Pages are ordered by objectId and each one starts after the last
+        objectId seen, so objects created or deleted meanwhile do not shift
+        later pages the way ``skip`` would.
+        """
+        payload: dict[str, Any] = {
+            "where": where,
+            "order": "objectId",
+            "limit": QUERY_PAGE_SIZE,
+            "_method": "GET",
+        }
+        if keys:
+            payload["keys"] = ",".join(keys)
+        while True:
+            data = await self._request("POST", path, payload, hedge=True)
+            results = data.get("results", [])
+            for obj in results:
+                yield obj
+            if len(results) < QUERY_PAGE_SIZE:
+                return
+            after = {"$gt": results[-1]["objectId"]}
+            payload = {**payload, "where": {**where, "objectId": after}}
+
+    async def count_events(self) -> int:
+        """Return the number of alarms/events for this Remi without fetching them."""
         data = await self._request(
             "POST",
             "/parse/classes/Event",
             {
-                "where": {
-                    "remi": {
-                        "__type": "Pointer",
-                        "className": "Remi",
-                        "objectId": self._remi_id,
-                    }
-                },
+                "where": self._events_where(),
+                "count": 1,
+                "limit": 0,
                 "_method": "GET",
             },
         )
-        return data.get("results", [])
+        return data.get("count", 0)
+
+    def _events_where(self) -> dict[str, Any]:
+        return {"remi": _remi_pointer(self._remi_id)}
+
+    async def get_remis(
+        self, remi_ids: Iterable[str], keys: Iterable[str] | None = None
+    ) -> dict[str, dict[str, Any]]:
+        """Fetch several Remi devices of the account in one query, by objectId."""
+        remi_ids = list(remi_ids)
+        payload: dict[str, Any] = {
+            "where": {"objectId": {"$in": remi_ids}},
+            "limit": len(remi_ids),
+            "_method": "GET",
+        }
+        if keys:
+            payload["keys"] = ",".join(keys)
+        data = await self._request("POST", "/parse/classes/Remi", payload, hedge=True)
+        return {remi["objectId"]: remi for remi in data.get("results", [])}
+
+    async def get_events_by_remi(
+        self, remi_ids: Iterable[str], keys: Iterable[str] | None = None
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Fetch the alarms/events of several Remi devices with shared queries.
+
+        Events are grouped by the objectId of the Remi they belong to.
+        """
+        remi_ids = list(remi_ids)
+        where = {"remi": {"$in": [_remi_pointer(remi_id) for remi_id in remi_ids]}}
+        events: dict[str, list[dict[str, Any]]] = {remi_id: [] for remi_id in remi_ids}
+        async for event in self._iter_objects(
+            "/parse/classes/Event", where, sorted({*keys, "remi"}) if keys else None
+        ):
+            remi_id = (event.get("remi") or {}).get("objectId")
+            if remi_id in events:
+                events[remi_id].append(event)
+        return events
 
     async def create_event(self, event_data: dict[str, Any]) -> dict[str, Any]:
         """Create a new alarm event."""
-        payload = {
-            **event_data,
-            "remi": {
-                "__type": "Pointer",
-                "className": "Remi",
-                "objectId": self._remi_id,
-            },
-        }
-        return await self._request("POST", "/parse/classes/Event", payload)
+        return await self._execute(self._create_event_operation(event_data))
 
     async def update_event(self, event_id: str, fields: dict[str, Any]) -> dict[str, Any]:
         """Update an existing alarm event."""
-        return await self._request("PUT", f"/parse/classes/Event/{event_id}", fields)
+        return await self._execute(self._update_event_operation(event_id, fields))
 
     async def delete_event(self, event_id: str) -> None:
         """Delete an alarm event."""
-        await self._request("DELETE", f"/parse/classes/Event/{event_id}")
+        await self._execute(self._delete_event_operation(event_id))
+
+    def batch(self) -> RemiBatch:
+        """Return a new batch that groups write operations into one request."""
+        return RemiBatch(self)
+
+    def _update_remi_operation(self, fields: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "method": "PUT",
+            "path": f"/parse/classes/Remi/{self._remi_id}",
+            "body": fields,
+        }
+
+    def _create_event_operation(self, event_data: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "method": "POST",
+            "path": "/parse/classes/Event",
+            "body": {**event_data, "remi": _remi_pointer(self._remi_id)},
+        }
+
+    def _update_event_operation(self, event_id: str, fields: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "method": "PUT",
+            "path": f"/parse/classes/Event/{event_id}",
+            "body": fields,
+        }
+
+    def _delete_event_operation(self, event_id: str) -> dict[str, Any]:
+        return {"method": "DELETE", "path": f"/parse/classes/Event/{event_id}"}
+
+    async def _execute(self, operation: dict[str, Any]) -> Any:
+        """Send a single batch-style operation as a regular request."""
+        return await self._request(
+            operation["method"], operation["path"], operation.get("body")
+        )
+
+    async def _send_batch(self, operations: list[dict[str, Any]]) -> list[Any]:
+        """Send operations via /parse/batch, chunked to the server limit."""
+        responses: list[dict[str, Any]] = []
+        for start in range(0, len(operations), PARSE_BATCH_MAX_OPERATIONS):
+            chunk = operations[start:start + PARSE_BATCH_MAX_OPERATIONS]
+            responses.extend(
+                await self._request("POST", "/parse/batch", {"requests": chunk})
+            )
+
+        results: list[Any] = []
+        failures: list[str] = []
+        for operation, response in zip(operations, responses):
+            if "error" in response:
+                error = response["error"]
+                if isinstance(error, dict):
+                    error = error.get("error", error)
+                message = f"{operation['method']} {operation['path']} failed: {error}"
+                failures.append(message)
+                results.append(RemiApiError(message))
+            else:
+                results.append(response.get("success", {}))
+        if failures:
+            raise RemiBatchError(
+                f"{len(failures)} of {len(operations)} batch operations failed: "
+                + "; ".join(failures),
+                results,
+            )
+        return results
+
+
+def _is_idempotent(method: str, payload: dict[str, Any] | None) -> bool:
+    """Return whether a request only reads data and is safe to repeat."""
+    # Parse queries are POSTed with a "_method": "GET" override.
+    return method == "GET" or (payload is not None and payload.get("_method") == "GET")
+
+
+@lru_cache(maxsize=256)
+def _url(path: str) -> str:
+    """Return the absolute URL of an API path."""
+    return f"{API_BASE_URL}{path}"
+
+
+@lru_cache(maxsize=256)
+def _endpoint(method: str, path: str) -> str:
+    """Return an endpoint key for ``path`` with any objectId collapsed."""
+    parts = path.split("/")
+    # /parse/classes/<Class>/<objectId>
+    if len(parts) == 5 and parts[2] == "classes":
+        parts[4] = ":id"
+    return f"{method} {'/'.join(parts)}"
+
+
+def _retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header given in seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _parse_error_code(body: bytes) -> int | None:
+    """Return the Parse error code of an error response body, if it has one."""
+    try:
+        data = json_loads(body)
+    except ValueError:
+        return None
+    return data.get("code") if isinstance(data, dict) else None
+
+
+def _remi_pointer(remi_id: str | None) -> dict[str, Any]:
+    """Return a Parse pointer to a Remi device."""
+    return {"__type": "Pointer", "className": "Remi", "objectId": remi_id}
+
+
+def _updated_after(timestamp: str) -> dict[str, Any]:
+    """Return a Parse constraint matching objects updated after ``timestamp``."""
+    return {"$gt": {"__type": "Date", "iso": timestamp}}
@@ -22,6 +22,7 @@ from .entity import RemiEntity
 class RemiBinarySensorEntityDescription(BinarySensorEntityDescription):
     """Describes a Remi binary sensor entity."""
 
+    fields: tuple[str, ...] = ()
     value_fn: Any = None
 
 
@@ -31,6 +32,7 @@ BINARY_SENSOR_DESCRIPTIONS: tuple[RemiBinarySensorEntityDescription, ...] = (
         translation_key="online",
         name="Online",
         device_class=BinarySensorDeviceClass.CONNECTIVITY,
+        fields=("online",),
         value_fn=lambda remi: remi.get("online", False),
     ),
     RemiBinarySensorEntityDescription(
@@ -39,6 +41,7 @@ BINARY_SENSOR_DESCRIPTIONS: tuple[RemiBinarySensorEntityDescription, ...] = (
         name="Alive",
         device_class=BinarySensorDeviceClass.RUNNING,
         entity_registry_enabled_default=False,
+        fields=("alive",),
         value_fn=lambda remi: remi.get("alive", False),
     ),
     RemiBinarySensorEntityDescription(
@@ -46,6 +49,7 @@ BINARY_SENSOR_DESCRIPTIONS: tuple[RemiBinarySensorEntityDescription, ...] = (
         translation_key="firmware_update",
         name="Firmware Update Available",
         device_class=BinarySensorDeviceClass.UPDATE,
+        fields=("current_firmware_version",),
         value_fn=lambda remi, latest: (
             latest is not None
             and remi.get("current_firmware_version", 0) < latest
@@ -79,6 +83,7 @@ class RemiBinarySensorEntity(RemiEntity, BinarySensorEntity):
     ) -> None:
         super().__init__(coordinator)
         self.entity_description = description
+        self._remi_fields = description.fields
         self._attr_unique_id = f"{self._remi_id}_{description.key}"
 
     @property
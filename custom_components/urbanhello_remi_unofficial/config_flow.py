@@ -8,12 +8,35 @@ import uuid
 import aiohttp
 import voluptuous as vol
 
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+)
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api import RemiApiClient, RemiAuthError, RemiApiError
-from .const import CONF_INSTALLATION_ID, CONF_REMI_ID, CONF_SESSION_TOKEN, DOMAIN
+from .const import (
+    CONF_ADAPTIVE_TIMEOUTS,
+    CONF_ALARM_POLLING,
+    CONF_CONDITIONAL_POLLING,
+    CONF_DEDICATED_CONNECTION,
+    CONF_HEDGED_READS,
+    CONF_HOURLY_REQUEST_BUDGET,
+    CONF_LIVE_QUERY,
+    CONF_OFFLINE_WRITE_QUEUE,
+    CONF_INSTALLATION_ID,
+    CONF_REMI_ID,
+    CONF_REQUESTS_PER_MINUTE,
+    CONF_SESSION_TOKEN,
+    CONF_VALIDATE_SESSION,
+    DOMAIN,
+    HOURLY_REQUEST_BUDGET,
+    RATE_LIMIT_REQUESTS_PER_MINUTE,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,6 +47,25 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
     }
 )
 
+OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_CONDITIONAL_POLLING, default=False): bool,
+        vol.Optional(CONF_VALIDATE_SESSION, default=True): bool,
+        vol.Optional(CONF_ADAPTIVE_TIMEOUTS, default=False): bool,
+        vol.Optional(CONF_HEDGED_READS, default=False): bool,
+        vol.Optional(CONF_DEDICATED_CONNECTION, default=False): bool,
+        vol.Optional(CONF_LIVE_QUERY, default=False): bool,
+        vol.Optional(CONF_OFFLINE_WRITE_QUEUE, default=False): bool,
+        vol.Optional(CONF_ALARM_POLLING, default=False): bool,
+        vol.Optional(
+            CONF_REQUESTS_PER_MINUTE, default=RATE_LIMIT_REQUESTS_PER_MINUTE
+        ): vol.All(vol.Coerce(int), vol.Range(min=1, max=600)),
+        vol.Optional(
+            CONF_HOURLY_REQUEST_BUDGET, default=HOURLY_REQUEST_BUDGET
+        ): vol.All(vol.Coerce(int), vol.Range(min=60, max=36000)),
+    }
+)
+
 
 class RemiConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for UrbanHello Remi."""
@@ -38,6 +80,12 @@ class RemiConfigFlow(ConfigFlow, domain=DOMAIN):
         self._installation_id: str = ""
         self._all_remi_ids: list[str] = []
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> RemiOptionsFlow:
+        """Return the options flow for this handler."""
+        return RemiOptionsFlow()
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -113,3 +161,21 @@ class RemiConfigFlow(ConfigFlow, domain=DOMAIN):
                 CONF_INSTALLATION_ID: self._installation_id,
             },
         )
+
+
+class RemiOptionsFlow(OptionsFlow):
+    """Handle Remi options."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the polling and transport options."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=self.add_suggested_values_to_schema(
+                OPTIONS_SCHEMA, self.config_entry.options
+            ),
+        )
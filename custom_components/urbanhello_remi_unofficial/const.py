@@ -12,9 +12,148 @@ API_USER_AGENT = "Remi/13433 CFNetwork/1206 Darwin/20.1.0"
 
 SCAN_INTERVAL_SECONDS = 60
 
+# Adaptive polling: fast polls for a burst after activity, doubling
+# intervals while the device is offline or idle, up to a ceiling.
+ADAPTIVE_POLL_FAST_SECONDS = 10
+ADAPTIVE_POLL_BURST_SECONDS = 120
+ADAPTIVE_POLL_IDLE_AFTER_SECONDS = 1800
+ADAPTIVE_POLL_MAX_SECONDS = 900
+# Remi fields whose changes count as activity. Sensor telemetry (temp,
+# luminosity, rssi) and updatedAt drift on every device report and must not
+# keep polling fast. Any change to an alarm event counts as activity too.
+ADAPTIVE_POLL_ACTIVITY_FIELDS = (
+    "name",
+    "face",
+    "lightnight",
+    "background_color",
+    "volume",
+    "noise_notification_threshold",
+    "hourFormat24",
+    "musicMode",
+)
+
+# Alarm-proximity polling: fast polls from shortly before an alarm until a
+# while after it ends, slow polls the rest of the time.
+ALARM_WINDOW_LEAD_SECONDS = 300
+ALARM_WINDOW_TRAIL_SECONDS = 900
+ALARM_WINDOW_POLL_SECONDS = 10
+ALARM_IDLE_POLL_SECONDS = 300
+
+# Writes are applied to the cached state from the server's response and
+# confirmed by one poll shortly afterwards.
+WRITE_RECONCILE_DELAY_SECONDS = 5
+
+# Refresh tiers: device state is polled on every tick, alarms less often
+# and clock faces and server config (firmware version) rarely.
+EVENTS_POLL_SECONDS = 300
+STATIC_POLL_SECONDS = 6 * 3600
+
+# Dedicated connection pool: connections are kept alive across polls and
+# re-opened shortly before polls that come after the keep-alive expired.
+CONNECTION_POOL_LIMIT = 4
+DNS_CACHE_TTL_SECONDS = 300
+KEEPALIVE_MARGIN_SECONDS = 15
+CONNECTION_KEEPALIVE_SECONDS = SCAN_INTERVAL_SECONDS + KEEPALIVE_MARGIN_SECONDS
+# Polls within the keep-alive reuse the open connection, so only longer
+# intervals are pre-warmed.
+PREWARM_LEAD_SECONDS = 3
+
+# Window during which slider writes are merged into a single PUT.
+WRITE_COALESCE_SECONDS = 0.5
+
+# Writes queued while the cloud is unreachable are persisted after this delay.
+WRITE_QUEUE_STORAGE_VERSION = 1
+WRITE_QUEUE_SAVE_DELAY_SECONDS = 1
+
+# Exponential backoff applied to re-authentication after failed logins.
+LOGIN_BACKOFF_BASE_SECONDS = 5
+LOGIN_BACKOFF_MAX_SECONDS = 900
+
+# Parse error code of a login with a wrong username or password (HTTP 404).
+PARSE_ERROR_INVALID_LOGIN = 101
+# Parse error code of a revoked or expired session token (HTTP 400 or 403).
+PARSE_ERROR_INVALID_SESSION_TOKEN = 209
+
+# Delay before a refreshed session token is written back to the config entry.
+SESSION_TOKEN_SAVE_DELAY_SECONDS = 10
+
+# Request deadlines. Reads get a per-attempt timeout and an overall deadline
+# covering their retries; writes are single attempts.
+LOGIN_TIMEOUT_SECONDS = 15
+READ_TIMEOUT_SECONDS = 10
+READ_DEADLINE_SECONDS = 30
+WRITE_TIMEOUT_SECONDS = 15
+
+# Adaptive read timeouts derived from observed latencies per endpoint.
+LATENCY_SAMPLE_SIZE = 50
+LATENCY_MIN_SAMPLES = 10
+LATENCY_EWMA_ALPHA = 0.2
+ADAPTIVE_TIMEOUT_FACTOR = 3
+ADAPTIVE_TIMEOUT_MIN_SECONDS = 2
+
+# Hedged reads: a duplicate request is sent once a read outlasts its p95
+# latency, at most this many times per minute.
+HEDGE_MAX_PER_MINUTE = 6
+
+# Retries of idempotent reads after transient or server errors.
+REQUEST_MAX_RETRIES = 2
+RETRY_BACKOFF_BASE_SECONDS = 0.5
+RETRY_BACKOFF_MAX_SECONDS = 5
+
+# Client-side rate limiting per account: a token bucket, a rolling hourly
+# request budget, and the pause applied to a 429 without Retry-After. Polls
+# slow down by the given factor once the budget falls below the fraction.
+RATE_LIMIT_REQUESTS_PER_MINUTE = 30
+RATE_LIMIT_BURST = 10
+HOURLY_REQUEST_BUDGET = 1200
+BUDGET_LOW_FRACTION = 0.2
+BUDGET_LOW_POLL_FACTOR = 4
+RATE_LIMIT_DEFAULT_RETRY_SECONDS = 60
+
+# Requests in flight to the API host, shared by every config entry.
+HOST_MAX_CONCURRENT_REQUESTS = 4
+
+# Consecutive failures that open the per-host circuit, and the probe delay.
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_RECOVERY_SECONDS = 60
+
+# Parse LiveQuery push updates. While subscribed, polling slows down to a
+# consistency check.
+LIVEQUERY_URL = "wss://remi2.urbanhello.com"
+LIVEQUERY_HANDSHAKE_TIMEOUT_SECONDS = 15
+LIVEQUERY_HEARTBEAT_SECONDS = 30
+LIVEQUERY_BACKOFF_BASE_SECONDS = 2
+LIVEQUERY_BACKOFF_MAX_SECONDS = 300
+LIVEQUERY_FALLBACK_POLL_SECONDS = 900
+
+# Event queries are paged so large alarm sets are neither truncated by the
+# Parse default limit nor held in one response.
+QUERY_PAGE_SIZE = 100
+
+# Distinct read queries whose last response body is fingerprinted.
+RESPONSE_FINGERPRINT_CACHE_SIZE = 32
+
+# Parse Server rejects batches with more operations than this.
+PARSE_BATCH_MAX_OPERATIONS = 50
+
+# hass.data key holding the shared fetchers of accounts with several devices.
+DATA_ACCOUNT_FETCHERS = f"{DOMAIN}_accounts"
+# hass.data key holding each account's dedicated session and the entries using it.
+DATA_DEDICATED_SESSIONS = f"{DOMAIN}_sessions"
+
 CONF_REMI_ID = "remi_id"
 CONF_SESSION_TOKEN = "session_token"
 CONF_INSTALLATION_ID = "installation_id"
+CONF_CONDITIONAL_POLLING = "conditional_polling"
+CONF_VALIDATE_SESSION = "validate_session"
+CONF_ADAPTIVE_TIMEOUTS = "adaptive_timeouts"
+CONF_HEDGED_READS = "hedged_reads"
+CONF_DEDICATED_CONNECTION = "dedicated_connection"
+CONF_LIVE_QUERY = "live_query"
+CONF_REQUESTS_PER_MINUTE = "requests_per_minute"
+CONF_HOURLY_REQUEST_BUDGET = "hourly_request_budget"
+CONF_OFFLINE_WRITE_QUEUE = "offline_write_queue"
+CONF_ALARM_POLLING = "alarm_polling"
 
 FACE_DEFINE_TO_NAME = {
     "FACE_OFF": "Off",
@@ -1,52 +1,564 @@
 """DataUpdateCoordinator for the UrbanHello Remi integration."""
 from __future__ import annotations
 
+import asyncio
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass
 import logging
 from datetime import timedelta
 from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
-from .api import RemiApiClient, RemiApiError
-from .const import DOMAIN, SCAN_INTERVAL_SECONDS
+from .api import (
+    RemiApiClient,
+    RemiApiError,
+    RemiBatchError,
+    RemiClientError,
+    RemiRateLimitError,
+    RemiServerError,
+    RemiSupersededError,
+    RemiTransientError,
+)
+from .const import (
+    ADAPTIVE_POLL_ACTIVITY_FIELDS,
+    BUDGET_LOW_POLL_FACTOR,
+    CONNECTION_KEEPALIVE_SECONDS,
+    DOMAIN,
+    EVENTS_POLL_SECONDS,
+    LIVEQUERY_FALLBACK_POLL_SECONDS,
+    PREWARM_LEAD_SECONDS,
+    SCAN_INTERVAL_SECONDS,
+    STATIC_POLL_SECONDS,
+    WRITE_COALESCE_SECONDS,
+    WRITE_RECONCILE_DELAY_SECONDS,
+)
+from .polling import AdaptivePollPolicy, AlarmProximityPolicy, PollTier
+from .write_queue import RemiWriteQueue
 
 _LOGGER = logging.getLogger(__name__)
 
+_MISSING = object()
+
+
+@dataclass(frozen=True, slots=True)
+class RemiDataChanges:
+    """Remi fields and events that changed since listeners were last notified.
+
+    ``everything`` is set when entities cannot tell from the data alone,
+    e.g. after static data changed or the coordinator became (un)available.
+    """
+
+    remi_fields: frozenset[str] = frozenset()
+    event_ids: frozenset[str] = frozenset()
+    everything: bool = False
+
+    def affects(self, remi_fields: Iterable[str], event_ids: Iterable[str] = ()) -> bool:
+        """Return whether any of the given fields or events changed."""
+        return (
+            self.everything
+            or not self.remi_fields.isdisjoint(remi_fields)
+            or not self.event_ids.isdisjoint(event_ids)
+        )
+
+
+ALL_CHANGED = RemiDataChanges(everything=True)
+
 
 class RemiDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Coordinator that polls the Remi API and stores all device data."""
 
-    def __init__(self, hass: HomeAssistant, client: RemiApiClient) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: RemiApiClient,
+        write_coalesce_window: float = WRITE_COALESCE_SECONDS,
+        conditional_polling: bool = False,
+        prewarm: bool = False,
+        account_fetcher: RemiAccountFetcher | None = None,
+        write_queue: RemiWriteQueue | None = None,
+        alarm_polling: bool = False,
+    ) -> None:
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=SCAN_INTERVAL_SECONDS),
+            # Unchanged responses decode to the same objects, so comparing
+            # polls is cheap and idle devices cause no state writes.
+            always_update=False,
         )
         self.client = client
         self.faces: list[dict[str, Any]] = []
         self.config_params: dict[str, Any] = {}
+        self._write_coalesce_window = write_coalesce_window
+        self._pending_remi_fields: dict[str, Any] = {}
+        self._remi_write_task: asyncio.Task[None] | None = None
+        self._remi_field_refs: Counter[str] = Counter()
+        self._event_field_refs: Counter[str] = Counter()
+        self._conditional_polling = conditional_polling
+        self._synced_keys: tuple[list[str] | None, list[str] | None] | None = None
+        self._prewarm = prewarm
+        self._unsub_prewarm: CALLBACK_TYPE | None = None
+        self._account_fetcher = account_fetcher
+        self._push_connected = False
+        self._write_queue = write_queue
+        self._poll_policy = AdaptivePollPolicy()
+        self._alarm_policy = AlarmProximityPolicy() if alarm_polling else None
+        self._event_tier = PollTier(EVENTS_POLL_SECONDS)
+        self._unsub_static_refresh: CALLBACK_TYPE | None = None
+        self._unsub_reconcile: CALLBACK_TYPE | None = None
+        self.changes = ALL_CHANGED
+        self._notified_data: dict[str, Any] | None = None
+        self._notified_success: bool | None = None
+        self._notify_all = False
 
     async def _async_update_data(self) -> dict[str, Any]:
-        """Fetch latest data from the Remi API."""
+        """Fetch latest data from the Remi API.
+
+        Polls are scheduled behind interactive requests. A poll whose queued
+        request was replaced by a newer poll keeps the current data, and so
+        does a poll held back by the rate limits or the hourly budget, which
+        waits until they allow requests again. Writes queued while the cloud
+        was unreachable are replayed first.
+        """
+        if self._write_queue is not None and len(self._write_queue):
+            try:
+                await self._async_flush_writes(self._write_queue)
+            except (RemiBatchError, RemiClientError) as err:
+                _LOGGER.warning("Dropped queued Remi updates the server rejected: %s", err)
+            except RemiApiError as err:
+                _LOGGER.debug("Kept queued Remi updates to send later: %s", err)
+        events = self.events
+        retry_after = 0.0
         try:
-            remi, events = await _gather(
-                self.client.get_remi(),
-                self.client.get_events(),
-            )
-            return {"remi": remi, "events": events}
+            with self.client.background_requests(supersede=True):
+                data = await self._async_fetch()
+        except RemiSupersededError as err:
+            if self.data is None:
+                raise UpdateFailed(f"Error communicating with Remi API: {err}") from err
+            return self.data
+        except RemiRateLimitError as err:
+            if self.data is None:
+                raise UpdateFailed(f"Error communicating with Remi API: {err}") from err
+            _LOGGER.debug("Deferring Remi poll for %.0fs: %s", err.retry_after, err)
+            retry_after = err.retry_after
+            return self.data
         except RemiApiError as err:
             raise UpdateFailed(f"Error communicating with Remi API: {err}") from err
+        else:
+            self._poll_policy.record_poll(
+                changed=self.data is not None and _user_facing_change(self.data, data),
+                online=data["remi"].get("online", True) is not False,
+            )
+            events = data["events"]
+            return data
+        finally:
+            self._async_update_poll_interval(events, retry_after)
+            self._async_schedule_prewarm()
+
+    async def _async_fetch(self) -> dict[str, Any]:
+        """Fetch the device and, when their tier is due, its events.
+
+        Queries are shared with the other devices of the account when
+        possible.
+        """
+        if self._account_fetcher is not None and self._account_fetcher.shared:
+            return await self._account_fetcher.async_fetch(self)
+        keys = (self.remi_keys, self.event_keys)
+        synced = bool(self.data) and self._synced_keys == keys
+        if self._conditional_polling and synced:
+            return await self._async_fetch_changes()
+        if synced and not self._event_tier.due:
+            return {**self.data, "remi": await self.client.get_remi(self.remi_keys)}
+        remi, events = await _gather(
+            self.client.get_remi(self.remi_keys),
+            self.client.get_events(self.event_keys),
+        )
+        self._synced_keys = keys
+        self._event_tier.mark_refreshed()
+        return {"remi": remi, "events": events}
+
+    @callback
+    def async_expire_events(self) -> None:
+        """Fetch the events on the next poll, e.g. after changing one."""
+        self._event_tier.expire()
+        if self._account_fetcher is not None:
+            self._account_fetcher.async_expire_events()
+
+    @callback
+    def async_record_activity(self) -> None:
+        """Poll fast for a while, e.g. after a write."""
+        self._poll_policy.record_activity()
+        self._async_update_poll_interval()
+
+    @callback
+    def _async_update_poll_interval(
+        self, events: list[dict[str, Any]] | None = None, retry_after: float = 0.0
+    ) -> None:
+        """Adapt the poll interval to device activity.
+
+        Polls are slow while changes are pushed, follow the schedule of
+        ``events`` (the cached alarms by default) when enabled, and are
+        stretched while the request budget runs low. The next poll waits at
+        least ``retry_after`` seconds, for a rate limit to lift.
+        """
+        if self._push_connected:
+            seconds = LIVEQUERY_FALLBACK_POLL_SECONDS
+        else:
+            seconds = self._poll_policy.interval
+            if self._alarm_policy is not None and not self._poll_policy.bursting:
+                seconds = self._alarm_policy.interval(
+                    seconds, self.events if events is None else events, dt_util.now()
+                )
+        if self.client.budget_low:
+            seconds *= BUDGET_LOW_POLL_FACTOR
+        seconds = max(seconds, retry_after)
+        self.update_interval = timedelta(seconds=seconds)
+
+    @callback
+    def _async_schedule_prewarm(self) -> None:
+        """Warm up the connection shortly before the next scheduled poll.
+
+        Only polls after the pooled connection's keep-alive has expired need
+        a new connection, so shorter intervals are not pre-warmed. Neither
+        are polls while the request budget runs low.
+        """
+        if self._unsub_prewarm is not None:
+            self._unsub_prewarm()
+            self._unsub_prewarm = None
+        if (
+            not self._prewarm
+            or self.update_interval is None
+            or self.update_interval.total_seconds() <= CONNECTION_KEEPALIVE_SECONDS
+            or self.client.budget_low
+        ):
+            return
+        self._unsub_prewarm = async_call_later(
+            self.hass,
+            max(0, self.update_interval.total_seconds() - PREWARM_LEAD_SECONDS),
+            self._async_prewarm,
+        )
+
+    async def _async_prewarm(self, _now: Any) -> None:
+        """Open a connection so the poll does not pay for DNS and TLS."""
+        self._unsub_prewarm = None
+        try:
+            with self.client.background_requests():
+                await self.client.warm_up()
+        except RemiApiError as err:
+            _LOGGER.debug("Could not pre-warm the Remi connection: %s", err)
+
+    async def async_shutdown(self) -> None:
+        """Cancel the scheduled pre-warm along with the polls."""
+        await super().async_shutdown()
+        if self._unsub_static_refresh is not None:
+            self._unsub_static_refresh()
+            self._unsub_static_refresh = None
+        if self._unsub_reconcile is not None:
+            self._unsub_reconcile()
+            self._unsub_reconcile = None
+        if self._unsub_prewarm is not None:
+            self._unsub_prewarm()
+            self._unsub_prewarm = None
+
+    async def _async_fetch_changes(self) -> dict[str, Any]:
+        """Fetch only objects updated since the last poll and merge them.
+
+        Deleted events are detected by comparing a count query with the
+        number of cached events, which triggers a full event fetch. Events
+        are only checked when their tier is due.
+        """
+        if not self._event_tier.due:
+            remi_changes = await self.client.get_remi_changes(
+                self.remi.get("updatedAt", ""), self.remi_keys
+            )
+            if remi_changes is None:
+                return self.data
+            return {**self.data, "remi": {**self.remi, **remi_changes}}
+        events_by_id = {event.get("objectId"): event for event in self.events}
+        remi_changes, event_changes, event_count = await _gather(
+            self.client.get_remi_changes(
+                self.remi.get("updatedAt", ""), self.remi_keys
+            ),
+            self._async_merge_event_changes(events_by_id),
+            self.client.count_events(),
+        )
+        if remi_changes is None and not event_changes and event_count == len(self.events):
+            self._event_tier.mark_refreshed()
+            return self.data
+
+        remi = {**self.remi, **remi_changes} if remi_changes else self.remi
+        events = list(events_by_id.values())
+        if event_count != len(events):
+            events = await self.client.get_events(self.event_keys)
+        self._event_tier.mark_refreshed()
+        return {"remi": remi, "events": events}
+
+    async def _async_merge_event_changes(
+        self, events_by_id: dict[str, dict[str, Any]]
+    ) -> int:
+        """Merge events changed since the last poll as their pages arrive.
+
+        Returns the number of changed events.
+        """
+        changed = 0
+        async for event in self.client.iter_events(
+            self.event_keys, updated_since=_latest_update(self.events)
+        ):
+            event_id = event.get("objectId")
+            events_by_id[event_id] = {**events_by_id.get(event_id, {}), **event}
+            changed += 1
+        return changed
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify listeners, recording which fields and events changed."""
+        self.changes = self._async_diff()
+        self._notified_data = self.data
+        self._notified_success = self.last_update_success
+        self._notify_all = False
+        super().async_update_listeners()
+
+    @callback
+    def _async_diff(self) -> RemiDataChanges:
+        """Compare the data with what listeners were last notified of."""
+        old, new = self._notified_data, self.data
+        if (
+            self._notify_all
+            or old is None
+            or new is None
+            or self.last_update_success != self._notified_success
+        ):
+            return ALL_CHANGED
+        old_remi, new_remi = old.get("remi", {}), new.get("remi", {})
+        remi_fields = frozenset(
+            key
+            for key in old_remi.keys() | new_remi.keys()
+            if old_remi.get(key, _MISSING) != new_remi.get(key, _MISSING)
+        )
+        old_events = {event.get("objectId"): event for event in old.get("events", [])}
+        new_events = {event.get("objectId"): event for event in new.get("events", [])}
+        event_ids = frozenset(
+            event_id
+            for event_id in old_events.keys() | new_events.keys()
+            if old_events.get(event_id) != new_events.get(event_id)
+        )
+        return RemiDataChanges(remi_fields, event_ids)
+
+    @callback
+    def async_apply_push(
+        self, op: str, class_name: str, obj: dict[str, Any]
+    ) -> None:
+        """Apply a change pushed over LiveQuery to the cached data."""
+        self._async_apply_change(op, class_name, obj)
+
+    @callback
+    def async_apply_write(
+        self, op: str, class_name: str, obj: dict[str, Any], response: Any = None
+    ) -> None:
+        """Apply a successful write to the cached data and confirm it later.
+
+        ``obj`` holds the written fields and ``response`` the server's
+        answer, whose ``objectId`` and timestamps are kept. Listeners are
+        notified right away and one poll follows shortly to reconcile.
+        """
+        if isinstance(response, dict):
+            obj = {**obj, **_write_metadata(response)}
+        self._async_apply_change(op, class_name, obj)
+        self._async_schedule_reconcile()
+
+    @callback
+    def _async_schedule_reconcile(self) -> None:
+        """Poll once shortly after writes, replacing a pending reconcile."""
+        if self._unsub_reconcile is not None:
+            self._unsub_reconcile()
+
+        @callback
+        def _async_reconcile(_now: Any) -> None:
+            self._unsub_reconcile = None
+            # A patched updatedAt could hide changes made just before the
+            # write from an updatedAt query, so reconcile with a full fetch.
+            self._synced_keys = None
+            self.hass.async_create_task(self.async_request_refresh())
+
+        self._unsub_reconcile = async_call_later(
+            self.hass, WRITE_RECONCILE_DELAY_SECONDS, _async_reconcile
+        )
+
+    @callback
+    def _async_apply_change(self, op: str, class_name: str, obj: dict[str, Any]) -> None:
+        """Merge a created, updated or deleted object into the cached data."""
+        if self.data is None:
+            return
+        upsert = op in ("create", "enter", "update")
+        if class_name == "Remi":
+            if not upsert:
+                return
+            data = {**self.data, "remi": {**self.remi, **obj}}
+        elif class_name == "Event":
+            events_by_id = {event.get("objectId"): event for event in self.events}
+            event_id = obj.get("objectId")
+            if upsert:
+                events_by_id[event_id] = {**events_by_id.get(event_id, {}), **obj}
+            else:
+                events_by_id.pop(event_id, None)
+            data = {**self.data, "events": list(events_by_id.values())}
+        else:
+            return
+        self.async_set_updated_data(data)
+
+    @callback
+    def async_set_push_connected(self, connected: bool) -> None:
+        """Poll slowly while LiveQuery pushes changes, normally otherwise.
+
+        Changes made while disconnected were missed, so a refresh is
+        requested whenever the subscriptions come back.
+        """
+        self._push_connected = connected
+        self._async_update_poll_interval()
+        if connected:
+            self.async_expire_events()
+            self.hass.async_create_task(self.async_request_refresh())
 
     async def async_setup(self) -> None:
-        """Fetch static data (faces, config) once at setup."""
+        """Fetch static data (faces, config) and keep refreshing it rarely."""
         try:
-            self.faces = await self.client.get_faces()
-            config = await self.client.get_config()
-            self.config_params = config.get("params", {})
+            await self._async_fetch_static()
         except RemiApiError as err:
             _LOGGER.warning("Could not fetch static Remi data: %s", err)
+        self._unsub_static_refresh = async_track_time_interval(
+            self.hass,
+            self._async_refresh_static,
+            timedelta(seconds=STATIC_POLL_SECONDS),
+            cancel_on_shutdown=True,
+        )
+
+    async def _async_refresh_static(self, _now: Any) -> None:
+        """Refresh faces and config, e.g. to notice a new firmware version."""
+        try:
+            with self.client.background_requests():
+                changed = await self._async_fetch_static()
+        except RemiApiError as err:
+            _LOGGER.debug("Could not refresh static Remi data: %s", err)
+            return
+        if changed:
+            self._notify_all = True
+            self.async_update_listeners()
+
+    async def _async_fetch_static(self) -> bool:
+        """Fetch faces and config; return whether either changed."""
+        faces, config = await _gather(self.client.get_faces(), self.client.get_config())
+        config_params = config.get("params", {})
+        changed = faces != self.faces or config_params != self.config_params
+        self.faces = faces
+        self.config_params = config_params
+        return changed
+
+    @callback
+    def async_track_fields(
+        self, remi_fields: Iterable[str], event_fields: Iterable[str] = ()
+    ) -> CALLBACK_TYPE:
+        """Register the fields an entity reads; return a callback to release them.
+
+        Polls only request fields that are tracked by at least one entity, so
+        fields behind disabled entities are not downloaded.
+        """
+        remi_fields = tuple(remi_fields)
+        event_fields = tuple(event_fields)
+        self._remi_field_refs.update(remi_fields)
+        self._event_field_refs.update(event_fields)
+
+        @callback
+        def _async_untrack_fields() -> None:
+            self._remi_field_refs.subtract(remi_fields)
+            self._event_field_refs.subtract(event_fields)
+            self._remi_field_refs = +self._remi_field_refs
+            self._event_field_refs = +self._event_field_refs
+
+        return _async_untrack_fields
+
+    @property
+    def remi_keys(self) -> list[str] | None:
+        """Return the Remi fields to poll, or None to fetch the full object."""
+        return sorted(self._remi_field_refs) or None
+
+    @property
+    def event_keys(self) -> list[str] | None:
+        """Return the Event fields to poll, or None to fetch full objects."""
+        return sorted(self._event_field_refs) or None
+
+    async def async_queue_remi_update(self, fields: dict[str, Any]) -> None:
+        """Merge Remi field updates into one PUT sent after a short window.
+
+        Updates queued within the window are combined (last value wins).
+        Every caller waits for the shared write.
+        """
+        self._pending_remi_fields.update(fields)
+        if self._remi_write_task is None:
+            self._remi_write_task = self.hass.async_create_task(
+                self._async_flush_remi_updates()
+            )
+        await asyncio.shield(self._remi_write_task)
+
+    async def _async_flush_remi_updates(self) -> None:
+        """Send the queued Remi field updates once the window has elapsed."""
+        await asyncio.sleep(self._write_coalesce_window)
+        fields, self._pending_remi_fields = self._pending_remi_fields, {}
+        self._remi_write_task = None
+        await self.async_update_remi(fields)
+
+    async def async_update_remi(self, fields: dict[str, Any]) -> None:
+        """Update Remi device fields, queueing them if the cloud is unreachable.
+
+        Sent fields are applied to the cached state right away.
+        """
+        self.async_record_activity()
+        if self._write_queue is None:
+            response = await self.client.update_remi(fields)
+        else:
+            self._write_queue.queue_remi_update(fields)
+            if not await self._async_flush_writes(self._write_queue):
+                return
+            response = None
+        self.async_apply_write("update", "Remi", fields, response)
+
+    async def async_update_event(self, event_id: str, fields: dict[str, Any]) -> None:
+        """Update alarm event fields, queueing them if the cloud is unreachable.
+
+        Sent fields are applied to the cached event right away.
+        """
+        self.async_record_activity()
+        self.async_expire_events()
+        if self._write_queue is None:
+            response = await self.client.update_event(event_id, fields)
+        else:
+            self._write_queue.queue_event_update(event_id, fields)
+            if not await self._async_flush_writes(self._write_queue):
+                return
+            response = None
+        self.async_apply_write("update", "Event", {**fields, "objectId": event_id}, response)
+
+    async def _async_flush_writes(self, write_queue: RemiWriteQueue) -> bool:
+        """Send queued writes, keeping them queued while the cloud is unreachable.
+
+        Earlier queued updates go out in the same batch as the new one, so
+        they can never overwrite it later. Returns whether they were sent.
+        """
+        try:
+            await write_queue.async_flush()
+        except (RemiTransientError, RemiServerError) as err:
+            _LOGGER.info(
+                "Remi cloud unreachable, %d pending update(s) will be sent later: %s",
+                len(write_queue),
+                err,
+            )
+            return False
+        return True
 
     @property
     def remi(self) -> dict[str, Any]:
@@ -68,6 +580,153 @@ class RemiDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         return self.config_params.get("default_firmware_update_version")
 
 
+class RemiAccountFetcher:
+    """Poll every configured Remi of one account with shared queries.
+
+    One ``$in`` query fetches all devices and one fetches all their events,
+    whichever coordinator asks first. The results are handed to the other
+    coordinators, which resets their poll timers, so the request count does
+    not grow with the number of devices. Events are only fetched when their
+    tier is due.
+    """
+
+    def __init__(self) -> None:
+        self._coordinators: dict[str, RemiDataUpdateCoordinator] = {}
+        self._fetch_task: asyncio.Task[dict[str, dict[str, Any]]] | None = None
+        self._event_tier = PollTier(EVENTS_POLL_SECONDS)
+
+    @property
+    def devices(self) -> list[str]:
+        """Return the objectIds of the registered devices."""
+        return list(self._coordinators)
+
+    @property
+    def shared(self) -> bool:
+        """Return true once more than one device of the account is registered."""
+        return len(self._coordinators) > 1
+
+    @callback
+    def async_register(self, coordinator: RemiDataUpdateCoordinator) -> CALLBACK_TYPE:
+        """Include a device in the shared polls; return a callback to remove it."""
+        remi_id = coordinator.client.remi_id
+        self._coordinators[remi_id] = coordinator
+
+        @callback
+        def _async_unregister() -> None:
+            self._coordinators.pop(remi_id, None)
+
+        return _async_unregister
+
+    @callback
+    def async_expire_events(self) -> None:
+        """Fetch the events of all devices on the next poll."""
+        self._event_tier.expire()
+
+    async def async_fetch(self, requester: RemiDataUpdateCoordinator) -> dict[str, Any]:
+        """Poll all devices once and return the requesting device's data.
+
+        Requests that arrive while a poll is running share its result.
+        """
+        if self._fetch_task is None:
+            self._fetch_task = requester.hass.async_create_task(
+                self._async_fetch_all(requester)
+            )
+        try:
+            results = await asyncio.shield(self._fetch_task)
+        finally:
+            if self._fetch_task is not None and self._fetch_task.done():
+                self._fetch_task = None
+        data = results.get(requester.client.remi_id)
+        if data is None:
+            raise RemiApiError("No Remi device found")
+        return data
+
+    async def _async_fetch_all(
+        self, requester: RemiDataUpdateCoordinator
+    ) -> dict[str, dict[str, Any]]:
+        """Fetch all devices and hand the results to the other coordinators."""
+        client = requester.client
+        coordinators = list(self._coordinators.values())
+        remi_ids = list(self._coordinators)
+        remi_keys = _merge_keys(coordinator.remi_keys for coordinator in coordinators)
+        event_keys = _merge_keys(coordinator.event_keys for coordinator in coordinators)
+        if self._event_tier.due or not all(
+            coordinator.data for coordinator in coordinators
+        ):
+            remis, events = await _gather(
+                client.get_remis(remi_ids, remi_keys),
+                client.get_events_by_remi(remi_ids, event_keys),
+            )
+            self._event_tier.mark_refreshed()
+        else:
+            remis = await client.get_remis(remi_ids, remi_keys)
+            events = {
+                remi_id: coordinator.events
+                for remi_id, coordinator in self._coordinators.items()
+            }
+        results = {
+            remi_id: {"remi": remi, "events": events.get(remi_id, [])}
+            for remi_id, remi in remis.items()
+        }
+        for remi_id, coordinator in self._coordinators.items():
+            if (
+                coordinator is not requester
+                and remi_id in results
+                and results[remi_id] != coordinator.data
+            ):
+                coordinator.async_set_updated_data(results[remi_id])
+        return results
+
+
+def _merge_keys(key_lists: Iterable[list[str] | None]) -> list[str] | None:
+    """Return the union of field projections, or None if any wants all fields."""
+    merged: set[str] = set()
+    for keys in key_lists:
+        if keys is None:
+            return None
+        merged.update(keys)
+    return sorted(merged) or None
+
+
+def _user_facing_change(old: dict[str, Any], new: dict[str, Any]) -> bool:
+    """Return whether settings or alarms changed, ignoring sensor telemetry."""
+    old_remi, new_remi = old.get("remi", {}), new.get("remi", {})
+    if any(
+        old_remi.get(field) != new_remi.get(field)
+        for field in ADAPTIVE_POLL_ACTIVITY_FIELDS
+    ):
+        return True
+    return _without_timestamps(old.get("events", [])) != _without_timestamps(
+        new.get("events", [])
+    )
+
+
+def _without_timestamps(events: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    return [
+        {key: value for key, value in event.items() if key not in ("createdAt", "updatedAt")}
+        for event in events
+    ]
+
+
+def _write_metadata(response: dict[str, Any]) -> dict[str, Any]:
+    """Return the objectId and timestamps from a Parse write response."""
+    metadata = {
+        key: response[key]
+        for key in ("objectId", "createdAt", "updatedAt")
+        if key in response
+    }
+    # Parse sets updatedAt to createdAt on creation but only returns the latter.
+    if "createdAt" in metadata:
+        metadata.setdefault("updatedAt", metadata["createdAt"])
+    return metadata
+
+
+def _latest_update(objects: list[dict[str, Any]]) -> str | None:
+    """Return the most recent updatedAt timestamp among Parse objects."""
+    # Parse timestamps are fixed-width ISO 8601 strings, so they sort lexically.
+    return max((obj["updatedAt"] for obj in objects if obj.get("updatedAt")), default=None)
+
+
 async def _gather(*coros):
     """Run multiple coroutines and return results as a list."""
     import asyncio
@@ -1,6 +1,7 @@
 """Base entity for the UrbanHello Remi integration."""
 from __future__ import annotations
 
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -8,26 +9,54 @@ from .const import DOMAIN
 from .coordinator import RemiDataUpdateCoordinator
 
 
+# Remi fields read by device_info, which is re-evaluated when alarms are added.
+DEVICE_INFO_FIELDS = ("name", "current_firmware_version", "uniqueID")
+
+
 class RemiEntity(CoordinatorEntity[RemiDataUpdateCoordinator]):
     """Base class for all Remi entities."""
 
     _attr_has_entity_name = True
 
+    # Fields of the Remi / Event objects this entity reads from the coordinator.
+    _remi_fields: tuple[str, ...] = ()
+    _event_fields: tuple[str, ...] = ()
+    # objectIds of the events whose changes affect this entity's state.
+    _event_ids: tuple[str, ...] = ()
+
     def __init__(self, coordinator: RemiDataUpdateCoordinator) -> None:
         super().__init__(coordinator)
         remi = coordinator.remi
         self._remi_id = remi.get("objectId", "")
 
+    async def async_added_to_hass(self) -> None:
+        """Register the fields this entity reads while it is enabled."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_track_fields(
+                (*DEVICE_INFO_FIELDS, *self._remi_fields), self._event_fields
+            )
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only when data this entity reads has changed."""
+        if self.coordinator.changes.affects(self._remi_fields, self._event_ids):
+            super()._handle_coordinator_update()
+
     @property
     def device_info(self) -> DeviceInfo:
         """Return device info for this Remi."""
         remi = self.coordinator.remi
-        return DeviceInfo(
+        device_info = DeviceInfo(
             identifiers={(DOMAIN, self._remi_id)},
             name=remi.get("name", "Remi"),
             manufacturer="UrbanHello",
             model="Remi",
             sw_version=str(remi.get("current_firmware_version", "")),
             serial_number=remi.get("uniqueID"),
-            configuration_url=f"http://{remi.get('ipv4Address', '')}",
         )
+        # ipv4Address is only polled while the IP Address sensor is enabled.
+        if ipv4_address := remi.get("ipv4Address"):
+            device_info["configuration_url"] = f"http://{ipv4_address}"
+        return device_info
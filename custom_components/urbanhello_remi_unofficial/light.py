@@ -42,6 +42,7 @@ class RemiRgbLightEntity(RemiEntity, LightEntity):
 
     def __init__(self, coordinator: RemiDataUpdateCoordinator) -> None:
         super().__init__(coordinator)
+        self._remi_fields = (self._field,)
 
     def _get_rgb(self) -> list[int]:
         return self.coordinator.remi.get(self._field, [255, 255, 255])
@@ -69,17 +70,15 @@ class RemiRgbLightEntity(RemiEntity, LightEntity):
                 rgb = (255, 255, 255)
             else:
                 rgb = tuple(current)
-        await self.coordinator.client.update_remi(
+        await self.coordinator.async_update_remi(
             {self._field: list(rgb)}
         )
-        await self.coordinator.async_request_refresh()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the light by setting RGB to [0, 0, 0]."""
-        await self.coordinator.client.update_remi(
+        await self.coordinator.async_update_remi(
             {self._field: [0, 0, 0]}
         )
-        await self.coordinator.async_request_refresh()
 
 
 class RemiNightLightEntity(RemiRgbLightEntity):
@@ -0,0 +1,179 @@
+"""Parse LiveQuery push client for the UrbanHello Remi integration."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import logging
+from typing import Any
+
+import aiohttp
+
+from .api import RemiApiClient, RemiApiError
+from .const import (
+    API_APP_ID,
+    LIVEQUERY_BACKOFF_BASE_SECONDS,
+    LIVEQUERY_BACKOFF_MAX_SECONDS,
+    LIVEQUERY_HANDSHAKE_TIMEOUT_SECONDS,
+    LIVEQUERY_HEARTBEAT_SECONDS,
+    LIVEQUERY_URL,
+)
+from .resilience import backoff_delay
+
+_LOGGER = logging.getLogger(__name__)
+
+# LiveQuery operations that carry a changed object.
+PUSH_OPERATIONS = ("create", "enter", "update", "leave", "delete")
+
+# Keys LiveQuery adds to pushed objects that REST responses do not have.
+_OBJECT_METADATA = ("__type", "className")
+
+
+class RemiLiveQueryError(RemiApiError):
+    """Raised when the LiveQuery server rejects the connection or a subscription."""
+
+
+class RemiLiveQuery:
+    """Subscribe to the Remi device and its events over Parse LiveQuery.
+
+    ``on_change`` is called with the operation, the class name and the object
+    of every pushed change. ``on_connection_change`` is called with True once
+    both subscriptions are active, and with False when the connection drops.
+    """
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        client: RemiApiClient,
+        on_change: Callable[[str, str, dict[str, Any]], None],
+        on_connection_change: Callable[[bool], None],
+        url: str = LIVEQUERY_URL,
+    ) -> None:
+        self._session = session
+        self._client = client
+        self._on_change = on_change
+        self._on_connection_change = on_connection_change
+        self._url = url
+        self._subscriptions: dict[int, str] = {}
+        self._connected = False
+
+    @property
+    def connected(self) -> bool:
+        """Return true while both subscriptions are active."""
+        return self._connected
+
+    async def async_run(self) -> None:
+        """Keep the subscriptions open until cancelled, reconnecting with backoff."""
+        failures = 0
+        try:
+            while True:
+                try:
+                    await self._async_listen()
+                except (aiohttp.ClientError, asyncio.TimeoutError, RemiLiveQueryError) as err:
+                    _LOGGER.debug("LiveQuery connection lost: %s", err)
+                except Exception:
+                    _LOGGER.exception("Unexpected LiveQuery error")
+                if self._connected:
+                    failures = 0
+                    self._set_connected(False)
+                delay = backoff_delay(
+                    failures, LIVEQUERY_BACKOFF_BASE_SECONDS, LIVEQUERY_BACKOFF_MAX_SECONDS
+                )
+                failures += 1
+                _LOGGER.debug("Reconnecting to LiveQuery in %.1fs", delay)
+                await asyncio.sleep(delay)
+        finally:
+            # Polling must not stay slowed down once nothing pushes changes.
+            if self._connected:
+                self._set_connected(False)
+
+    async def _async_listen(self) -> None:
+        """Connect, subscribe and dispatch pushed changes until the socket closes."""
+        async with self._session.ws_connect(
+            self._url, heartbeat=LIVEQUERY_HEARTBEAT_SECONDS
+        ) as ws:
+            async with asyncio.timeout(LIVEQUERY_HANDSHAKE_TIMEOUT_SECONDS):
+                await self._async_handshake(ws)
+            self._set_connected(True)
+
+            async for msg in ws:
+                if msg.type != aiohttp.WSMsgType.TEXT:
+                    break
+                try:
+                    self._handle_message(msg.json())
+                except RemiLiveQueryError:
+                    raise
+                except Exception:
+                    _LOGGER.exception("Error handling LiveQuery message %s", msg.data)
+
+    async def _async_handshake(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        """Authenticate and subscribe to the Remi object and its events."""
+        session_token = self._client.session_token
+        await ws.send_json(
+            {
+                "op": "connect",
+                "applicationId": API_APP_ID,
+                "installationId": self._client.installation_id,
+                "sessionToken": session_token,
+            }
+        )
+        await self._async_expect(ws, "connected")
+
+        remi_id = self._client.remi_id
+        self._subscriptions = {1: "Remi", 2: "Event"}
+        queries = {
+            1: {"className": "Remi", "where": {"objectId": remi_id}},
+            2: {
+                "className": "Event",
+                "where": {
+                    "remi": {
+                        "__type": "Pointer",
+                        "className": "Remi",
+                        "objectId": remi_id,
+                    }
+                },
+            },
+        }
+        for request_id, query in queries.items():
+            await ws.send_json(
+                {
+                    "op": "subscribe",
+                    "requestId": request_id,
+                    "query": query,
+                    "sessionToken": session_token,
+                }
+            )
+        for _ in queries:
+            await self._async_expect(ws, "subscribed")
+
+    async def _async_expect(
+        self, ws: aiohttp.ClientWebSocketResponse, op: str
+    ) -> dict[str, Any]:
+        """Wait for a handshake message, failing on errors and closed sockets."""
+        msg = await ws.receive()
+        if msg.type != aiohttp.WSMsgType.TEXT:
+            raise RemiLiveQueryError(f"Connection closed while waiting for {op}")
+        message = msg.json()
+        if message.get("op") == "error":
+            raise RemiLiveQueryError(f"LiveQuery error: {message.get('error')}")
+        if message.get("op") != op:
+            raise RemiLiveQueryError(f"Expected {op}, got {message.get('op')}")
+        return message
+
+    def _handle_message(self, message: dict[str, Any]) -> None:
+        """Dispatch a pushed change to ``on_change``."""
+        op = message.get("op")
+        if op == "error":
+            raise RemiLiveQueryError(f"LiveQuery error: {message.get('error')}")
+        class_name = self._subscriptions.get(message.get("requestId"))
+        if op not in PUSH_OPERATIONS or class_name is None:
+            return
+        obj = {
+            key: value
+            for key, value in message.get("object", {}).items()
+            if key not in _OBJECT_METADATA
+        }
+        self._on_change(op, class_name, obj)
+
+    def _set_connected(self, connected: bool) -> None:
+        self._connected = connected
+        self._on_connection_change(connected)
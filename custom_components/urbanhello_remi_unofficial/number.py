@@ -92,6 +92,7 @@ class RemiNumberEntity(RemiEntity, NumberEntity):
     ) -> None:
         super().__init__(coordinator)
         self.entity_description = description
+        self._remi_fields = (description.field,)
         self._attr_unique_id = f"{self._remi_id}_{description.key}"
 
     @property
@@ -100,8 +101,7 @@ class RemiNumberEntity(RemiEntity, NumberEntity):
         return self.entity_description.value_fn(self.coordinator.remi)
 
     async def async_set_native_value(self, value: float) -> None:
-        """Set a new value."""
-        await self.coordinator.client.update_remi(
+        """Set a new value, coalescing rapid slider changes into one write."""
+        await self.coordinator.async_queue_remi_update(
             {self.entity_description.field: int(value)}
         )
-        await self.coordinator.async_request_refresh()
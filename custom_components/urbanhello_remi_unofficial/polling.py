@@ -0,0 +1,176 @@
+"""Poll scheduling policies for the UrbanHello Remi coordinator."""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import datetime, time as dt_time, timedelta
+import time
+from typing import Any
+
+from .const import (
+    ADAPTIVE_POLL_BURST_SECONDS,
+    ADAPTIVE_POLL_FAST_SECONDS,
+    ADAPTIVE_POLL_IDLE_AFTER_SECONDS,
+    ADAPTIVE_POLL_MAX_SECONDS,
+    ALARM_IDLE_POLL_SECONDS,
+    ALARM_WINDOW_LEAD_SECONDS,
+    ALARM_WINDOW_POLL_SECONDS,
+    ALARM_WINDOW_TRAIL_SECONDS,
+    SCAN_INTERVAL_SECONDS,
+)
+
+
+class PollTier:
+    """Track when one group of data is due for a refresh."""
+
+    def __init__(self, interval: float) -> None:
+        self._interval = interval
+        self._due_at = 0.0
+
+    @property
+    def due(self) -> bool:
+        """Return true once the interval has elapsed since the last refresh."""
+        return time.monotonic() >= self._due_at
+
+    def mark_refreshed(self) -> None:
+        """Start a new interval."""
+        self._due_at = time.monotonic() + self._interval
+
+    def expire(self) -> None:
+        """Make the tier due on the next poll, e.g. after a write."""
+        self._due_at = 0.0
+
+
+class AdaptivePollPolicy:
+    """Choose the poll interval from recent device activity.
+
+    Polls are fast for a short burst after a write or a detected change.
+    While the device reports being offline, or after nothing changed for a
+    long time, the interval doubles on every poll up to a ceiling. Any
+    activity returns to the base rate.
+    """
+
+    def __init__(
+        self,
+        base: float = SCAN_INTERVAL_SECONDS,
+        fast: float = ADAPTIVE_POLL_FAST_SECONDS,
+        burst: float = ADAPTIVE_POLL_BURST_SECONDS,
+        idle_after: float = ADAPTIVE_POLL_IDLE_AFTER_SECONDS,
+        ceiling: float = ADAPTIVE_POLL_MAX_SECONDS,
+    ) -> None:
+        self._base = base
+        self._fast = fast
+        self._burst = burst
+        self._idle_after = idle_after
+        self._ceiling = ceiling
+        self._burst_until = 0.0
+        self._last_change = time.monotonic()
+        self._quiet_polls = 0
+
+    def record_activity(self) -> None:
+        """Poll fast for a while after a write or a detected change."""
+        now = time.monotonic()
+        self._burst_until = now + self._burst
+        self._last_change = now
+        self._quiet_polls = 0
+
+    def record_poll(self, changed: bool, online: bool) -> None:
+        """Account for the outcome of a poll."""
+        if changed and online:
+            self.record_activity()
+        elif not online or time.monotonic() - self._last_change >= self._idle_after:
+            # Bounded so the interval arithmetic cannot overflow.
+            self._quiet_polls = min(self._quiet_polls + 1, 32)
+        else:
+            self._quiet_polls = 0
+
+    @property
+    def bursting(self) -> bool:
+        """Return true while polls are fast after recent activity."""
+        return time.monotonic() < self._burst_until
+
+    @property
+    def interval(self) -> float:
+        """Return the number of seconds until the next poll."""
+        if self.bursting:
+            return self._fast
+        return min(self._ceiling, self._base * 2**self._quiet_polls)
+
+
+class AlarmProximityPolicy:
+    """Poll densely around alarms and sparsely otherwise.
+
+    The window around an alarm opens ``lead`` seconds before it rings and
+    closes ``trail`` seconds after it ends, so face and light changes and
+    the device waking up are seen quickly.
+    """
+
+    def __init__(
+        self,
+        dense: float = ALARM_WINDOW_POLL_SECONDS,
+        sparse: float = ALARM_IDLE_POLL_SECONDS,
+        lead: float = ALARM_WINDOW_LEAD_SECONDS,
+        trail: float = ALARM_WINDOW_TRAIL_SECONDS,
+    ) -> None:
+        self._dense = dense
+        self._sparse = sparse
+        self._lead = timedelta(seconds=lead)
+        self._trail = timedelta(seconds=trail)
+
+    def interval(
+        self, interval: float, events: Iterable[dict[str, Any]], now: datetime
+    ) -> float:
+        """Fit a poll interval to the alarm schedule.
+
+        Inside a window polls are dense. Outside one they are sparse, but
+        never so sparse that the start of the next window is missed.
+        """
+        window = self.next_window(events, now)
+        if window is None:
+            return max(interval, self._sparse)
+        start, _end = window
+        if start <= now:
+            return min(interval, self._dense)
+        until_window = (start - now).total_seconds()
+        return min(max(interval, self._sparse), max(until_window, self._dense))
+
+    def next_window(
+        self, events: Iterable[dict[str, Any]], now: datetime
+    ) -> tuple[datetime, datetime] | None:
+        """Return the current or next alarm window, or None without alarms."""
+        windows = []
+        for event in events:
+            if not event.get("enabled"):
+                continue
+            length = timedelta(minutes=event.get("length_min") or 0) + self._trail
+            ring = next_occurrence(event, now - length)
+            if ring is not None:
+                windows.append((ring - self._lead, ring + length))
+        return min(windows, default=None)
+
+
+def next_occurrence(event: dict[str, Any], after: datetime) -> datetime | None:
+    """Return when an alarm next rings at or after ``after``.
+
+    ``event_time`` is ``[hour, minute]`` in local time and ``recurrence``
+    flags the days from Sunday on; an alarm without days rings once.
+    """
+    event_time = event.get("event_time")
+    if not isinstance(event_time, list) or len(event_time) < 2:
+        return None
+    try:
+        ring_time = dt_time(int(event_time[0]), int(event_time[1]))
+    except (TypeError, ValueError):
+        return None
+    recurrence = event.get("recurrence")
+    days = (
+        {day for day, active in enumerate(recurrence[:7]) if active}
+        if isinstance(recurrence, list)
+        else set()
+    )
+    for offset in range(8):
+        day = after.date() + timedelta(days=offset)
+        ring = datetime.combine(day, ring_time, tzinfo=after.tzinfo)
+        # date.weekday() counts from Monday; recurrence counts from Sunday.
+        if ring >= after and (not days or (day.weekday() + 1) % 7 in days):
+            return ring
+    return None
@@ -0,0 +1,235 @@
+"""Retry, timeout, hedging, rate limiting and circuit breaking helpers for the UrbanHello Remi API client."""
+from __future__ import annotations
+
+from collections import deque
+import math
+import random
+import time
+
+from .const import (
+    ADAPTIVE_TIMEOUT_FACTOR,
+    ADAPTIVE_TIMEOUT_MIN_SECONDS,
+    BUDGET_LOW_FRACTION,
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_RECOVERY_SECONDS,
+    HEDGE_MAX_PER_MINUTE,
+    HOURLY_REQUEST_BUDGET,
+    LATENCY_EWMA_ALPHA,
+    LATENCY_MIN_SAMPLES,
+    LATENCY_SAMPLE_SIZE,
+    RATE_LIMIT_BURST,
+    RATE_LIMIT_REQUESTS_PER_MINUTE,
+    RETRY_BACKOFF_BASE_SECONDS,
+    RETRY_BACKOFF_MAX_SECONDS,
+)
+
+
+def backoff_delay(
+    attempt: int,
+    base: float = RETRY_BACKOFF_BASE_SECONDS,
+    cap: float = RETRY_BACKOFF_MAX_SECONDS,
+) -> float:
+    """Return a full-jitter exponential backoff delay for a 0-based attempt."""
+    return random.uniform(0, min(cap, base * 2**attempt))
+
+
+class LatencyTracker:
+    """Track recent response latencies of one endpoint."""
+
+    def __init__(
+        self,
+        sample_size: int = LATENCY_SAMPLE_SIZE,
+        min_samples: int = LATENCY_MIN_SAMPLES,
+        alpha: float = LATENCY_EWMA_ALPHA,
+    ) -> None:
+        self._samples: deque[float] = deque(maxlen=sample_size)
+        self._min_samples = min_samples
+        self._alpha = alpha
+        self._ewma: float | None = None
+
+    def record(self, seconds: float) -> None:
+        """Record the latency of a completed request, or how long a timed-out one waited."""
+        self._samples.append(seconds)
+        if self._ewma is None:
+            self._ewma = seconds
+        else:
+            self._ewma += self._alpha * (seconds - self._ewma)
+
+    @property
+    def ewma(self) -> float | None:
+        """Return the exponentially weighted moving average latency."""
+        return self._ewma
+
+    @property
+    def p95(self) -> float | None:
+        """Return the 95th percentile latency, once enough samples exist."""
+        if len(self._samples) < self._min_samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, math.ceil(0.95 * len(ordered)) - 1)]
+
+    def timeout(
+        self,
+        default: float,
+        factor: float = ADAPTIVE_TIMEOUT_FACTOR,
+        minimum: float = ADAPTIVE_TIMEOUT_MIN_SECONDS,
+    ) -> float:
+        """Return a timeout derived from observed latencies, capped at ``default``."""
+        p95 = self.p95
+        if p95 is None or self._ewma is None:
+            return default
+        return min(default, max(minimum, factor * max(p95, self._ewma)))
+
+
+class HedgeBudget:
+    """Limit how many hedge requests may be sent in a sliding window."""
+
+    def __init__(self, limit: int = HEDGE_MAX_PER_MINUTE, window: float = 60) -> None:
+        self._limit = limit
+        self._window = window
+        self._sent: deque[float] = deque()
+
+    def try_acquire(self) -> bool:
+        """Reserve a hedge if the budget allows it."""
+        now = time.monotonic()
+        while self._sent and now - self._sent[0] >= self._window:
+            self._sent.popleft()
+        if len(self._sent) >= self._limit:
+            return False
+        self._sent.append(now)
+        return True
+
+
+class RateLimiter:
+    """Limit the request rate of one account.
+
+    A token bucket smooths bursts, a rolling one-hour window counts requests
+    against a budget, and pauses requested by the server (Retry-After) stop
+    all requests until they expire.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float = RATE_LIMIT_REQUESTS_PER_MINUTE,
+        hourly_budget: int = HOURLY_REQUEST_BUDGET,
+        burst: int = RATE_LIMIT_BURST,
+    ) -> None:
+        self._burst = burst
+        self._tokens = float(burst)
+        self._refilled_at = time.monotonic()
+        self._sent: deque[float] = deque()
+        self._paused_until = 0.0
+        self.configure(requests_per_minute, hourly_budget)
+
+    def configure(self, requests_per_minute: float, hourly_budget: int) -> None:
+        """Change the sustained request rate and the hourly budget."""
+        self._rate = requests_per_minute / 60
+        self._hourly_budget = hourly_budget
+
+    def try_acquire(self) -> float:
+        """Take a token and return 0, or return the seconds until one is available."""
+        now = time.monotonic()
+        elapsed = max(0.0, now - self._refilled_at)
+        self._tokens = min(self._burst, self._tokens + elapsed * self._rate)
+        self._refilled_at = now
+        if self._tokens < 1:
+            return (1 - self._tokens) / self._rate
+        self._tokens -= 1
+        self._sent.append(now)
+        return 0.0
+
+    def pause(self, seconds: float) -> None:
+        """Hold every request for ``seconds``, as asked by the server."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    @property
+    def retry_after(self) -> float:
+        """Return the seconds left in a server-requested pause."""
+        return max(0.0, self._paused_until - time.monotonic())
+
+    @property
+    def budget_remaining(self) -> int:
+        """Return how many requests are left in the rolling hourly budget."""
+        now = time.monotonic()
+        while self._sent and now - self._sent[0] >= 3600:
+            self._sent.popleft()
+        return max(0, self._hourly_budget - len(self._sent))
+
+    @property
+    def budget_resets_in(self) -> float:
+        """Return the seconds until the oldest counted request leaves the window."""
+        if not self._sent:
+            return 0.0
+        return max(0.0, self._sent[0] + 3600 - time.monotonic())
+
+    @property
+    def budget_low(self) -> bool:
+        """Return true once the hourly budget is running out."""
+        return self.budget_remaining < self._hourly_budget * BUDGET_LOW_FRACTION
+
+
+_RATE_LIMITERS: dict[str, RateLimiter] = {}
+
+
+def get_rate_limiter(account: str) -> RateLimiter:
+    """Return the rate limiter shared by every client of ``account``."""
+    if account not in _RATE_LIMITERS:
+        _RATE_LIMITERS[account] = RateLimiter()
+    return _RATE_LIMITERS[account]
+
+
+class CircuitBreaker:
+    """Stop sending requests to a host after repeated failures.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    requests are refused. Once ``recovery_timeout`` has elapsed, requests are
+    let through again as probes: a success closes the circuit, a failure
+    opens it for another ``recovery_timeout``.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        recovery_timeout: float = CIRCUIT_RECOVERY_SECONDS,
+    ) -> None:
+        self._failure_threshold = failure_threshold
+        self._recovery_timeout = recovery_timeout
+        self._failures = 0
+        self._opened_at: float | None = None
+
+    @property
+    def is_open(self) -> bool:
+        """Return true while requests are being refused."""
+        return self.retry_after > 0
+
+    @property
+    def retry_after(self) -> float:
+        """Return the seconds left before requests are let through again."""
+        if self._opened_at is None:
+            return 0.0
+        return max(0.0, self._opened_at + self._recovery_timeout - time.monotonic())
+
+    def allow_request(self) -> bool:
+        """Return whether a request may be sent now."""
+        return not self.is_open
+
+    def record_success(self) -> None:
+        """Record a request that reached a healthy host."""
+        self._failures = 0
+        self._opened_at = None
+
+    def record_failure(self) -> None:
+        """Record a network or server failure."""
+        self._failures += 1
+        if self._opened_at is not None or self._failures >= self._failure_threshold:
+            self._opened_at = time.monotonic()
+
+
+_CIRCUIT_BREAKERS: dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(host: str) -> CircuitBreaker:
+    """Return the circuit breaker shared by every client talking to ``host``."""
+    if host not in _CIRCUIT_BREAKERS:
+        _CIRCUIT_BREAKERS[host] = CircuitBreaker()
+    return _CIRCUIT_BREAKERS[host]
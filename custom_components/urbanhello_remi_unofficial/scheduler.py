@@ -0,0 +1,115 @@
+"""Priority request scheduling for the UrbanHello Remi API client."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Hashable
+from enum import IntEnum
+import heapq
+import itertools
+
+from .const import HOST_MAX_CONCURRENT_REQUESTS
+
+
+class RequestPriority(IntEnum):
+    """Scheduling class of a request; lower values are served first."""
+
+    INTERACTIVE_WRITE = 0
+    INTERACTIVE_READ = 1
+    BACKGROUND = 2
+
+
+class RequestSupersededError(Exception):
+    """Raised for a queued request replaced by a request of a newer generation."""
+
+
+class RequestScheduler:
+    """Cap concurrent requests to a host and serve waiters by priority.
+
+    Requests queued in a ``supersede_group`` are dropped when a request of the
+    same group with a newer ``generation`` is queued before they got a slot.
+    Requests sharing a generation never drop each other.
+    """
+
+    def __init__(self, max_concurrent: int = HOST_MAX_CONCURRENT_REQUESTS) -> None:
+        self._max_concurrent = max_concurrent
+        self._active = 0
+        self._queue: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        self._superseding: dict[Hashable, tuple[int, set[asyncio.Future[None]]]] = {}
+
+    @property
+    def active(self) -> int:
+        """Return the number of requests holding a slot."""
+        return self._active
+
+    @property
+    def queued(self) -> int:
+        """Return the number of requests waiting for a slot."""
+        return sum(1 for _, _, waiter in self._queue if not waiter.done())
+
+    def try_acquire(self) -> bool:
+        """Take a slot without waiting if one is free and nobody is queued."""
+        if self._active >= self._max_concurrent or self.queued:
+            return False
+        self._active += 1
+        return True
+
+    async def acquire(
+        self,
+        priority: RequestPriority,
+        supersede_group: Hashable | None = None,
+        generation: int = 0,
+    ) -> None:
+        """Wait for a slot; the caller must call ``release`` when done."""
+        if self.try_acquire():
+            return
+        waiters: set[asyncio.Future[None]] | None = None
+        if supersede_group is not None:
+            current = self._superseding.get(supersede_group)
+            if current is not None and current[0] > generation:
+                raise RequestSupersededError
+            if current is None or current[0] < generation:
+                if current is not None:
+                    for previous in current[1]:
+                        if not previous.done():
+                            previous.set_exception(RequestSupersededError())
+                current = (generation, set())
+                self._superseding[supersede_group] = current
+            waiters = current[1]
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._queue, (priority, next(self._sequence), waiter))
+        if waiters is not None:
+            waiters.add(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            # The slot may have been granted just before the caller went away.
+            if waiter.done() and not waiter.cancelled() and waiter.exception() is None:
+                self.release()
+            raise
+        finally:
+            if waiters is not None:
+                waiters.discard(waiter)
+                current = self._superseding.get(supersede_group)
+                if current is not None and current[1] is waiters and not waiters:
+                    del self._superseding[supersede_group]
+
+    def release(self) -> None:
+        """Return a slot and hand it to the most urgent waiter."""
+        self._active -= 1
+        while self._queue and self._active < self._max_concurrent:
+            _, _, waiter = heapq.heappop(self._queue)
+            if waiter.done():
+                continue
+            waiter.set_result(None)
+            self._active += 1
+
+
+_SCHEDULERS: dict[str, RequestScheduler] = {}
+
+
+def get_request_scheduler(host: str) -> RequestScheduler:
+    """Return the scheduler shared by every client talking to ``host``."""
+    if host not in _SCHEDULERS:
+        _SCHEDULERS[host] = RequestScheduler()
+    return _SCHEDULERS[host]
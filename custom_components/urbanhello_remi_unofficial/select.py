@@ -39,6 +39,7 @@ class RemiFaceSelectEntity(RemiEntity, SelectEntity):
     _attr_name = "Clock Face"
     _attr_icon = "mdi:emoticon-outline"
     _attr_options = list(FACE_DEFINE_TO_NAME.values())
+    _remi_fields = ("face",)
 
     def __init__(self, coordinator: RemiDataUpdateCoordinator) -> None:
         super().__init__(coordinator)
@@ -62,7 +63,7 @@ class RemiFaceSelectEntity(RemiEntity, SelectEntity):
         object_id = FACE_DEFINE_TO_OBJECT_ID.get(define)
         if object_id is None:
             return
-        await self.coordinator.client.update_remi(
+        await self.coordinator.async_update_remi(
             {
                 "face": {
                     "__type": "Pointer",
@@ -71,7 +72,6 @@ class RemiFaceSelectEntity(RemiEntity, SelectEntity):
                 }
             }
         )
-        await self.coordinator.async_request_refresh()
 
 
 class RemiClockFormatSelectEntity(RemiEntity, SelectEntity):
@@ -80,6 +80,7 @@ class RemiClockFormatSelectEntity(RemiEntity, SelectEntity):
     _attr_name = "Clock Format"
     _attr_icon = "mdi:clock-outline"
     _attr_options = ["12h", "24h"]
+    _remi_fields = ("hourFormat24",)
 
     def __init__(self, coordinator: RemiDataUpdateCoordinator) -> None:
         super().__init__(coordinator)
@@ -92,10 +93,9 @@ class RemiClockFormatSelectEntity(RemiEntity, SelectEntity):
 
     async def async_select_option(self, option: str) -> None:
         """Change the clock format."""
-        await self.coordinator.client.update_remi(
+        await self.coordinator.async_update_remi(
             {"hourFormat24": option == "24h"}
         )
-        await self.coordinator.async_request_refresh()
 
 
 class RemiMusicModeSelectEntity(RemiEntity, SelectEntity):
@@ -104,6 +104,7 @@ class RemiMusicModeSelectEntity(RemiEntity, SelectEntity):
     _attr_name = "Music Mode"
     _attr_icon = "mdi:music"
     _attr_options = list(MUSIC_MODE_OPTIONS.values())
+    _remi_fields = ("musicMode",)
 
     def __init__(self, coordinator: RemiDataUpdateCoordinator) -> None:
         super().__init__(coordinator)
@@ -120,5 +121,4 @@ class RemiMusicModeSelectEntity(RemiEntity, SelectEntity):
         mode = next(
             (k for k, v in MUSIC_MODE_OPTIONS.items() if v == option), 0
         )
-        await self.coordinator.client.update_remi({"musicMode": mode})
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_update_remi({"musicMode": mode})
@@ -27,6 +27,7 @@ from .entity import RemiEntity
 class RemiSensorEntityDescription(SensorEntityDescription):
     """Describes a Remi sensor entity."""
 
+    fields: tuple[str, ...] = ()
     value_fn: Any = None
 
 
@@ -39,6 +40,7 @@ SENSOR_DESCRIPTIONS: tuple[RemiSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         suggested_display_precision=1,
+        fields=("temp",),
         value_fn=lambda remi: (remi.get("temp", 0) - 115) / 2,
     ),
     RemiSensorEntityDescription(
@@ -48,6 +50,7 @@ SENSOR_DESCRIPTIONS: tuple[RemiSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.ILLUMINANCE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement="lx",
+        fields=("luminosity",),
         value_fn=lambda remi: remi.get("luminosity"),
     ),
     RemiSensorEntityDescription(
@@ -58,6 +61,7 @@ SENSOR_DESCRIPTIONS: tuple[RemiSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
         entity_registry_enabled_default=False,
+        fields=("rssi",),
         value_fn=lambda remi: remi.get("rssi"),
     ),
     RemiSensorEntityDescription(
@@ -65,6 +69,7 @@ SENSOR_DESCRIPTIONS: tuple[RemiSensorEntityDescription, ...] = (
         translation_key="firmware_version",
         name="Firmware Version",
         icon="mdi:chip",
+        fields=("current_firmware_version",),
         value_fn=lambda remi: remi.get("current_firmware_version"),
     ),
     RemiSensorEntityDescription(
@@ -73,6 +78,7 @@ SENSOR_DESCRIPTIONS: tuple[RemiSensorEntityDescription, ...] = (
         name="IP Address",
         icon="mdi:ip-network",
         entity_registry_enabled_default=False,
+        fields=("ipv4Address",),
         value_fn=lambda remi: remi.get("ipv4Address"),
     ),
     RemiSensorEntityDescription(
@@ -80,6 +86,7 @@ SENSOR_DESCRIPTIONS: tuple[RemiSensorEntityDescription, ...] = (
         translation_key="current_face",
         name="Current Face",
         icon="mdi:emoticon-outline",
+        fields=("face",),
         value_fn=lambda remi: FACE_DEFINE_TO_NAME.get(
             FACE_OBJECT_ID_TO_DEFINE.get(
                 (remi.get("face") or {}).get("objectId", ""), ""
@@ -115,6 +122,7 @@ class RemiSensorEntity(RemiEntity, SensorEntity):
     ) -> None:
         super().__init__(coordinator)
         self.entity_description = description
+        self._remi_fields = description.fields
         self._attr_unique_id = f"{self._remi_id}_{description.key}"
 
     @property
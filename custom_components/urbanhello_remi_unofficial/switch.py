@@ -61,6 +61,16 @@ class RemiAlarmSwitchEntity(RemiEntity, SwitchEntity):
     """Switch entity representing a single Remi alarm (Event)."""
 
     _attr_icon = "mdi:alarm"
+    _event_fields = (
+        "name",
+        "enabled",
+        "event_time",
+        "recurrence",
+        "brightness",
+        "volume",
+        "length_min",
+        "face",
+    )
 
     def __init__(
         self,
@@ -69,6 +79,7 @@ class RemiAlarmSwitchEntity(RemiEntity, SwitchEntity):
     ) -> None:
         super().__init__(coordinator)
         self._event_id: str = event["objectId"]
+        self._event_ids = (self._event_id,)
         self._attr_unique_id = f"{self._remi_id}_alarm_{self._event_id}"
         self._attr_name = event.get("name") or f"Alarm {self._event_id}"
 
@@ -119,10 +130,8 @@ class RemiAlarmSwitchEntity(RemiEntity, SwitchEntity):
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Enable the alarm."""
-        await self.coordinator.client.update_event(self._event_id, {"enabled": True})
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_update_event(self._event_id, {"enabled": True})
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Disable the alarm."""
-        await self.coordinator.client.update_event(self._event_id, {"enabled": False})
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_update_event(self._event_id, {"enabled": False})
@@ -0,0 +1,225 @@
+"""HTTP transports for the UrbanHello Remi API client.
+
+The client sends every request through a transport. ``AiohttpTransport``
+talks to the cloud; ``RecordingTransport`` wraps another transport and keeps
+each exchange for a cassette file; ``ReplayTransport`` answers from a
+cassette without network access, for profiling and offline regression tests.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict, deque
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+import json
+from pathlib import Path
+import time
+from typing import Any, Protocol
+
+import aiohttp
+
+from .const import API_BASE_URL
+
+# Request fields and response keys that are never written to a cassette.
+_REDACTED = "**REDACTED**"
+_SECRET_PAYLOAD_KEYS = ("username", "password")
+_SECRET_BODY_KEYS = ("sessionToken",)
+
+# Responses holding the account's user object, and the only keys kept in them.
+_USER_PATHS = ("/parse/login", "/parse/users/me")
+_USER_BODY_KEYS = ("currentRemi", "remis", "createdAt", "updatedAt", "code", "error")
+
+# Response headers the client reads, and so the only ones recorded.
+_RECORDED_HEADERS = ("Retry-After",)
+
+
+@dataclass(frozen=True, slots=True)
+class TransportResponse:
+    """Status, raw body and headers of one HTTP response."""
+
+    status: int
+    body: bytes
+    headers: Mapping[str, str] = field(default_factory=dict)
+
+    @property
+    def text(self) -> str:
+        """Return the body decoded for error messages."""
+        return self.body.decode("utf-8", "replace")
+
+
+class RemiTransport(Protocol):
+    """Send one HTTP request and return the complete response.
+
+    Transports raise ``asyncio.TimeoutError`` when ``timeout`` elapses and
+    ``aiohttp.ClientError`` when the request cannot be sent.
+    """
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        payload: dict[str, Any] | None,
+        headers: Mapping[str, str],
+        timeout: float,
+    ) -> TransportResponse:
+        """Send a request."""
+
+
+class CassetteMissError(Exception):
+    """Raised when a cassette holds no response for a replayed request."""
+
+
+class AiohttpTransport:
+    """Send requests to the cloud with an aiohttp session."""
+
+    def __init__(self, session: aiohttp.ClientSession) -> None:
+        self._session = session
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        payload: dict[str, Any] | None,
+        headers: Mapping[str, str],
+        timeout: float,
+    ) -> TransportResponse:
+        """Send a request and read the whole response body."""
+        async with self._session.request(
+            method,
+            url,
+            json=payload,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+        ) as resp:
+            return TransportResponse(resp.status, await resp.read(), resp.headers)
+
+
+class RecordingTransport:
+    """Pass requests to another transport and record each exchange.
+
+    Credentials, session tokens and the account's user details are
+    redacted. Call ``async_save`` to write
+    the cassette, one JSON exchange per line.
+    """
+
+    def __init__(self, transport: RemiTransport) -> None:
+        self._transport = transport
+        self.exchanges: list[dict[str, Any]] = []
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        payload: dict[str, Any] | None,
+        headers: Mapping[str, str],
+        timeout: float,
+    ) -> TransportResponse:
+        """Send a request through the wrapped transport and record it."""
+        started = time.monotonic()
+        response = await self._transport.request(method, url, payload, headers, timeout)
+        self.exchanges.append(
+            {
+                "method": method,
+                "path": _path(url),
+                "payload": _redact_payload(payload),
+                "status": response.status,
+                "body": _redact_body(_path(url), response.text),
+                "headers": {
+                    name: response.headers[name]
+                    for name in _RECORDED_HEADERS
+                    if name in response.headers
+                },
+                "elapsed": round(time.monotonic() - started, 3),
+            }
+        )
+        return response
+
+    async def async_save(self, path: str | Path) -> None:
+        """Write the recorded exchanges to a cassette file."""
+        lines = [json.dumps(exchange, separators=(",", ":")) for exchange in self.exchanges]
+        await asyncio.get_running_loop().run_in_executor(
+            None, Path(path).write_text, "\n".join(lines) + "\n"
+        )
+
+
+class ReplayTransport:
+    """Answer requests from recorded exchanges.
+
+    Requests are matched on method, path and payload. Repeated requests get
+    the recorded responses in order, and the last one again once those run
+    out, so a cassette can drive any number of polls. With ``timing`` the
+    recorded latency is replayed too, timing out like the live request would.
+    """
+
+    def __init__(self, exchanges: Iterable[dict[str, Any]], timing: bool = False) -> None:
+        self._timing = timing
+        self._responses: defaultdict[tuple[str, str, str], deque[dict[str, Any]]] = (
+            defaultdict(deque)
+        )
+        for exchange in exchanges:
+            key = _match_key(exchange["method"], exchange["path"], exchange["payload"])
+            self._responses[key].append(exchange)
+
+    @classmethod
+    def from_file(cls, path: str | Path, timing: bool = False) -> ReplayTransport:
+        """Load a cassette written by ``RecordingTransport``."""
+        with open(path, encoding="utf-8") as file:
+            return cls((json.loads(line) for line in file if line.strip()), timing)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        payload: dict[str, Any] | None,
+        headers: Mapping[str, str],
+        timeout: float,
+    ) -> TransportResponse:
+        """Return the next recorded response to this request."""
+        path = _path(url)
+        responses = self._responses.get(_match_key(method, path, _redact_payload(payload)))
+        if not responses:
+            raise CassetteMissError(f"No recorded response for {method} {path}")
+        exchange = responses.popleft() if len(responses) > 1 else responses[0]
+        if self._timing:
+            if exchange["elapsed"] > timeout:
+                await asyncio.sleep(timeout)
+                raise asyncio.TimeoutError
+            await asyncio.sleep(exchange["elapsed"])
+        return TransportResponse(
+            exchange["status"], exchange["body"].encode(), exchange["headers"]
+        )
+
+
+def _path(url: str) -> str:
+    return url.removeprefix(API_BASE_URL)
+
+
+def _match_key(
+    method: str, path: str, payload: dict[str, Any] | None
+) -> tuple[str, str, str]:
+    return method, path, json.dumps(payload, sort_keys=True)
+
+
+def _redact_payload(payload: dict[str, Any] | None) -> dict[str, Any] | None:
+    if payload is None or not any(key in payload for key in _SECRET_PAYLOAD_KEYS):
+        return payload
+    return {
+        key: _REDACTED if key in _SECRET_PAYLOAD_KEYS else value
+        for key, value in payload.items()
+    }
+
+
+def _redact_body(path: str, body: str) -> str:
+    user = path in _USER_PATHS
+    if not user and not any(key in body for key in _SECRET_BODY_KEYS):
+        return body
+    try:
+        data = json.loads(body)
+    except ValueError:
+        return body
+    if not isinstance(data, dict):
+        return body
+    for key in data:
+        if key in _SECRET_BODY_KEYS or (user and key not in _USER_BODY_KEYS):
+            data[key] = _REDACTED
+    return json.dumps(data, separators=(",", ":"))
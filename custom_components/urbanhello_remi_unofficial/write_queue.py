@@ -0,0 +1,124 @@
+"""Durable queue of writes made while the Remi cloud is unreachable."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .api import RemiApiClient, RemiApiError, RemiBatchError, RemiClientError
+from .const import DOMAIN, WRITE_QUEUE_SAVE_DELAY_SECONDS, WRITE_QUEUE_STORAGE_VERSION
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _write_queue_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    return Store(hass, WRITE_QUEUE_STORAGE_VERSION, f"{DOMAIN}.write_queue.{entry_id}")
+
+
+async def async_remove_write_queue(hass: HomeAssistant, entry_id: str) -> None:
+    """Delete the stored write queue of a config entry."""
+    await _write_queue_store(hass, entry_id).async_remove()
+
+
+async def async_drain_write_queue(
+    hass: HomeAssistant, client: RemiApiClient, entry_id: str
+) -> None:
+    """Send the updates left queued when the queue was turned off, then delete it.
+
+    Updates that cannot be sent are logged and dropped.
+    """
+    write_queue = RemiWriteQueue(hass, client, entry_id)
+    await write_queue.async_load()
+    if pending := len(write_queue):
+        try:
+            await write_queue.async_flush()
+        except RemiApiError as err:
+            _LOGGER.warning(
+                "Dropped queued updates of %d Remi objects after the offline "
+                "write queue was turned off: %s",
+                pending,
+                err,
+            )
+    await write_queue.async_remove()
+
+
+class RemiWriteQueue:
+    """Hold pending field updates per object until they can be sent.
+
+    Repeated writes to the same field collapse into the latest value. The
+    queue survives restarts in a ``Store`` and is replayed as one batch.
+    """
+
+    def __init__(self, hass: HomeAssistant, client: RemiApiClient, entry_id: str) -> None:
+        self._client = client
+        self._store = _write_queue_store(hass, entry_id)
+        self._remi: dict[str, Any] = {}
+        self._events: dict[str, dict[str, Any]] = {}
+        self._flush_lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of objects with pending updates."""
+        return bool(self._remi) + len(self._events)
+
+    async def async_load(self) -> None:
+        """Restore the updates left pending before the last shutdown."""
+        if (stored := await self._store.async_load()) is None:
+            return
+        self._remi = {**stored.get("remi", {}), **self._remi}
+        for event_id, fields in stored.get("events", {}).items():
+            self._events[event_id] = {**fields, **self._events.get(event_id, {})}
+
+    def queue_remi_update(self, fields: dict[str, Any]) -> None:
+        """Record Remi field updates to send later."""
+        self._remi.update(fields)
+        self._schedule_save()
+
+    def queue_event_update(self, event_id: str, fields: dict[str, Any]) -> None:
+        """Record alarm event field updates to send later."""
+        self._events.setdefault(event_id, {}).update(fields)
+        self._schedule_save()
+
+    async def async_flush(self) -> None:
+        """Send every pending update in one batch.
+
+        Updates queued while the batch is in flight are kept. If the batch
+        cannot be sent, its updates are queued again under any newer values.
+        Operations the server rejects are dropped before the error is
+        raised, as replaying them would fail the same way.
+        """
+        async with self._flush_lock:
+            remi, self._remi = self._remi, {}
+            events, self._events = self._events, {}
+            if not remi and not events:
+                return
+            batch = self._client.batch()
+            if remi:
+                batch.update_remi(remi)
+            for event_id, fields in events.items():
+                batch.update_event(event_id, fields)
+            try:
+                await batch.commit()
+            except (RemiBatchError, RemiClientError):
+                raise
+            except BaseException:
+                self._remi = {**remi, **self._remi}
+                for event_id, fields in events.items():
+                    self._events[event_id] = {**fields, **self._events.get(event_id, {})}
+                raise
+            finally:
+                self._schedule_save()
+
+    async def async_remove(self) -> None:
+        """Drop every pending update and delete the stored queue."""
+        self._remi = {}
+        self._events = {}
+        await self._store.async_remove()
+
+    def _schedule_save(self) -> None:
+        self._store.async_delay_save(self._data_to_save, WRITE_QUEUE_SAVE_DELAY_SECONDS)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        return {"remi": self._remi, "events": self._events}
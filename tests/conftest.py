@@ -74,6 +74,16 @@ MOCK_LOGIN_RESPONSE: dict[str, Any] = {
 }
 
 
+@pytest.fixture(autouse=True)
+def isolated_rate_limiters():
+    """Give every test fresh per-account rate limiters."""
+    with patch.dict(
+        "custom_components.urbanhello_remi_unofficial.resilience._RATE_LIMITERS",
+        clear=True,
+    ):
+        yield
+
+
 @pytest.fixture
 def mock_api_client() -> MagicMock:
     """Return a mock RemiApiClient."""
@@ -82,6 +92,7 @@ def mock_api_client() -> MagicMock:
     client.session_token = MOCK_SESSION_TOKEN
     client._remi_id = MOCK_REMI_ID
     client._session_token = MOCK_SESSION_TOKEN
+    client.budget_low = False
     client.login = AsyncMock(
         return_value=(MOCK_SESSION_TOKEN, MOCK_REMI_ID, [MOCK_REMI_ID])
     )
@@ -93,6 +104,7 @@ def mock_api_client() -> MagicMock:
     client.create_event = AsyncMock(return_value={"objectId": "new_event_id"})
     client.update_event = AsyncMock(return_value={})
     client.delete_event = AsyncMock(return_value=None)
+    client.warm_up = AsyncMock(return_value=None)
     return client
 
 
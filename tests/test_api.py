@@ -1,6 +1,9 @@
 """Tests for the RemiApiClient."""
 from __future__ import annotations
 
+import asyncio
+import json
+import time
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -11,11 +14,33 @@ from custom_components.urbanhello_remi_unofficial.api import (
     RemiApiClient,
     RemiApiError,
     RemiAuthError,
+    RemiBatchError,
+    RemiCircuitOpenError,
+    RemiClientError,
+    RemiRateLimitError,
+    RemiServerError,
+    RemiSupersededError,
+    RemiTimeoutError,
+    RemiTransientError,
+    json_loads,
 )
 from custom_components.urbanhello_remi_unofficial.const import (
     API_APP_ID,
     API_BASE_URL,
+    CIRCUIT_FAILURE_THRESHOLD,
+    LOGIN_TIMEOUT_SECONDS,
+    QUERY_PAGE_SIZE,
+    RATE_LIMIT_DEFAULT_RETRY_SECONDS,
+    READ_TIMEOUT_SECONDS,
+    RESPONSE_FINGERPRINT_CACHE_SIZE,
+    WRITE_TIMEOUT_SECONDS,
 )
+from custom_components.urbanhello_remi_unofficial.resilience import (
+    CircuitBreaker,
+    HedgeBudget,
+    RateLimiter,
+)
+from custom_components.urbanhello_remi_unofficial.scheduler import RequestScheduler
 
 from .conftest import (
     MOCK_INSTALLATION_ID,
@@ -28,30 +53,72 @@ from .conftest import (
 )
 
 
-def _make_response(status: int, json_data: Any) -> MagicMock:
+def _make_response(
+    status: int, json_data: Any, headers: dict[str, str] | None = None
+) -> MagicMock:
     """Build a mock aiohttp response."""
     resp = MagicMock()
     resp.status = status
+    resp.headers = headers or {}
     resp.json = AsyncMock(return_value=json_data)
+    resp.read = AsyncMock(return_value=json.dumps(json_data).encode())
     resp.text = AsyncMock(return_value=str(json_data))
     resp.__aenter__ = AsyncMock(return_value=resp)
     resp.__aexit__ = AsyncMock(return_value=False)
     return resp
 
 
+LOGIN_URL = f"{API_BASE_URL}/parse/login"
+
+
+def _route_login(mock_session: MagicMock, login_response: MagicMock, responses: Any) -> MagicMock:
+    """Answer logins with ``login_response`` and other requests from ``responses``.
+
+    ``responses`` is a list served in order or a function building each
+    response. Returns the mock that receives the login requests.
+    """
+    login = MagicMock(return_value=login_response)
+    api = MagicMock(side_effect=responses)
+
+    def _request(method: str, url: str, **kwargs: Any) -> MagicMock:
+        if url == LOGIN_URL:
+            return login(method, url, **kwargs)
+        return api(method, url, **kwargs)
+
+    mock_session.request.side_effect = _request
+    return login
+
+
 @pytest.fixture
 def mock_session() -> MagicMock:
     """Return a mock aiohttp.ClientSession."""
     session = MagicMock(spec=aiohttp.ClientSession)
-    session.post = MagicMock()
     session.request = MagicMock()
     return session
 
 
+@pytest.fixture(autouse=True)
+def no_backoff_delay():
+    """Retry immediately instead of sleeping between attempts."""
+    with patch(
+        "custom_components.urbanhello_remi_unofficial.api.backoff_delay",
+        return_value=0,
+    ):
+        yield
+
+
 @pytest.fixture
 def client(mock_session: MagicMock) -> RemiApiClient:
-    """Return a RemiApiClient with a mock session."""
-    c = RemiApiClient(MOCK_USERNAME, MOCK_PASSWORD, mock_session, MOCK_INSTALLATION_ID)
+    """Return a RemiApiClient with a mock session and its own breaker and scheduler."""
+    c = RemiApiClient(
+        MOCK_USERNAME,
+        MOCK_PASSWORD,
+        mock_session,
+        MOCK_INSTALLATION_ID,
+        circuit_breaker=CircuitBreaker(),
+        scheduler=RequestScheduler(),
+        rate_limiter=RateLimiter(),
+    )
     c._session_token = MOCK_SESSION_TOKEN
     c._remi_id = MOCK_REMI_ID
     return c
@@ -78,12 +145,23 @@ class TestRemiApiClientInit:
         headers = client._base_headers(authenticated=True)
         assert headers["X-Parse-Session-Token"] == MOCK_SESSION_TOKEN
 
+    def test_base_headers_are_reused_until_token_changes(self, client: RemiApiClient) -> None:
+        headers = client._base_headers()
+        assert client._base_headers() is headers
+        with pytest.raises(TypeError):
+            headers["X-Parse-Session-Token"] = "other"  # type: ignore[index]
+
+        client.set_session_token("fresh")
+
+        assert client._base_headers()["X-Parse-Session-Token"] == "fresh"
+        assert client._base_headers(authenticated=False) is client._base_headers(authenticated=False)
+
 
 class TestLogin:
     """Tests for RemiApiClient.login()."""
 
     async def test_login_success_single_device(self, client: RemiApiClient, mock_session: MagicMock) -> None:
-        mock_session.post.return_value = _make_response(200, MOCK_LOGIN_RESPONSE)
+        mock_session.request.return_value = _make_response(200, MOCK_LOGIN_RESPONSE)
 
         token, remi_id, all_ids = await client.login()
 
@@ -98,7 +176,7 @@ class TestLogin:
             **MOCK_LOGIN_RESPONSE,
             "remis": [MOCK_REMI_ID, "remi_id_2"],
         }
-        mock_session.post.return_value = _make_response(200, response)
+        mock_session.request.return_value = _make_response(200, response)
 
         _, _, all_ids = await client.login()
 
@@ -106,34 +184,44 @@ class TestLogin:
 
     async def test_login_no_remis_falls_back_to_current(self, client: RemiApiClient, mock_session: MagicMock) -> None:
         response = {**MOCK_LOGIN_RESPONSE, "remis": []}
-        mock_session.post.return_value = _make_response(200, response)
+        mock_session.request.return_value = _make_response(200, response)
 
         _, _, all_ids = await client.login()
 
         assert all_ids == [MOCK_REMI_ID]
 
     async def test_login_401_raises_auth_error(self, client: RemiApiClient, mock_session: MagicMock) -> None:
-        mock_session.post.return_value = _make_response(401, {"error": "Unauthorized"})
+        mock_session.request.return_value = _make_response(401, {"error": "Unauthorized"})
 
         with pytest.raises(RemiAuthError):
             await client.login()
 
+    async def test_login_invalid_credentials_404_raises_auth_error(
+        self, client: RemiApiClient, mock_session: MagicMock
+    ) -> None:
+        mock_session.request.return_value = _make_response(
+            404, {"code": 101, "error": "Invalid username/password."}
+        )
+
+        with pytest.raises(RemiAuthError, match="Invalid username"):
+            await client.login()
+
     async def test_login_500_raises_api_error(self, client: RemiApiClient, mock_session: MagicMock) -> None:
-        mock_session.post.return_value = _make_response(500, {"error": "Server Error"})
+        mock_session.request.return_value = _make_response(500, {"error": "Server Error"})
 
         with pytest.raises(RemiApiError):
             await client.login()
 
     async def test_login_missing_session_token_raises_auth_error(self, client: RemiApiClient, mock_session: MagicMock) -> None:
         response = {**MOCK_LOGIN_RESPONSE, "sessionToken": None}
-        mock_session.post.return_value = _make_response(200, response)
+        mock_session.request.return_value = _make_response(200, response)
 
         with pytest.raises(RemiAuthError):
             await client.login()
 
     async def test_login_missing_current_remi_raises_auth_error(self, client: RemiApiClient, mock_session: MagicMock) -> None:
         response = {**MOCK_LOGIN_RESPONSE, "currentRemi": {}}
-        mock_session.post.return_value = _make_response(200, response)
+        mock_session.request.return_value = _make_response(200, response)
 
         with pytest.raises(RemiAuthError):
             await client.login()
@@ -149,6 +237,18 @@ class TestRequest:
 
         assert result == {"results": []}
 
+    async def test_request_decodes_with_fast_codec(self, client: RemiApiClient, mock_session: MagicMock) -> None:
+        mock_session.request.return_value = _make_response(200, {"results": []})
+
+        with patch(
+            "custom_components.urbanhello_remi_unofficial.api.json_loads",
+            wraps=json_loads,
+        ) as loads:
+            await client._request("GET", "/parse/test")
+
+        loads.assert_called_once_with(b'{"results": []}')
+        assert mock_session.request.call_args.args[1] == f"{API_BASE_URL}/parse/test"
+
     async def test_request_201_success(self, client: RemiApiClient, mock_session: MagicMock) -> None:
         mock_session.request.return_value = _make_response(201, {"objectId": "new_id"})
 
@@ -166,13 +266,37 @@ class TestRequest:
         """On 401, the client should re-login and retry once."""
         resp_401 = _make_response(401, {"error": "Unauthorized"})
         resp_ok = _make_response(200, {"results": [MOCK_REMI_DATA]})
-        mock_session.request.side_effect = [resp_401, resp_ok]
-        mock_session.post.return_value = _make_response(200, MOCK_LOGIN_RESPONSE)
+        login = _route_login(
+            mock_session, _make_response(200, MOCK_LOGIN_RESPONSE), [resp_401, resp_ok]
+        )
+
+        result = await client._request("POST", "/parse/classes/Remi", {})
+
+        assert result == {"results": [MOCK_REMI_DATA]}
+        login.assert_called_once()
+
+    async def test_invalid_session_token_triggers_reauth(
+        self, client: RemiApiClient, mock_session: MagicMock
+    ) -> None:
+        resp_209 = _make_response(400, {"code": 209, "error": "Invalid session token"})
+        resp_ok = _make_response(200, {"results": [MOCK_REMI_DATA]})
+        login = _route_login(
+            mock_session, _make_response(200, MOCK_LOGIN_RESPONSE), [resp_209, resp_ok]
+        )
 
         result = await client._request("POST", "/parse/classes/Remi", {})
 
         assert result == {"results": [MOCK_REMI_DATA]}
-        mock_session.post.assert_called_once()
+        login.assert_called_once()
+
+    async def test_request_4xx_raises_client_error(self, client: RemiApiClient, mock_session: MagicMock) -> None:
+        mock_session.request.return_value = _make_response(404, {"error": "Not Found"})
+
+        with pytest.raises(RemiClientError) as exc_info:
+            await client._request("POST", "/parse/classes/Remi", {"_method": "GET"})
+
+        assert exc_info.value.status == 404
+        mock_session.request.assert_called_once()
 
     async def test_request_401_no_retry_raises_api_error(self, client: RemiApiClient, mock_session: MagicMock) -> None:
         """With retry_auth=False, a 401 should raise immediately."""
@@ -182,6 +306,802 @@ class TestRequest:
             await client._request("GET", "/parse/test", retry_auth=False)
 
 
+class TestRetries:
+    """Tests for retries, typed errors and the circuit breaker."""
+
+    async def test_read_retried_after_server_error(self, client: RemiApiClient, mock_session: MagicMock) -> None:
+        mock_session.request.side_effect = [
+            _make_response(503, {"error": "Unavailable"}),
+            _make_response(200, {"results": []}),
+        ]
+
+        result = await client._request("POST", "/parse/classes/Remi", {"_method": "GET"})
+
+        assert result == {"results": []}
+        assert mock_session.request.call_count == 2
+
+    async def test_read_retried_after_network_error(self, client: RemiApiClient, mock_session: MagicMock) -> None:
+        mock_session.request.side_effect = [
+            aiohttp.ClientConnectionError("reset"),
+            _make_response(200, {"params": {}}),
+        ]
+
+        result = await client._request("GET", "/parse/config")
+
+        assert result == {"params": {}}
+
+    async def test_read_gives_up_after_max_retries(self, client: RemiApiClient, mock_session: MagicMock) -> None:
+        mock_session.request.side_effect = asyncio.TimeoutError
+
+        with pytest.raises(RemiTimeoutError):
+            await client._request("GET", "/parse/config")
+
+        assert mock_session.request.call_count == 3
+
+    async def test_write_not_retried(self, client: RemiApiClient, mock_session: MagicMock) -> None:
+        mock_session.request.return_value = _make_response(500, {"error": "Server Error"})
+
+        with pytest.raises(RemiServerError):
+            await client.update_remi({"volume": 10})
+
+        mock_session.request.assert_called_once()
+
+    async def test_circuit_opens_after_repeated_failures(self, client: RemiApiClient, mock_session: MagicMock) -> None:
+        mock_session.request.return_value = _make_response(500, {"error": "Server Error"})
+        for _ in range(CIRCUIT_FAILURE_THRESHOLD):
+            with pytest.raises(RemiServerError):
+                await client.update_remi({"volume": 10})
+
+        with pytest.raises(RemiCircuitOpenError):
+            await client.get_config()
+
+        assert mock_session.request.call_count == CIRCUIT_FAILURE_THRESHOLD
+
+    async def test_client_errors_do_not_open_circuit(self, client: RemiApiClient, mock_session: MagicMock) -> None:
+        mock_session.request.return_value = _make_response(400, {"error": "Bad Request"})
+        for _ in range(CIRCUIT_FAILURE_THRESHOLD + 1):
+            with pytest.raises(RemiClientError):
+                await client.update_remi({"volume": 10})
+
+    async def test_auth_error_is_api_error(self) -> None:
+        assert issubclass(RemiAuthError, RemiApiError)
+
+    async def test_login_network_error_is_transient(self, client: RemiApiClient, mock_session: MagicMock) -> None:
+        mock_session.request.side_effect = aiohttp.ClientConnectionError("refused")
+
+        with pytest.raises(RemiTransientError):
+            await client.login()
+
+
+class TestWarmUp:
+    """Tests for connection warm-up."""
+
+    async def test_warm_up_calls_health_endpoint(self, client: RemiApiClient, mock_session: MagicMock) -> None:
+        mock_session.request.return_value = _make_response(200, {"status": "ok"})
+
+        await client.warm_up()
+
+        args = mock_session.request.call_args
+        assert args[0] == ("GET", f"{API_BASE_URL}/parse/health")
+
+    async def test_warm_up_is_not_metered(self, mock_session: MagicMock) -> None:
+        limiter = RateLimiter(hourly_budget=60)
+        client = RemiApiClient(
+            MOCK_USERNAME,
+            MOCK_PASSWORD,
+            mock_session,
+            circuit_breaker=CircuitBreaker(),
+            scheduler=RequestScheduler(),
+            rate_limiter=limiter,
+        )
+        mock_session.request.return_value = _make_response(200, {"status": "ok"})
+
+        for _ in range(20):
+            await client.warm_up()
+
+        assert limiter.budget_remaining == 60
+
+
+class TestTimeouts:
+    """Tests for per-request timeouts and deadlines."""
+
+    @staticmethod
+    def _timeout(mock_session: MagicMock, index: int = -1) -> float:
+        return mock_session.request.call_args_list[index].kwargs["timeout"].total
+
+    async def test_read_uses_read_timeout(self, client: RemiApiClient, mock_session: MagicMock) -> None:
+        mock_session.request.return_value = _make_response(200, {"params": {}})
+
+        await client.get_config()
+
+        assert self._timeout(mock_session) == pytest.approx(READ_TIMEOUT_SECONDS, abs=0.1)
+
+    async def test_write_uses_write_timeout(self, client: RemiApiClient, mock_session: MagicMock) -> None:
+        mock_session.request.return_value = _make_response(200, {})
+
+        await client.update_remi({"volume": 10})
+
+        assert self._timeout(mock_session) == pytest.approx(WRITE_TIMEOUT_SECONDS, abs=0.1)
+
+    async def test_login_uses_login_timeout(self, client: RemiApiClient, mock_session: MagicMock) -> None:
+        mock_session.request.return_value = _make_response(200, MOCK_LOGIN_RESPONSE)
+
+        await client.login()
+
+        assert mock_session.request.call_args.kwargs["timeout"].total == LOGIN_TIMEOUT_SECONDS
+
+    async def test_adaptive_timeout_follows_latency(self, mock_session: MagicMock) -> None:
+        c = RemiApiClient(
+            MOCK_USERNAME, MOCK_PASSWORD, mock_session,
+            circuit_breaker=CircuitBreaker(), adaptive_timeouts=True,
+        )
+        tracker = c.latency_tracker("GET", "/parse/config")
+        for _ in range(20):
+            tracker.record(1.0)
+        mock_session.request.return_value = _make_response(200, {"params": {}})
+
+        await c.get_config()
+
+        assert self._timeout(mock_session) == pytest.approx(3.0, abs=0.1)
+
+    async def test_adaptive_timeout_recovers_when_latency_rises(self, mock_session: MagicMock) -> None:
+        c = RemiApiClient(
+            MOCK_USERNAME, MOCK_PASSWORD, mock_session,
+            circuit_breaker=CircuitBreaker(), adaptive_timeouts=True,
+        )
+        tracker = c.latency_tracker("GET", "/parse/config")
+        for _ in range(20):
+            tracker.record(0.1)
+        assert tracker.timeout(READ_TIMEOUT_SECONDS) == pytest.approx(2.0)
+        elapsed = [0.0]
+        monotonic = time.monotonic
+
+        def _slow_backend(*args: Any, **kwargs: Any) -> MagicMock:
+            timeout = kwargs["timeout"].total
+            elapsed[0] += min(timeout, 2.5)
+            if timeout < 2.5:
+                raise asyncio.TimeoutError
+            return _make_response(200, {"params": {}})
+
+        mock_session.request.side_effect = _slow_backend
+        with patch(
+            "custom_components.urbanhello_remi_unofficial.api.time.monotonic",
+            side_effect=lambda: monotonic() + elapsed[0],
+        ):
+            assert await c.get_config() == {"params": {}}
+            assert await c.get_config() == {"params": {}}
+
+        assert self._timeout(mock_session) > 2.5
+
+    async def test_adaptive_timeout_shared_across_object_ids(self, client: RemiApiClient) -> None:
+        assert client.latency_tracker("PUT", "/parse/classes/Event/a") is client.latency_tracker(
+            "PUT", "/parse/classes/Event/b"
+        )
+
+    async def test_successful_requests_record_latency(self, client: RemiApiClient, mock_session: MagicMock) -> None:
+        mock_session.request.return_value = _make_response(200, {"params": {}})
+
+        await client.get_config()
+
+        assert client.latency_tracker("GET", "/parse/config").ewma is not None
+
+    async def test_deadline_bounds_retries(self, client: RemiApiClient, mock_session: MagicMock) -> None:
+        mock_session.request.side_effect = asyncio.TimeoutError
+        clock = [0.0]
+
+        def _advance() -> float:
+            clock[0] += 11
+            return clock[0]
+
+        with patch(
+            "custom_components.urbanhello_remi_unofficial.api.time.monotonic",
+            side_effect=_advance,
+        ), pytest.raises(RemiTimeoutError):
+            await client.get_config()
+
+        assert mock_session.request.call_count < 3
+
+
+def _delayed_response(delay: float, json_data: Any) -> MagicMock:
+    """Build a mock response that takes ``delay`` seconds to arrive."""
+    resp = _make_response(200, json_data)
+
+    async def _arrive(*args: Any) -> MagicMock:
+        await asyncio.sleep(delay)
+        return resp
+
+    resp.__aenter__ = AsyncMock(side_effect=_arrive)
+    return resp
+
+
+async def _wait_queued(scheduler: RequestScheduler, count: int) -> None:
+    """Wait until ``count`` requests are waiting for a slot."""
+    while scheduler.queued < count:
+        await asyncio.sleep(0)
+
+
+class TestRateLimiting:
+    """Tests for client-side rate limiting and server Retry-After."""
+
+    async def test_429_pauses_account(self, client: RemiApiClient, mock_session: MagicMock) -> None:
+        mock_session.request.return_value = _make_response(429, "slow down", {"Retry-After": "120"})
+
+        with pytest.raises(RemiRateLimitError) as exc_info:
+            await client.update_remi({"volume": 10})
+
+        assert exc_info.value.retry_after == 120
+        assert client._rate_limiter.retry_after == pytest.approx(120, abs=1)
+        with pytest.raises(RemiRateLimitError, match="paused"):
+            await client.update_remi({"volume": 10})
+        assert mock_session.request.call_count == 1
+
+    async def test_429_without_retry_after_uses_default(self, client: RemiApiClient, mock_session: MagicMock) -> None:
+        mock_session.request.return_value = _make_response(429, "slow down")
+
+        with pytest.raises(RemiRateLimitError) as exc_info:
+            await client.update_remi({"volume": 10})
+
+        assert exc_info.value.retry_after == RATE_LIMIT_DEFAULT_RETRY_SECONDS
+
+    async def test_503_with_retry_after_is_rate_limit(self, client: RemiApiClient, mock_session: MagicMock) -> None:
+        mock_session.request.return_value = _make_response(
+            503, "busy", {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}
+        )
+
+        with pytest.raises(RemiRateLimitError) as exc_info:
+            await client.update_remi({"volume": 10})
+
+        assert exc_info.value.retry_after == 0
+
+    async def test_read_retries_after_short_retry_after(self, client: RemiApiClient, mock_session: MagicMock) -> None:
+        mock_session.request.side_effect = [
+            _make_response(429, "slow down", {"Retry-After": "0"}),
+            _make_response(200, {"params": {}}),
+        ]
+
+        assert await client.get_config() == {"params": {}}
+
+    async def test_read_fails_when_retry_after_exceeds_deadline(
+        self, client: RemiApiClient, mock_session: MagicMock
+    ) -> None:
+        mock_session.request.return_value = _make_response(429, "slow down", {"Retry-After": "600"})
+
+        with pytest.raises(RemiRateLimitError):
+            await client.get_config()
+
+        assert mock_session.request.call_count == 1
+
+    async def test_token_bucket_delays_requests(self, client: RemiApiClient, mock_session: MagicMock) -> None:
+        client._rate_limiter = RateLimiter(requests_per_minute=6000, burst=1)
+        mock_session.request.return_value = _make_response(200, {})
+
+        await client.update_remi({"volume": 10})
+        await client.update_remi({"volume": 20})
+
+        assert mock_session.request.call_count == 2
+
+    async def test_token_bucket_wait_is_bounded(self, client: RemiApiClient, mock_session: MagicMock) -> None:
+        client._rate_limiter = RateLimiter(requests_per_minute=1, burst=1)
+        mock_session.request.return_value = _make_response(200, {})
+
+        await client.update_remi({"volume": 10})
+        with pytest.raises(RemiRateLimitError, match="rate limit"):
+            await client.update_remi({"volume": 20})
+
+    async def test_spent_budget_defers_background_polls(
+        self, client: RemiApiClient, mock_session: MagicMock
+    ) -> None:
+        client._rate_limiter = RateLimiter(requests_per_minute=6000, hourly_budget=1, burst=5)
+        mock_session.request.return_value = _make_response(200, {})
+        await client.update_remi({"volume": 10})
+
+        with client.background_requests(), pytest.raises(RemiRateLimitError, match="budget"):
+            await client._send("GET", "/parse/config")
+        await client.update_remi({"volume": 20})
+
+        assert client.budget_low
+
+
+class TestScheduling:
+    """Tests for request scheduling through the host scheduler."""
+
+    @pytest.fixture
+    def busy_client(self, client: RemiApiClient) -> RemiApiClient:
+        client._scheduler = RequestScheduler(max_concurrent=1)
+        client._scheduler.try_acquire()
+        return client
+
+    async def test_slot_is_released_after_request(self, client: RemiApiClient, mock_session: MagicMock) -> None:
+        mock_session.request.return_value = _make_response(500, "down")
+
+        with pytest.raises(RemiServerError):
+            await client._send("GET", "/parse/config")
+
+        assert client._scheduler.active == 0
+
+    async def test_queueing_counts_against_attempt_timeout(self) -> None:
+        class _SlowTransport:
+            async def request(self, method, url, payload, headers, timeout):
+                await asyncio.wait_for(asyncio.sleep(1), timeout)
+
+        scheduler = RequestScheduler(max_concurrent=1)
+        scheduler.try_acquire()
+        client = RemiApiClient(
+            MOCK_USERNAME,
+            MOCK_PASSWORD,
+            None,
+            circuit_breaker=CircuitBreaker(),
+            scheduler=scheduler,
+            rate_limiter=RateLimiter(),
+            transport=_SlowTransport(),
+        )
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.1, scheduler.release)
+        started = loop.time()
+
+        with pytest.raises(RemiTimeoutError):
+            await client._send("GET", "/parse/config", timeout=0.2)
+
+        assert loop.time() - started < 0.25
+        assert scheduler.active == 0
+
+    async def test_writes_overtake_queued_background_reads(
+        self, busy_client: RemiApiClient, mock_session: MagicMock
+    ) -> None:
+        order: list[str] = []
+
+        def _respond(method: str, url: str, **kwargs: Any) -> MagicMock:
+            order.append(method)
+            return _make_response(200, {})
+
+        mock_session.request.side_effect = _respond
+
+        async def _poll() -> None:
+            with busy_client.background_requests():
+                await busy_client.get_config()
+
+        poll = asyncio.create_task(_poll())
+        await _wait_queued(busy_client._scheduler, 1)
+        write = asyncio.create_task(busy_client.update_remi({"volume": 10}))
+        await _wait_queued(busy_client._scheduler, 2)
+        busy_client._scheduler.release()
+        await asyncio.gather(poll, write)
+
+        assert order == ["PUT", "GET"]
+
+    async def test_queued_poll_is_superseded_by_newer_poll(
+        self, busy_client: RemiApiClient, mock_session: MagicMock
+    ) -> None:
+        mock_session.request.return_value = _make_response(200, {"results": []})
+
+        async def _poll(cursor: str) -> Any:
+            with busy_client.background_requests(supersede=True):
+                return await busy_client.get_remi_changes(cursor)
+
+        old = asyncio.create_task(_poll("2024-01-01T00:00:00.000Z"))
+        await _wait_queued(busy_client._scheduler, 1)
+        new = asyncio.create_task(_poll("2024-01-01T00:05:00.000Z"))
+
+        with pytest.raises(RemiSupersededError):
+            await old
+        busy_client._scheduler.release()
+        assert await new is None
+        assert mock_session.request.call_count == 1
+
+    async def test_reads_of_one_poll_do_not_supersede_each_other(
+        self, busy_client: RemiApiClient, mock_session: MagicMock
+    ) -> None:
+        mock_session.request.return_value = _make_response(200, {"results": []})
+
+        async def _poll() -> Any:
+            return await asyncio.gather(
+                busy_client.get_remi_changes("2024-01-01T00:00:00.000Z"),
+                busy_client.get_events(updated_since="2024-01-01T00:00:00.000Z"),
+            )
+
+        with busy_client.background_requests(supersede=True):
+            task = asyncio.create_task(_poll())
+        await _wait_queued(busy_client._scheduler, 2)
+        busy_client._scheduler.release()
+
+        assert await task == [None, []]
+        assert mock_session.request.call_count == 2
+
+    async def test_unsuperseding_background_reads_are_kept(
+        self, busy_client: RemiApiClient, mock_session: MagicMock
+    ) -> None:
+        mock_session.request.return_value = _make_response(200, {"params": {}})
+
+        async def _refresh(path: str) -> Any:
+            with busy_client.background_requests():
+                return await busy_client._send("GET", path)
+
+        first = asyncio.create_task(_refresh("/parse/config"))
+        await _wait_queued(busy_client._scheduler, 1)
+        second = asyncio.create_task(_refresh("/parse/health"))
+        await _wait_queued(busy_client._scheduler, 2)
+        busy_client._scheduler.release()
+
+        await asyncio.gather(first, second)
+        assert mock_session.request.call_count == 2
+
+    async def test_interactive_reads_are_not_superseded(
+        self, busy_client: RemiApiClient, mock_session: MagicMock
+    ) -> None:
+        mock_session.request.return_value = _make_response(200, {"params": {}})
+
+        first = asyncio.create_task(busy_client._send("GET", "/parse/config"))
+        second = asyncio.create_task(busy_client._send("GET", "/parse/config"))
+        await _wait_queued(busy_client._scheduler, 2)
+        busy_client._scheduler.release()
+
+        await asyncio.gather(first, second)
+        assert mock_session.request.call_count == 2
+
+    async def test_queue_wait_is_bounded_by_timeout(self, busy_client: RemiApiClient) -> None:
+        with pytest.raises(RemiTimeoutError, match="queued"):
+            await busy_client._send("GET", "/parse/config", timeout=0.01)
+
+
+class TestInFlightReads:
+    """Tests for sharing identical in-flight reads."""
+
+    async def test_concurrent_identical_reads_share_one_request(
+        self, client: RemiApiClient, mock_session: MagicMock
+    ) -> None:
+        mock_session.request.return_value = _delayed_response(0.01, {"params": {}})
+
+        first, second = await asyncio.gather(client.get_config(), client.get_config())
+
+        assert mock_session.request.call_count == 1
+        assert first is second
+        assert not client._in_flight
+
+    async def test_different_payloads_are_not_shared(
+        self, client: RemiApiClient, mock_session: MagicMock
+    ) -> None:
+        mock_session.request.return_value = _delayed_response(0.01, {"results": []})
+
+        await asyncio.gather(
+            client._request("POST", "/parse/classes/Event", {"where": {"a": 1}, "_method": "GET"}),
+            client._request("POST", "/parse/classes/Event", {"where": {"a": 2}, "_method": "GET"}),
+        )
+
+        assert mock_session.request.call_count == 2
+
+    async def test_writes_are_not_shared(self, client: RemiApiClient, mock_session: MagicMock) -> None:
+        mock_session.request.return_value = _delayed_response(0.01, {})
+
+        await asyncio.gather(
+            client.update_remi({"volume": 10}), client.update_remi({"volume": 10})
+        )
+
+        assert mock_session.request.call_count == 2
+
+    async def test_cancelled_caller_does_not_cancel_shared_read(
+        self, client: RemiApiClient, mock_session: MagicMock
+    ) -> None:
+        mock_session.request.return_value = _delayed_response(0.01, {"params": {}})
+        first = asyncio.create_task(client.get_config())
+        second = asyncio.create_task(client.get_config())
+        await asyncio.sleep(0)
+
+        first.cancel()
+
+        assert await second == {"params": {}}
+        assert mock_session.request.call_count == 1
+
+    async def test_error_reaches_every_caller(self, client: RemiApiClient, mock_session: MagicMock) -> None:
+        mock_session.request.return_value = _make_response(404, {"error": "Not found"})
+
+        results = await asyncio.gather(
+            client.get_config(), client.get_config(), return_exceptions=True
+        )
+
+        assert all(isinstance(result, RemiClientError) for result in results)
+        assert mock_session.request.call_count == 1
+        assert not client._in_flight
+
+
+class TestResponseFingerprints:
+    """Tests for skipping the decode of unchanged read responses."""
+
+    async def test_unchanged_body_reuses_decoded_result(
+        self, client: RemiApiClient, mock_session: MagicMock
+    ) -> None:
+        mock_session.request.return_value = _make_response(200, {"params": {"a": 1}})
+
+        with patch(
+            "custom_components.urbanhello_remi_unofficial.api.json_loads",
+            wraps=json_loads,
+        ) as loads:
+            first = await client.get_config()
+            second = await client.get_config()
+
+        assert second is first
+        loads.assert_called_once()
+
+    async def test_changed_body_is_decoded(self, client: RemiApiClient, mock_session: MagicMock) -> None:
+        mock_session.request.side_effect = [
+            _make_response(200, {"params": {"a": 1}}),
+            _make_response(200, {"params": {"a": 2}}),
+        ]
+
+        first = await client.get_config()
+        second = await client.get_config()
+
+        assert first == {"params": {"a": 1}}
+        assert second == {"params": {"a": 2}}
+
+    async def test_fingerprints_are_kept_per_query(self, client: RemiApiClient, mock_session: MagicMock) -> None:
+        mock_session.request.return_value = _make_response(200, {"results": []})
+
+        first = await client._request("POST", "/parse/classes/Event", {"where": {"a": 1}, "_method": "GET"})
+        second = await client._request("POST", "/parse/classes/Event", {"where": {"a": 2}, "_method": "GET"})
+
+        assert first == second
+        assert first is not second
+
+    async def test_write_responses_are_always_decoded(
+        self, client: RemiApiClient, mock_session: MagicMock
+    ) -> None:
+        mock_session.request.return_value = _make_response(200, {"updatedAt": "2024-01-01"})
+
+        first = await client.update_remi({"volume": 10})
+        second = await client.update_remi({"volume": 10})
+
+        assert first == second
+        assert first is not second
+        assert not client._fingerprints
+
+    def test_fingerprint_cache_is_bounded(self, client: RemiApiClient) -> None:
+        for index in range(RESPONSE_FINGERPRINT_CACHE_SIZE + 5):
+            client._decode("GET", f"/parse/test/{index}", None, b'{"results": []}')
+
+        assert len(client._fingerprints) == RESPONSE_FINGERPRINT_CACHE_SIZE
+
+
+class TestHedgedReads:
+    """Tests for hedged idempotent reads."""
+
+    @pytest.fixture
+    def hedging_client(self, mock_session: MagicMock) -> RemiApiClient:
+        c = RemiApiClient(
+            MOCK_USERNAME, MOCK_PASSWORD, mock_session,
+            circuit_breaker=CircuitBreaker(), hedged_reads=True,
+        )
+        c._session_token = MOCK_SESSION_TOKEN
+        c._remi_id = MOCK_REMI_ID
+        tracker = c.latency_tracker("GET", "/parse/config")
+        for _ in range(20):
+            tracker.record(0.01)
+        return c
+
+    async def test_fast_read_is_not_hedged(self, hedging_client: RemiApiClient, mock_session: MagicMock) -> None:
+        mock_session.request.return_value = _make_response(200, {"params": {"a": 1}})
+
+        assert await hedging_client.get_config() == {"params": {"a": 1}}
+        assert mock_session.request.call_count == 1
+
+    async def test_slow_read_is_hedged_and_first_answer_wins(
+        self, hedging_client: RemiApiClient, mock_session: MagicMock
+    ) -> None:
+        mock_session.request.side_effect = [
+            _delayed_response(5, {"params": {"slow": True}}),
+            _make_response(200, {"params": {"slow": False}}),
+        ]
+
+        result = await asyncio.wait_for(hedging_client.get_config(), 1)
+
+        assert result == {"params": {"slow": False}}
+        assert mock_session.request.call_count == 2
+
+    async def test_failed_hedge_falls_back_to_primary(
+        self, hedging_client: RemiApiClient, mock_session: MagicMock
+    ) -> None:
+        mock_session.request.side_effect = [
+            _delayed_response(0.1, {"params": {"primary": True}}),
+            _make_response(400, "Bad"),
+        ]
+
+        result = await asyncio.wait_for(hedging_client.get_config(), 1)
+
+        assert result == {"params": {"primary": True}}
+
+    async def test_hedges_are_capped(self, hedging_client: RemiApiClient, mock_session: MagicMock) -> None:
+        hedging_client._hedge_budget = HedgeBudget(limit=0)
+        mock_session.request.return_value = _delayed_response(0.05, {"params": {}})
+
+        await hedging_client.get_config()
+
+        assert mock_session.request.call_count == 1
+
+    async def test_writes_are_never_hedged(self, hedging_client: RemiApiClient, mock_session: MagicMock) -> None:
+        tracker = hedging_client.latency_tracker("PUT", f"/parse/classes/Remi/{MOCK_REMI_ID}")
+        for _ in range(20):
+            tracker.record(0.01)
+        mock_session.request.return_value = _delayed_response(0.05, {})
+
+        await hedging_client.update_remi({"volume": 10})
+
+        assert mock_session.request.call_count == 1
+
+    async def test_disabled_by_default(self, client: RemiApiClient, mock_session: MagicMock) -> None:
+        tracker = client.latency_tracker("GET", "/parse/config")
+        for _ in range(20):
+            tracker.record(0.01)
+        mock_session.request.return_value = _delayed_response(0.05, {"params": {}})
+
+        await client.get_config()
+
+        assert mock_session.request.call_count == 1
+
+
+class TestReauthentication:
+    """Tests for single-flight re-authentication."""
+
+    async def test_concurrent_401s_share_one_login(self, client: RemiApiClient, mock_session: MagicMock) -> None:
+        def _respond(method: str, url: str, **kwargs: Any) -> MagicMock:
+            if kwargs["headers"]["X-Parse-Session-Token"] == "fresh":
+                return _make_response(200, {"results": []})
+            return _make_response(401, {"error": "Unauthorized"})
+
+        login_response = _make_response(200, {**MOCK_LOGIN_RESPONSE, "sessionToken": "fresh"})
+        login = _route_login(mock_session, login_response, _respond)
+
+        async def _slow_login(*args: Any) -> MagicMock:
+            await asyncio.sleep(0.01)
+            return login_response
+
+        login_response.__aenter__ = AsyncMock(side_effect=_slow_login)
+
+        results = await asyncio.gather(
+            client._request("GET", "/parse/a"),
+            client._request("GET", "/parse/b"),
+        )
+
+        assert results == [{"results": []}, {"results": []}]
+        login.assert_called_once()
+        # Two rejected requests, one login and two retries.
+        assert mock_session.request.call_count == 5
+        assert client.session_token == "fresh"
+        retry_headers = mock_session.request.call_args_list[-1].kwargs["headers"]
+        assert retry_headers["X-Parse-Session-Token"] == "fresh"
+
+    async def test_response_released_before_login(self, client: RemiApiClient, mock_session: MagicMock) -> None:
+        resp_401 = _make_response(401, {"error": "Unauthorized"})
+
+        async def _login_response(*args: Any, **kwargs: Any) -> MagicMock:
+            resp_401.__aexit__.assert_awaited_once()
+            return _make_response(200, MOCK_LOGIN_RESPONSE)
+
+        login_response = _make_response(200, MOCK_LOGIN_RESPONSE)
+        login_response.__aenter__ = AsyncMock(side_effect=_login_response)
+        _route_login(mock_session, login_response, [resp_401, _make_response(200, {})])
+
+        await client._request("GET", "/parse/test")
+
+    async def test_reauth_keeps_configured_remi(self, client: RemiApiClient, mock_session: MagicMock) -> None:
+        client.set_remi_id("remi_id_2")
+        _route_login(
+            mock_session,
+            _make_response(200, MOCK_LOGIN_RESPONSE),
+            [_make_response(401, {"error": "Unauthorized"}), _make_response(200, {})],
+        )
+
+        await client._request("GET", "/parse/test")
+
+        assert client.remi_id == "remi_id_2"
+
+    async def test_failed_login_backs_off(self, client: RemiApiClient, mock_session: MagicMock) -> None:
+        login = _route_login(
+            mock_session,
+            _make_response(401, {"error": "Invalid"}),
+            lambda *args, **kwargs: _make_response(401, {"error": "Unauthorized"}),
+        )
+
+        with pytest.raises(RemiAuthError, match="Invalid username"):
+            await client._request("GET", "/parse/test")
+        with pytest.raises(RemiAuthError, match="suspended"):
+            await client._request("GET", "/parse/test")
+
+        login.assert_called_once()
+
+    @pytest.mark.parametrize(
+        "login_response",
+        [
+            _make_response(404, {"code": 101, "error": "Invalid username/password."}),
+            _make_response(502, {"error": "Bad Gateway"}),
+        ],
+    )
+    async def test_any_failed_login_backs_off(
+        self, client: RemiApiClient, mock_session: MagicMock, login_response: MagicMock
+    ) -> None:
+        login = _route_login(
+            mock_session,
+            login_response,
+            lambda *args, **kwargs: _make_response(401, {"error": "Unauthorized"}),
+        )
+
+        for _ in range(5):
+            with pytest.raises(RemiApiError):
+                await client._request("GET", "/parse/test")
+
+        login.assert_called_once()
+
+    async def test_backoff_grows_exponentially(self, client: RemiApiClient, mock_session: MagicMock) -> None:
+        _route_login(
+            mock_session,
+            _make_response(401, {"error": "Invalid"}),
+            lambda *args, **kwargs: _make_response(401, {"error": "Unauthorized"}),
+        )
+        clock = [100.0]
+
+        with patch(
+            "custom_components.urbanhello_remi_unofficial.api.time.monotonic",
+            side_effect=lambda: clock[0],
+        ):
+            with pytest.raises(RemiAuthError):
+                await client._request("GET", "/parse/test")
+            assert client._login_blocked_until == 100.0 + 5
+
+            clock[0] = 200.0
+            with pytest.raises(RemiAuthError):
+                await client._request("GET", "/parse/test")
+
+        assert client._login_blocked_until == 200.0 + 10
+
+
+class TestSessionManagement:
+    """Tests for session validation and token refresh notifications."""
+
+    async def test_validate_session_valid(self, client: RemiApiClient, mock_session: MagicMock) -> None:
+        mock_session.request.return_value = _make_response(200, {"objectId": "user"})
+
+        assert await client.validate_session() is True
+        assert mock_session.request.call_args.args == ("GET", f"{API_BASE_URL}/parse/users/me")
+
+    @pytest.mark.parametrize("status", [400, 401, 403])
+    async def test_validate_session_invalid(self, client: RemiApiClient, mock_session: MagicMock, status: int) -> None:
+        mock_session.request.return_value = _make_response(status, {"code": 209})
+
+        assert await client.validate_session() is False
+
+    async def test_validate_session_without_token(self, mock_session: MagicMock) -> None:
+        c = RemiApiClient(MOCK_USERNAME, MOCK_PASSWORD, mock_session)
+
+        assert await c.validate_session() is False
+        mock_session.request.assert_not_called()
+
+    async def test_validate_session_server_error_raises(self, client: RemiApiClient, mock_session: MagicMock) -> None:
+        mock_session.request.return_value = _make_response(500, {"error": "down"})
+
+        with pytest.raises(RemiApiError):
+            await client.validate_session()
+
+    async def test_refresh_session_notifies_listener(self, client: RemiApiClient, mock_session: MagicMock) -> None:
+        listener = MagicMock()
+        client.set_session_token_listener(listener)
+        mock_session.request.return_value = _make_response(200, {**MOCK_LOGIN_RESPONSE, "sessionToken": "fresh"})
+
+        await client.refresh_session()
+
+        listener.assert_called_once_with("fresh")
+
+    async def test_reauth_on_401_notifies_listener(self, client: RemiApiClient, mock_session: MagicMock) -> None:
+        listener = MagicMock()
+        client.set_session_token_listener(listener)
+        _route_login(
+            mock_session,
+            _make_response(200, {**MOCK_LOGIN_RESPONSE, "sessionToken": "fresh"}),
+            [_make_response(401, {"error": "Unauthorized"}), _make_response(200, {})],
+        )
+
+        await client._request("GET", "/parse/test")
+
+        listener.assert_called_once_with("fresh")
+
+
 class TestGetRemi:
     """Tests for RemiApiClient.get_remi()."""
 
@@ -192,6 +1112,38 @@ class TestGetRemi:
 
         assert result == MOCK_REMI_DATA
 
+    async def test_get_remi_sends_keys_projection(self, client: RemiApiClient, mock_session: MagicMock) -> None:
+        mock_session.request.return_value = _make_response(200, {"results": [MOCK_REMI_DATA]})
+
+        await client.get_remi(["temp", "face"])
+
+        payload = mock_session.request.call_args.kwargs["json"]
+        assert payload["keys"] == "temp,face"
+
+    async def test_get_remi_without_keys_fetches_full_object(self, client: RemiApiClient, mock_session: MagicMock) -> None:
+        mock_session.request.return_value = _make_response(200, {"results": [MOCK_REMI_DATA]})
+
+        await client.get_remi()
+
+        assert "keys" not in mock_session.request.call_args.kwargs["json"]
+
+    async def test_get_remi_changes_filters_on_updated_at(self, client: RemiApiClient, mock_session: MagicMock) -> None:
+        mock_session.request.return_value = _make_response(200, {"results": [MOCK_REMI_DATA]})
+
+        result = await client.get_remi_changes("2024-01-01T00:00:00.000Z", ["temp"])
+
+        assert result == MOCK_REMI_DATA
+        payload = mock_session.request.call_args.kwargs["json"]
+        assert payload["where"]["updatedAt"] == {
+            "$gt": {"__type": "Date", "iso": "2024-01-01T00:00:00.000Z"}
+        }
+        assert payload["keys"] == "temp"
+
+    async def test_get_remi_changes_returns_none_when_unchanged(self, client: RemiApiClient, mock_session: MagicMock) -> None:
+        mock_session.request.return_value = _make_response(200, {"results": []})
+
+        assert await client.get_remi_changes("2024-01-01T00:00:00.000Z") is None
+
     async def test_get_remi_empty_results_raises(self, client: RemiApiClient, mock_session: MagicMock) -> None:
         mock_session.request.return_value = _make_response(200, {"results": []})
 
@@ -210,6 +1162,31 @@ class TestGetEvents:
 
         assert result == events
 
+    async def test_get_events_sends_keys_projection(self, client: RemiApiClient, mock_session: MagicMock) -> None:
+        mock_session.request.return_value = _make_response(200, {"results": []})
+
+        await client.get_events(["enabled", "event_time"])
+
+        payload = mock_session.request.call_args.kwargs["json"]
+        assert payload["keys"] == "enabled,event_time"
+
+    async def test_get_events_updated_since(self, client: RemiApiClient, mock_session: MagicMock) -> None:
+        mock_session.request.return_value = _make_response(200, {"results": []})
+
+        await client.get_events(updated_since="2024-01-01T00:00:00.000Z")
+
+        where = mock_session.request.call_args.kwargs["json"]["where"]
+        assert where["remi"]["objectId"] == MOCK_REMI_ID
+        assert where["updatedAt"]["$gt"]["iso"] == "2024-01-01T00:00:00.000Z"
+
+    async def test_count_events(self, client: RemiApiClient, mock_session: MagicMock) -> None:
+        mock_session.request.return_value = _make_response(200, {"results": [], "count": 3})
+
+        assert await client.count_events() == 3
+        payload = mock_session.request.call_args.kwargs["json"]
+        assert payload["count"] == 1
+        assert payload["limit"] == 0
+
     async def test_get_events_empty(self, client: RemiApiClient, mock_session: MagicMock) -> None:
         mock_session.request.return_value = _make_response(200, {"results": []})
 
@@ -217,6 +1194,73 @@ class TestGetEvents:
 
         assert result == []
 
+    async def test_get_events_pages_with_object_id_cursor(self, client: RemiApiClient, mock_session: MagicMock) -> None:
+        first_page = [{"objectId": f"ev{index:03}"} for index in range(QUERY_PAGE_SIZE)]
+        mock_session.request.side_effect = [
+            _make_response(200, {"results": first_page}),
+            _make_response(200, {"results": [{"objectId": "ev999"}]}),
+        ]
+
+        result = await client.get_events(updated_since="2024-01-01T00:00:00.000Z")
+
+        assert len(result) == QUERY_PAGE_SIZE + 1
+        first, second = (call.kwargs["json"] for call in mock_session.request.call_args_list)
+        assert first["order"] == "objectId"
+        assert first["limit"] == QUERY_PAGE_SIZE
+        assert "objectId" not in first["where"]
+        assert second["where"]["objectId"] == {"$gt": first_page[-1]["objectId"]}
+        assert second["where"]["updatedAt"] == first["where"]["updatedAt"]
+
+    async def test_iter_events_yields_before_fetching_next_page(
+        self, client: RemiApiClient, mock_session: MagicMock
+    ) -> None:
+        mock_session.request.side_effect = [
+            _make_response(200, {"results": [{"objectId": f"ev{index}"} for index in range(QUERY_PAGE_SIZE)]}),
+            _make_response(200, {"results": []}),
+        ]
+        events = client.iter_events()
+
+        assert (await anext(events))["objectId"] == "ev0"
+        assert mock_session.request.call_count == 1
+        assert len([event async for event in events]) == QUERY_PAGE_SIZE - 1
+        assert mock_session.request.call_count == 2
+
+
+class TestAccountQueries:
+    """Tests for queries covering several devices of the account."""
+
+    async def test_get_remis_uses_in_query(self, client: RemiApiClient, mock_session: MagicMock) -> None:
+        mock_session.request.return_value = _make_response(
+            200, {"results": [{"objectId": "r1", "name": "A"}, {"objectId": "r2", "name": "B"}]}
+        )
+
+        result = await client.get_remis(["r1", "r2"], ["name"])
+
+        payload = mock_session.request.call_args.kwargs["json"]
+        assert payload["where"] == {"objectId": {"$in": ["r1", "r2"]}}
+        assert payload["keys"] == "name"
+        assert result == {"r1": {"objectId": "r1", "name": "A"}, "r2": {"objectId": "r2", "name": "B"}}
+
+    async def test_get_events_by_remi_groups_events(self, client: RemiApiClient, mock_session: MagicMock) -> None:
+        mock_session.request.return_value = _make_response(
+            200,
+            {
+                "results": [
+                    {"objectId": "e1", "remi": {"__type": "Pointer", "className": "Remi", "objectId": "r1"}},
+                    {"objectId": "e2", "remi": {"__type": "Pointer", "className": "Remi", "objectId": "r1"}},
+                ]
+            },
+        )
+
+        result = await client.get_events_by_remi(["r1", "r2"], ["time", "enabled"])
+
+        payload = mock_session.request.call_args.kwargs["json"]
+        pointers = payload["where"]["remi"]["$in"]
+        assert [pointer["objectId"] for pointer in pointers] == ["r1", "r2"]
+        assert payload["keys"] == "enabled,remi,time"
+        assert [event["objectId"] for event in result["r1"]] == ["e1", "e2"]
+        assert result["r2"] == []
+
 
 class TestEventCrud:
     """Tests for alarm event CRUD methods."""
@@ -246,3 +1290,89 @@ class TestEventCrud:
         mock_session.request.assert_called_once()
         call_args = mock_session.request.call_args
         assert call_args.args[0] == "DELETE"
+
+
+class TestBatch:
+    """Tests for RemiBatch and /parse/batch support."""
+
+    async def test_empty_batch_sends_nothing(self, client: RemiApiClient, mock_session: MagicMock) -> None:
+        result = await client.batch().commit()
+
+        assert result == []
+        mock_session.request.assert_not_called()
+
+    async def test_single_operation_uses_plain_request(self, client: RemiApiClient, mock_session: MagicMock) -> None:
+        mock_session.request.return_value = _make_response(200, {"updatedAt": "2024-01-01"})
+        batch = client.batch()
+        batch.update_remi({"volume": 30})
+
+        result = await batch.commit()
+
+        assert result == [{"updatedAt": "2024-01-01"}]
+        call_args = mock_session.request.call_args
+        assert call_args.args[0] == "PUT"
+        assert call_args.args[1] == f"{API_BASE_URL}/parse/classes/Remi/{MOCK_REMI_ID}"
+
+    async def test_multiple_operations_sent_in_one_request(self, client: RemiApiClient, mock_session: MagicMock) -> None:
+        mock_session.request.return_value = _make_response(
+            200,
+            [
+                {"success": {"updatedAt": "2024-01-01"}},
+                {"success": {"objectId": "new_ev"}},
+                {"success": {}},
+            ],
+        )
+        batch = client.batch()
+        batch.update_remi({"volume": 30})
+        batch.create_event({"name": "Wake"})
+        batch.delete_event("ev1")
+        assert len(batch) == 3
+
+        result = await batch.commit()
+
+        assert result == [{"updatedAt": "2024-01-01"}, {"objectId": "new_ev"}, {}]
+        mock_session.request.assert_called_once()
+        call_args = mock_session.request.call_args
+        assert call_args.args[1] == f"{API_BASE_URL}/parse/batch"
+        requests = call_args.kwargs["json"]["requests"]
+        assert requests[0] == {
+            "method": "PUT",
+            "path": f"/parse/classes/Remi/{MOCK_REMI_ID}",
+            "body": {"volume": 30},
+        }
+        assert requests[1]["body"]["remi"]["objectId"] == MOCK_REMI_ID
+        assert requests[2] == {"method": "DELETE", "path": "/parse/classes/Event/ev1"}
+        assert len(batch) == 0
+
+    async def test_large_batch_is_chunked(self, client: RemiApiClient, mock_session: MagicMock) -> None:
+        mock_session.request.side_effect = [
+            _make_response(200, [{"success": {}}] * 50),
+            _make_response(200, [{"success": {}}] * 10),
+        ]
+        batch = client.batch()
+        for index in range(60):
+            batch.update_event(f"ev{index}", {"enabled": False})
+
+        result = await batch.commit()
+
+        assert len(result) == 60
+        assert mock_session.request.call_count == 2
+
+    async def test_failed_operation_raises_with_per_operation_results(self, client: RemiApiClient, mock_session: MagicMock) -> None:
+        mock_session.request.return_value = _make_response(
+            200,
+            [
+                {"success": {"updatedAt": "2024-01-01"}},
+                {"error": {"code": 101, "error": "Object not found."}},
+            ],
+        )
+        batch = client.batch()
+        batch.update_event("ev1", {"enabled": True})
+        batch.delete_event("missing")
+
+        with pytest.raises(RemiBatchError, match="Object not found") as exc_info:
+            await batch.commit()
+
+        results = exc_info.value.results
+        assert results[0] == {"updatedAt": "2024-01-01"}
+        assert isinstance(results[1], RemiApiError)
@@ -7,9 +7,11 @@ import pytest
 from homeassistant import config_entries
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
 from homeassistant.data_entry_flow import FlowResultType
+from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.urbanhello_remi_unofficial.api import RemiApiError, RemiAuthError
 from custom_components.urbanhello_remi_unofficial.const import (
+    CONF_CONDITIONAL_POLLING,
     CONF_INSTALLATION_ID,
     CONF_REMI_ID,
     CONF_SESSION_TOKEN,
@@ -178,3 +180,25 @@ class TestConfigFlowUserStep:
 
         assert result2["type"] == FlowResultType.ABORT
         assert result2["reason"] == "already_configured"
+
+
+class TestOptionsFlow:
+    """Tests for the options flow."""
+
+    async def test_options_flow_saves_options(self, hass, mock_config_entry_data):
+        entry = MockConfigEntry(
+            domain=DOMAIN, data=mock_config_entry_data, unique_id=MOCK_REMI_ID
+        )
+        entry.add_to_hass(hass)
+
+        result = await hass.config_entries.options.async_init(entry.entry_id)
+
+        assert result["type"] == FlowResultType.FORM
+        assert result["step_id"] == "init"
+
+        result = await hass.config_entries.options.async_configure(
+            result["flow_id"], {CONF_CONDITIONAL_POLLING: True}
+        )
+
+        assert result["type"] == FlowResultType.CREATE_ENTRY
+        assert entry.options[CONF_CONDITIONAL_POLLING] is True
@@ -1,15 +1,48 @@
 """Tests for the RemiDataUpdateCoordinator."""
 from __future__ import annotations
 
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
 
-from custom_components.urbanhello_remi_unofficial.api import RemiApiError
+from custom_components.urbanhello_remi_unofficial.api import (
+    RemiApiClient,
+    RemiApiError,
+    RemiAuthError,
+    RemiBatchError,
+    RemiRateLimitError,
+    RemiSupersededError,
+    RemiTimeoutError,
+)
+from custom_components.urbanhello_remi_unofficial.const import (
+    ADAPTIVE_POLL_FAST_SECONDS,
+    ALARM_IDLE_POLL_SECONDS,
+    ALARM_WINDOW_POLL_SECONDS,
+    BUDGET_LOW_POLL_FACTOR,
+    CONNECTION_KEEPALIVE_SECONDS,
+    LIVEQUERY_FALLBACK_POLL_SECONDS,
+    PREWARM_LEAD_SECONDS,
+    SCAN_INTERVAL_SECONDS,
+    STATIC_POLL_SECONDS,
+    WRITE_RECONCILE_DELAY_SECONDS,
+)
 from custom_components.urbanhello_remi_unofficial.coordinator import (
+    RemiAccountFetcher,
     RemiDataUpdateCoordinator,
 )
+from custom_components.urbanhello_remi_unofficial.resilience import (
+    CircuitBreaker,
+    RateLimiter,
+)
+from custom_components.urbanhello_remi_unofficial.scheduler import RequestScheduler
+from custom_components.urbanhello_remi_unofficial.transport import TransportResponse
+from custom_components.urbanhello_remi_unofficial.write_queue import RemiWriteQueue
 
 from .conftest import (
     MOCK_CONFIG_DATA,
@@ -19,11 +52,21 @@ from .conftest import (
     mock_api_client,
 )
 
+DT_NOW = "custom_components.urbanhello_remi_unofficial.coordinator.dt_util.now"
+
+
+async def _aiter(items):
+    """Yield ``items`` like a paged API iterator."""
+    for item in items:
+        yield item
+
 
 @pytest.fixture
-def coordinator(hass, mock_api_client):
+async def coordinator(hass, mock_api_client):
     """Return a RemiDataUpdateCoordinator with a mock client."""
-    return RemiDataUpdateCoordinator(hass, mock_api_client)
+    coordinator = RemiDataUpdateCoordinator(hass, mock_api_client)
+    yield coordinator
+    await coordinator.async_shutdown()
 
 
 class TestCoordinatorProperties:
@@ -65,12 +108,55 @@ class TestAsyncUpdateData:
         mock_api_client.get_remi.assert_called_once()
         mock_api_client.get_events.assert_called_once()
 
+    async def test_update_data_fetches_full_objects_without_tracked_fields(self, coordinator, mock_api_client):
+        await coordinator._async_update_data()
+
+        mock_api_client.get_remi.assert_called_once_with(None)
+        mock_api_client.get_events.assert_called_once_with(None)
+
+    async def test_update_data_projects_tracked_fields(self, coordinator, mock_api_client):
+        coordinator.async_track_fields(("temp", "name"), ("enabled",))
+
+        await coordinator._async_update_data()
+
+        mock_api_client.get_remi.assert_called_once_with(["name", "temp"])
+        mock_api_client.get_events.assert_called_once_with(["enabled"])
+
+    async def test_unchanged_poll_does_not_notify_listeners(self, coordinator, mock_api_client):
+        listener = MagicMock()
+        unsub = coordinator.async_add_listener(listener)
+        await coordinator.async_refresh()
+        listener.reset_mock()
+
+        await coordinator.async_refresh()
+
+        listener.assert_not_called()
+        unsub()
+        await coordinator.async_shutdown()
+
     async def test_update_data_api_error_raises_update_failed(self, coordinator, mock_api_client):
         mock_api_client.get_remi.side_effect = RemiApiError("Connection refused")
 
         with pytest.raises(UpdateFailed, match="Error communicating with Remi API"):
             await coordinator._async_update_data()
 
+    async def test_update_data_polls_in_background(self, coordinator, mock_api_client):
+        await coordinator._async_update_data()
+
+        mock_api_client.background_requests.assert_called_once()
+
+    async def test_superseded_poll_keeps_current_data(self, coordinator, mock_api_client):
+        coordinator.data = {"remi": MOCK_REMI_DATA, "events": []}
+        mock_api_client.get_remi.side_effect = RemiSupersededError("superseded")
+
+        assert await coordinator._async_update_data() is coordinator.data
+
+    async def test_superseded_first_poll_fails(self, coordinator, mock_api_client):
+        mock_api_client.get_remi.side_effect = RemiSupersededError("superseded")
+
+        with pytest.raises(UpdateFailed):
+            await coordinator._async_update_data()
+
 
 class TestAsyncSetup:
     """Tests for async_setup."""
@@ -88,3 +174,819 @@ class TestAsyncSetup:
 
         assert coordinator.faces == []
         assert coordinator.config_params == {}
+
+
+class TestQueuedRemiUpdates:
+    """Tests for coalesced Remi writes."""
+
+    async def test_concurrent_updates_merge_into_one_write(self, hass, mock_api_client):
+        coordinator = RemiDataUpdateCoordinator(hass, mock_api_client, write_coalesce_window=0.01)
+        coordinator.async_request_refresh = AsyncMock()
+
+        await asyncio.gather(
+            coordinator.async_queue_remi_update({"volume": 10}),
+            coordinator.async_queue_remi_update({"volume": 20}),
+            coordinator.async_queue_remi_update({"luminosity": 70}),
+        )
+
+        mock_api_client.update_remi.assert_awaited_once_with({"volume": 20, "luminosity": 70})
+        coordinator.async_request_refresh.assert_not_called()
+
+        async_fire_time_changed(
+            hass, dt_util.utcnow() + timedelta(seconds=WRITE_RECONCILE_DELAY_SECONDS)
+        )
+        await hass.async_block_till_done()
+        coordinator.async_request_refresh.assert_awaited_once()
+
+    async def test_updates_after_flush_start_new_write(self, hass, mock_api_client):
+        coordinator = RemiDataUpdateCoordinator(hass, mock_api_client, write_coalesce_window=0)
+        coordinator.async_request_refresh = AsyncMock()
+
+        await coordinator.async_queue_remi_update({"volume": 10})
+        await coordinator.async_queue_remi_update({"volume": 20})
+
+        assert mock_api_client.update_remi.await_count == 2
+        await coordinator.async_shutdown()
+
+    async def test_write_error_propagates_to_every_caller(self, hass, mock_api_client):
+        coordinator = RemiDataUpdateCoordinator(hass, mock_api_client, write_coalesce_window=0.01)
+        coordinator.async_request_refresh = AsyncMock()
+        mock_api_client.update_remi.side_effect = RemiApiError("boom")
+
+        results = await asyncio.gather(
+            coordinator.async_queue_remi_update({"volume": 10}),
+            coordinator.async_queue_remi_update({"volume": 20}),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, RemiApiError) for result in results)
+        coordinator.async_request_refresh.assert_not_awaited()
+
+
+class TestFieldTracking:
+    """Tests for async_track_fields."""
+
+    def test_shared_fields_are_reference_counted(self, coordinator):
+        untrack_first = coordinator.async_track_fields(("temp", "rssi"))
+        untrack_second = coordinator.async_track_fields(("temp",), ("enabled",))
+
+        assert coordinator.remi_keys == ["rssi", "temp"]
+        assert coordinator.event_keys == ["enabled"]
+
+        untrack_first()
+        assert coordinator.remi_keys == ["temp"]
+
+        untrack_second()
+        assert coordinator.remi_keys is None
+        assert coordinator.event_keys is None
+
+
+class TestConditionalPolling:
+    """Tests for conditional polling via updatedAt."""
+
+    @pytest.fixture
+    def conditional_coordinator(self, hass, mock_api_client):
+        coordinator = RemiDataUpdateCoordinator(hass, mock_api_client, conditional_polling=True)
+        mock_api_client.get_remi_changes = AsyncMock(return_value=None)
+        mock_api_client.count_events = AsyncMock(return_value=1)
+        mock_api_client.iter_events = MagicMock(side_effect=lambda *args, **kwargs: _aiter([]))
+        return coordinator
+
+    async def _prime(self, coordinator, mock_api_client):
+        mock_api_client.get_remi.return_value = {**MOCK_REMI_DATA, "updatedAt": "2024-01-01T00:00:00.000Z"}
+        mock_api_client.get_events.return_value = [
+            {**MOCK_EVENT_DATA[0], "updatedAt": "2024-01-02T00:00:00.000Z"}
+        ]
+        coordinator.data = await coordinator._async_update_data()
+        mock_api_client.get_remi.reset_mock()
+        mock_api_client.get_events.reset_mock()
+        mock_api_client.get_events.return_value = []
+        coordinator.async_expire_events()
+
+    async def test_failed_event_check_stays_due(self, conditional_coordinator, mock_api_client):
+        await self._prime(conditional_coordinator, mock_api_client)
+        mock_api_client.count_events.side_effect = RemiTimeoutError("timed out")
+
+        with pytest.raises(UpdateFailed):
+            await conditional_coordinator._async_update_data()
+
+        assert conditional_coordinator._event_tier.due
+
+    async def test_first_poll_fetches_full_objects(self, conditional_coordinator, mock_api_client):
+        await conditional_coordinator._async_update_data()
+
+        mock_api_client.get_remi.assert_called_once()
+        mock_api_client.get_remi_changes.assert_not_called()
+
+    async def test_unchanged_poll_returns_cached_data(self, conditional_coordinator, mock_api_client):
+        await self._prime(conditional_coordinator, mock_api_client)
+        cached = conditional_coordinator.data
+
+        result = await conditional_coordinator._async_update_data()
+
+        assert result is cached
+        mock_api_client.get_remi.assert_not_called()
+        mock_api_client.get_remi_changes.assert_awaited_once_with("2024-01-01T00:00:00.000Z", None)
+        mock_api_client.get_events.assert_not_called()
+        mock_api_client.iter_events.assert_called_once_with(
+            None, updated_since="2024-01-02T00:00:00.000Z"
+        )
+
+    async def test_changed_objects_are_merged(self, conditional_coordinator, mock_api_client):
+        await self._prime(conditional_coordinator, mock_api_client)
+        mock_api_client.get_remi_changes.return_value = {
+            "objectId": MOCK_REMI_DATA["objectId"],
+            "temp": 160,
+            "updatedAt": "2024-01-03T00:00:00.000Z",
+        }
+        mock_api_client.iter_events.side_effect = lambda *args, **kwargs: _aiter(
+            [{"objectId": "event_id_1", "enabled": False, "updatedAt": "2024-01-03T00:00:00.000Z"}]
+        )
+
+        result = await conditional_coordinator._async_update_data()
+
+        assert result["remi"]["temp"] == 160
+        assert result["remi"]["name"] == MOCK_REMI_DATA["name"]
+        assert result["events"][0]["enabled"] is False
+        assert result["events"][0]["name"] == "Morning Alarm"
+
+    async def test_count_mismatch_refetches_events(self, conditional_coordinator, mock_api_client):
+        await self._prime(conditional_coordinator, mock_api_client)
+        mock_api_client.count_events.return_value = 0
+
+        result = await conditional_coordinator._async_update_data()
+
+        assert result["events"] == []
+        mock_api_client.iter_events.assert_called_once()
+        mock_api_client.get_events.assert_awaited_once_with(None)
+
+    async def test_changed_projection_triggers_full_fetch(self, conditional_coordinator, mock_api_client):
+        await self._prime(conditional_coordinator, mock_api_client)
+        conditional_coordinator.async_track_fields(("rssi",))
+
+        await conditional_coordinator._async_update_data()
+
+        mock_api_client.get_remi.assert_called_once_with(["rssi"])
+        mock_api_client.get_remi_changes.assert_not_called()
+
+
+class TestPrewarm:
+    """Tests for warming up the connection before scheduled polls."""
+
+    async def test_warms_up_before_next_poll(self, hass, mock_api_client):
+        coordinator = RemiDataUpdateCoordinator(hass, mock_api_client, prewarm=True)
+        # An offline device is polled after twice the base interval, longer
+        # than the connection keep-alive.
+        mock_api_client.get_remi.return_value = {**MOCK_REMI_DATA, "online": False}
+        await coordinator._async_update_data()
+        interval = 2 * SCAN_INTERVAL_SECONDS
+        assert interval > CONNECTION_KEEPALIVE_SECONDS
+
+        async_fire_time_changed(
+            hass,
+            dt_util.utcnow() + timedelta(seconds=interval - PREWARM_LEAD_SECONDS - 1),
+        )
+        await hass.async_block_till_done()
+        mock_api_client.warm_up.assert_not_called()
+
+        async_fire_time_changed(
+            hass,
+            dt_util.utcnow() + timedelta(seconds=interval - PREWARM_LEAD_SECONDS + 1),
+        )
+        await hass.async_block_till_done()
+        mock_api_client.warm_up.assert_awaited_once()
+
+    async def test_no_warm_up_within_keepalive(self, hass, mock_api_client):
+        coordinator = RemiDataUpdateCoordinator(hass, mock_api_client, prewarm=True)
+        await coordinator._async_update_data()
+
+        async_fire_time_changed(
+            hass, dt_util.utcnow() + timedelta(seconds=SCAN_INTERVAL_SECONDS)
+        )
+        await hass.async_block_till_done()
+
+        assert coordinator._unsub_prewarm is None
+        mock_api_client.warm_up.assert_not_called()
+
+    async def test_warm_up_errors_are_ignored(self, hass, mock_api_client):
+        coordinator = RemiDataUpdateCoordinator(hass, mock_api_client, prewarm=True)
+        mock_api_client.warm_up.side_effect = RemiApiError("offline")
+
+        await coordinator._async_prewarm(None)
+
+    async def test_shutdown_cancels_warm_up(self, hass, mock_api_client):
+        coordinator = RemiDataUpdateCoordinator(hass, mock_api_client, prewarm=True)
+        mock_api_client.get_remi.return_value = {**MOCK_REMI_DATA, "online": False}
+        await coordinator._async_update_data()
+        assert coordinator._unsub_prewarm is not None
+
+        await coordinator.async_shutdown()
+        async_fire_time_changed(
+            hass, dt_util.utcnow() + timedelta(seconds=2 * SCAN_INTERVAL_SECONDS)
+        )
+        await hass.async_block_till_done()
+
+        mock_api_client.warm_up.assert_not_called()
+
+    async def test_disabled_by_default(self, hass, coordinator, mock_api_client):
+        await coordinator._async_update_data()
+
+        async_fire_time_changed(
+            hass, dt_util.utcnow() + timedelta(seconds=SCAN_INTERVAL_SECONDS)
+        )
+        await hass.async_block_till_done()
+
+        mock_api_client.warm_up.assert_not_called()
+
+
+class TestPushUpdates:
+    """Tests for applying LiveQuery changes."""
+
+    @pytest.fixture
+    def primed_coordinator(self, coordinator):
+        coordinator.data = {"remi": dict(MOCK_REMI_DATA), "events": list(MOCK_EVENT_DATA)}
+        return coordinator
+
+    def test_remi_update_is_merged(self, primed_coordinator):
+        primed_coordinator.async_apply_push(
+            "update", "Remi", {"objectId": MOCK_REMI_DATA["objectId"], "temp": 150}
+        )
+
+        assert primed_coordinator.remi["temp"] == 150
+        assert primed_coordinator.remi["name"] == MOCK_REMI_DATA["name"]
+
+    def test_event_update_keeps_other_fields(self, primed_coordinator):
+        primed_coordinator.async_apply_push(
+            "update", "Event", {"objectId": "event_id_1", "enabled": False}
+        )
+
+        assert primed_coordinator.events[0]["enabled"] is False
+        assert primed_coordinator.events[0]["name"] == "Morning Alarm"
+
+    def test_event_create_and_delete(self, primed_coordinator):
+        primed_coordinator.async_apply_push("create", "Event", {"objectId": "new", "name": "Nap"})
+        assert [e["objectId"] for e in primed_coordinator.events] == ["event_id_1", "new"]
+
+        primed_coordinator.async_apply_push("delete", "Event", {"objectId": "event_id_1"})
+        assert [e["objectId"] for e in primed_coordinator.events] == ["new"]
+
+    def test_ignored_before_first_refresh(self, coordinator):
+        coordinator.async_apply_push("update", "Remi", {"temp": 150})
+
+        assert coordinator.data is None
+
+    async def test_connection_changes_poll_interval(self, hass, coordinator):
+        coordinator.async_set_push_connected(True)
+        assert coordinator.update_interval == timedelta(seconds=LIVEQUERY_FALLBACK_POLL_SECONDS)
+
+        coordinator.async_set_push_connected(False)
+        assert coordinator.update_interval == timedelta(seconds=SCAN_INTERVAL_SECONDS)
+        await hass.async_block_till_done()
+        await coordinator.async_shutdown()
+
+
+class TestAccountFetcher:
+    """Tests for polling several devices of one account together."""
+
+    @pytest.fixture
+    def devices(self, hass):
+        fetcher = RemiAccountFetcher()
+        coordinators = []
+        for remi_id in ("remi_a", "remi_b"):
+            client = MagicMock()
+            client.remi_id = remi_id
+            client.get_remis = AsyncMock(
+                return_value={
+                    "remi_a": {"objectId": "remi_a", "name": "A"},
+                    "remi_b": {"objectId": "remi_b", "name": "B"},
+                }
+            )
+            client.get_events_by_remi = AsyncMock(
+                return_value={"remi_a": [{"objectId": "e1"}], "remi_b": []}
+            )
+            coordinator = RemiDataUpdateCoordinator(hass, client, account_fetcher=fetcher)
+            fetcher.async_register(coordinator)
+            coordinators.append(coordinator)
+        return fetcher, coordinators
+
+    async def test_single_device_polls_on_its_own(self, hass, mock_api_client):
+        fetcher = RemiAccountFetcher()
+        coordinator = RemiDataUpdateCoordinator(hass, mock_api_client, account_fetcher=fetcher)
+        fetcher.async_register(coordinator)
+
+        await coordinator._async_update_data()
+
+        mock_api_client.get_remi.assert_awaited_once()
+
+    async def test_one_query_pair_serves_every_device(self, devices):
+        _, (first, second) = devices
+
+        data = await first._async_update_data()
+
+        assert data == {"remi": {"objectId": "remi_a", "name": "A"}, "events": [{"objectId": "e1"}]}
+        assert second.data == {"remi": {"objectId": "remi_b", "name": "B"}, "events": []}
+        first.client.get_remis.assert_awaited_once_with(["remi_a", "remi_b"], None)
+        second.client.get_remis.assert_not_called()
+        await second.async_shutdown()
+
+    async def test_unchanged_results_are_not_pushed(self, devices):
+        _, (first, second) = devices
+        await first._async_update_data()
+        listener = MagicMock()
+        unsub = second.async_add_listener(listener)
+
+        await first._async_update_data()
+
+        listener.assert_not_called()
+        unsub()
+        await second.async_shutdown()
+
+    async def test_concurrent_polls_share_one_fetch(self, devices):
+        _, (first, second) = devices
+
+        await asyncio.gather(first._async_update_data(), second._async_update_data())
+
+        assert first.client.get_remis.await_count + second.client.get_remis.await_count == 1
+        await first.async_shutdown()
+        await second.async_shutdown()
+
+    async def test_projections_are_merged(self, devices):
+        _, (first, second) = devices
+        first.async_track_fields(("name",), ("enabled",))
+        second.async_track_fields(("temp",), ("name",))
+
+        await first._async_update_data()
+
+        first.client.get_remis.assert_awaited_once_with(["remi_a", "remi_b"], ["name", "temp"])
+        first.client.get_events_by_remi.assert_awaited_once_with(
+            ["remi_a", "remi_b"], ["enabled", "name"]
+        )
+        await second.async_shutdown()
+
+    async def test_missing_device_raises_update_failed(self, devices):
+        _, (first, second) = devices
+        first.client.get_remis.return_value = {"remi_b": {"objectId": "remi_b"}}
+
+        with pytest.raises(UpdateFailed):
+            await first._async_update_data()
+        await second.async_shutdown()
+
+    def test_unregister(self, devices):
+        fetcher, (first, _) = devices
+
+        assert fetcher.shared
+        fetcher.async_register(first)()
+        assert not fetcher.shared
+        assert fetcher.devices == ["remi_b"]
+
+
+class TestRequestBudget:
+    """Tests for slowing down when the hourly request budget runs low."""
+
+    async def test_low_budget_stretches_poll_interval(self, coordinator, mock_api_client):
+        mock_api_client.budget_low = True
+
+        await coordinator._async_update_data()
+
+        assert coordinator.update_interval == timedelta(
+            seconds=SCAN_INTERVAL_SECONDS * BUDGET_LOW_POLL_FACTOR
+        )
+
+    async def test_poll_interval_recovers(self, coordinator, mock_api_client):
+        mock_api_client.budget_low = True
+        await coordinator._async_update_data()
+        mock_api_client.budget_low = False
+
+        await coordinator._async_update_data()
+
+        assert coordinator.update_interval == timedelta(seconds=SCAN_INTERVAL_SECONDS)
+
+    async def test_low_budget_skips_prewarm(self, hass, mock_api_client):
+        coordinator = RemiDataUpdateCoordinator(hass, mock_api_client, prewarm=True)
+        mock_api_client.budget_low = True
+
+        await coordinator._async_update_data()
+
+        assert coordinator._unsub_prewarm is None
+
+    async def test_spent_budget_keeps_data_and_defers_poll(self, hass):
+        class _Cloud:
+            async def request(self, method, url, payload, headers, timeout):
+                body = MOCK_EVENT_DATA if url.endswith("/Event") else [MOCK_REMI_DATA]
+                return TransportResponse(200, json.dumps({"results": body}).encode(), {})
+
+        client = RemiApiClient(
+            "user@example.com",
+            "secret",
+            None,
+            circuit_breaker=CircuitBreaker(),
+            scheduler=RequestScheduler(),
+            rate_limiter=RateLimiter(hourly_budget=2),
+            transport=_Cloud(),
+        )
+        client.set_remi_id(MOCK_REMI_DATA["objectId"])
+        coordinator = RemiDataUpdateCoordinator(hass, client)
+        await coordinator.async_refresh()
+        data = coordinator.data
+
+        coordinator.async_expire_events()
+        await coordinator.async_refresh()
+
+        assert coordinator.last_update_success
+        assert coordinator.data is data
+        assert coordinator.update_interval > timedelta(seconds=SCAN_INTERVAL_SECONDS * 10)
+        await coordinator.async_shutdown()
+
+    async def test_rate_limited_poll_keeps_data(self, coordinator, mock_api_client):
+        coordinator.data = await coordinator._async_update_data()
+        mock_api_client.get_remi.side_effect = RemiRateLimitError("slow down", 600)
+
+        assert await coordinator._async_update_data() is coordinator.data
+        assert coordinator.update_interval == timedelta(seconds=600)
+
+    async def test_rate_limited_first_poll_fails(self, coordinator, mock_api_client):
+        mock_api_client.get_remi.side_effect = RemiRateLimitError("slow down", 600)
+
+        with pytest.raises(UpdateFailed):
+            await coordinator._async_update_data()
+
+
+class TestOfflineWrites:
+    """Tests for writes routed through the offline write queue."""
+
+    @pytest.fixture
+    def batch(self, mock_api_client):
+        batch = MagicMock()
+        batch.commit = AsyncMock(return_value=[])
+        mock_api_client.batch = MagicMock(return_value=batch)
+        return batch
+
+    @pytest.fixture
+    async def queued_coordinator(self, hass, mock_api_client, batch):
+        write_queue = RemiWriteQueue(hass, mock_api_client, "entry_1")
+        coordinator = RemiDataUpdateCoordinator(hass, mock_api_client, write_queue=write_queue)
+        yield coordinator
+        await coordinator.async_shutdown()
+
+    async def test_writes_go_direct_without_queue(self, coordinator, mock_api_client):
+        await coordinator.async_update_event("ev1", {"enabled": True})
+
+        mock_api_client.update_event.assert_awaited_once_with("ev1", {"enabled": True})
+
+    async def test_unreachable_cloud_keeps_write_queued(self, queued_coordinator, batch):
+        batch.commit.side_effect = RemiTimeoutError("timed out")
+
+        await queued_coordinator.async_update_remi({"volume": 10})
+
+        assert len(queued_coordinator._write_queue) == 1
+
+    async def test_rejected_write_raises(self, queued_coordinator, batch):
+        batch.commit.side_effect = RemiBatchError("Object not found.", [RemiApiError()])
+
+        with pytest.raises(RemiBatchError):
+            await queued_coordinator.async_update_event("missing", {"enabled": True})
+
+    async def test_queued_writes_replay_in_one_batch_before_poll(
+        self, queued_coordinator, mock_api_client, batch
+    ):
+        batch.commit.side_effect = RemiTimeoutError("timed out")
+        await queued_coordinator.async_update_remi({"volume": 10})
+        await queued_coordinator.async_update_event("ev1", {"enabled": False})
+        batch.commit.side_effect = None
+        batch.commit.reset_mock()
+
+        await queued_coordinator._async_update_data()
+
+        batch.commit.assert_awaited_once()
+        assert batch.update_remi.call_args.args == ({"volume": 10},)
+        assert batch.update_event.call_args.args == ("ev1", {"enabled": False})
+        assert len(queued_coordinator._write_queue) == 0
+        mock_api_client.get_remi.assert_awaited_once()
+
+    async def test_replay_kept_on_auth_error_is_not_reported_dropped(
+        self, queued_coordinator, batch, caplog
+    ):
+        batch.commit.side_effect = RemiTimeoutError("timed out")
+        await queued_coordinator.async_update_remi({"volume": 10})
+        batch.commit.side_effect = RemiAuthError("session expired")
+
+        await queued_coordinator._async_update_data()
+
+        assert len(queued_coordinator._write_queue) == 1
+        assert "Dropped" not in caplog.text
+
+    async def test_rejected_replay_is_reported_dropped(
+        self, queued_coordinator, batch, caplog
+    ):
+        batch.commit.side_effect = RemiTimeoutError("timed out")
+        await queued_coordinator.async_update_remi({"volume": 10})
+        batch.commit.side_effect = RemiBatchError("Object not found.", [RemiApiError()])
+
+        await queued_coordinator._async_update_data()
+
+        assert len(queued_coordinator._write_queue) == 0
+        assert "Dropped queued Remi updates" in caplog.text
+
+
+class TestAdaptivePolling:
+    """Tests for adapting the poll interval to device activity."""
+
+    async def test_write_speeds_up_polling(self, coordinator):
+        await coordinator.async_update_remi({"volume": 10})
+
+        assert coordinator.update_interval == timedelta(seconds=ADAPTIVE_POLL_FAST_SECONDS)
+
+    async def test_detected_change_speeds_up_polling(self, coordinator, mock_api_client):
+        coordinator.data = await coordinator._async_update_data()
+        assert coordinator.update_interval == timedelta(seconds=SCAN_INTERVAL_SECONDS)
+        mock_api_client.get_remi.return_value = {
+            **MOCK_REMI_DATA,
+            "face": {"__type": "Pointer", "className": "Face", "objectId": "rnAltoFwYC"},
+        }
+
+        await coordinator._async_update_data()
+
+        assert coordinator.update_interval == timedelta(seconds=ADAPTIVE_POLL_FAST_SECONDS)
+
+    async def test_telemetry_change_does_not_speed_up_polling(self, coordinator, mock_api_client):
+        coordinator.data = await coordinator._async_update_data()
+        mock_api_client.get_remi.return_value = {
+            **MOCK_REMI_DATA,
+            "temp": 160,
+            "rssi": -80,
+            "updatedAt": "2024-01-05T00:00:00.000Z",
+        }
+        mock_api_client.get_events.return_value = [
+            {**MOCK_EVENT_DATA[0], "updatedAt": "2024-01-05T00:00:00.000Z"}
+        ]
+        coordinator.async_expire_events()
+
+        await coordinator._async_update_data()
+
+        assert coordinator.update_interval == timedelta(seconds=SCAN_INTERVAL_SECONDS)
+
+    async def test_alarm_change_speeds_up_polling(self, coordinator, mock_api_client):
+        coordinator.data = await coordinator._async_update_data()
+        mock_api_client.get_events.return_value = [{**MOCK_EVENT_DATA[0], "enabled": False}]
+        coordinator.async_expire_events()
+
+        await coordinator._async_update_data()
+
+        assert coordinator.update_interval == timedelta(seconds=ADAPTIVE_POLL_FAST_SECONDS)
+
+    async def test_offline_device_polls_less_often(self, coordinator, mock_api_client):
+        mock_api_client.get_remi.return_value = {**MOCK_REMI_DATA, "online": False}
+
+        await coordinator._async_update_data()
+        await coordinator._async_update_data()
+
+        assert coordinator.update_interval == timedelta(seconds=SCAN_INTERVAL_SECONDS * 4)
+
+
+class TestPollTiers:
+    """Tests for refreshing device state, events and static data at different rates."""
+
+    async def test_events_are_reused_until_due(self, coordinator, mock_api_client):
+        coordinator.data = await coordinator._async_update_data()
+        mock_api_client.get_remi.return_value = {**MOCK_REMI_DATA, "temp": 160}
+
+        data = await coordinator._async_update_data()
+
+        assert data["remi"]["temp"] == 160
+        assert data["events"] == MOCK_EVENT_DATA
+        assert mock_api_client.get_remi.await_count == 2
+        mock_api_client.get_events.assert_awaited_once()
+
+    async def test_event_write_refetches_events(self, coordinator, mock_api_client):
+        coordinator.data = await coordinator._async_update_data()
+
+        await coordinator.async_update_event("event_id_1", {"enabled": False})
+        await coordinator._async_update_data()
+
+        assert mock_api_client.get_events.await_count == 2
+
+    async def test_account_events_are_reused_until_due(self, hass):
+        fetcher = RemiAccountFetcher()
+        coordinators = []
+        for remi_id in ("remi_a", "remi_b"):
+            client = MagicMock()
+            client.remi_id = remi_id
+            client.get_remis = AsyncMock(
+                return_value={"remi_a": {"objectId": "remi_a"}, "remi_b": {"objectId": "remi_b"}}
+            )
+            client.get_events_by_remi = AsyncMock(return_value={"remi_a": [{"objectId": "e1"}]})
+            coordinator = RemiDataUpdateCoordinator(hass, client, account_fetcher=fetcher)
+            fetcher.async_register(coordinator)
+            coordinators.append(coordinator)
+        first, second = coordinators
+        first.data = await first._async_update_data()
+
+        data = await first._async_update_data()
+
+        assert data["events"] == [{"objectId": "e1"}]
+        assert first.client.get_remis.await_count == 2
+        first.client.get_events_by_remi.assert_awaited_once()
+        await second.async_shutdown()
+
+    async def test_static_data_is_refreshed_rarely(self, hass, coordinator, mock_api_client):
+        await coordinator.async_setup()
+        listener = MagicMock()
+        unsub = coordinator.async_add_listener(listener)
+        mock_api_client.get_config.return_value = {
+            "params": {"default_firmware_update_version": 99}
+        }
+
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=STATIC_POLL_SECONDS))
+        await hass.async_block_till_done()
+
+        assert coordinator.latest_firmware_version == 99
+        assert mock_api_client.get_faces.await_count == 2
+        listener.assert_called()
+        unsub()
+        await coordinator.async_shutdown()
+
+    async def test_shutdown_stops_static_refresh(self, hass, coordinator, mock_api_client):
+        await coordinator.async_setup()
+        await coordinator.async_shutdown()
+
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=STATIC_POLL_SECONDS))
+        await hass.async_block_till_done()
+
+        mock_api_client.get_config.assert_awaited_once()
+
+
+class TestAlarmPolling:
+    """Tests for polling around the alarm schedule."""
+
+    @pytest.fixture
+    async def alarm_coordinator(self, hass, mock_api_client):
+        coordinator = RemiDataUpdateCoordinator(hass, mock_api_client, alarm_polling=True)
+        yield coordinator
+        await coordinator.async_shutdown()
+
+    async def test_polls_densely_around_alarm(self, alarm_coordinator, mock_api_client):
+        # Tuesday 07:28, two minutes before the weekday alarm.
+        now = datetime(2024, 1, 2, 7, 28, tzinfo=timezone.utc)
+
+        with patch(DT_NOW, return_value=now):
+            alarm_coordinator.data = await alarm_coordinator._async_update_data()
+
+        assert alarm_coordinator.update_interval == timedelta(seconds=ALARM_WINDOW_POLL_SECONDS)
+
+    async def test_polls_sparsely_away_from_alarm(self, alarm_coordinator, mock_api_client):
+        now = datetime(2024, 1, 2, 14, 0, tzinfo=timezone.utc)
+
+        with patch(DT_NOW, return_value=now):
+            alarm_coordinator.data = await alarm_coordinator._async_update_data()
+
+        assert alarm_coordinator.update_interval == timedelta(seconds=ALARM_IDLE_POLL_SECONDS)
+
+    async def test_write_burst_takes_precedence(self, alarm_coordinator):
+        await alarm_coordinator.async_update_remi({"volume": 10})
+
+        assert alarm_coordinator.update_interval == timedelta(seconds=ADAPTIVE_POLL_FAST_SECONDS)
+
+
+class TestOptimisticWrites:
+    """Tests for applying writes to the cached data without a refresh."""
+
+    @pytest.fixture
+    def primed(self, coordinator, mock_api_client):
+        coordinator.data = {
+            "remi": {**MOCK_REMI_DATA, "updatedAt": "2024-01-01T00:00:00.000Z"},
+            "events": [dict(event) for event in MOCK_EVENT_DATA],
+        }
+        coordinator.async_request_refresh = AsyncMock()
+        return coordinator
+
+    async def test_remi_write_is_applied_with_response_timestamp(self, primed, mock_api_client):
+        mock_api_client.update_remi.return_value = {"updatedAt": "2024-01-05T00:00:00.000Z"}
+        listener = MagicMock()
+        unsub = primed.async_add_listener(listener)
+
+        await primed.async_update_remi({"volume": 10})
+
+        assert primed.remi["volume"] == 10
+        assert primed.remi["updatedAt"] == "2024-01-05T00:00:00.000Z"
+        assert primed.remi["name"] == MOCK_REMI_DATA["name"]
+        listener.assert_called_once()
+        primed.async_request_refresh.assert_not_called()
+        unsub()
+
+    async def test_event_write_is_applied(self, primed, mock_api_client):
+        await primed.async_update_event("event_id_1", {"enabled": False})
+
+        assert primed.events[0]["enabled"] is False
+        assert primed.events[0]["name"] == "Morning Alarm"
+
+    async def test_created_event_gets_server_id(self, primed):
+        primed.async_apply_write(
+            "create",
+            "Event",
+            {"name": "Nap"},
+            {"objectId": "new_id", "createdAt": "2024-01-05T00:00:00.000Z"},
+        )
+
+        assert primed.events[-1] == {
+            "name": "Nap",
+            "objectId": "new_id",
+            "createdAt": "2024-01-05T00:00:00.000Z",
+            "updatedAt": "2024-01-05T00:00:00.000Z",
+        }
+
+    async def test_deleted_event_is_removed(self, primed):
+        primed.async_apply_write("delete", "Event", {"objectId": "event_id_1"})
+
+        assert primed.events == []
+
+    async def test_writes_share_one_reconcile_poll(self, hass, primed):
+        await primed.async_update_remi({"volume": 10})
+        await primed.async_update_remi({"volume": 20})
+
+        async_fire_time_changed(
+            hass, dt_util.utcnow() + timedelta(seconds=WRITE_RECONCILE_DELAY_SECONDS)
+        )
+        await hass.async_block_till_done()
+
+        primed.async_request_refresh.assert_awaited_once()
+
+    async def test_reconcile_poll_fetches_full_objects(self, hass, mock_api_client):
+        coordinator = RemiDataUpdateCoordinator(hass, mock_api_client, conditional_polling=True)
+        mock_api_client.get_remi_changes = AsyncMock(return_value=None)
+        coordinator.data = await coordinator._async_update_data()
+        mock_api_client.get_remi.reset_mock()
+
+        await coordinator.async_update_remi({"volume": 10})
+        async_fire_time_changed(
+            hass, dt_util.utcnow() + timedelta(seconds=WRITE_RECONCILE_DELAY_SECONDS)
+        )
+        await hass.async_block_till_done()
+
+        mock_api_client.get_remi.assert_awaited_once()
+        mock_api_client.get_remi_changes.assert_not_called()
+        await coordinator.async_shutdown()
+
+    async def test_write_kept_queued_is_not_applied(self, hass, primed, mock_api_client):
+        write_queue = RemiWriteQueue(hass, mock_api_client, "entry_1")
+        primed._write_queue = write_queue
+        batch = MagicMock()
+        batch.commit = AsyncMock(side_effect=RemiTimeoutError("timed out"))
+        mock_api_client.batch = MagicMock(return_value=batch)
+
+        await primed.async_update_remi({"volume": 10})
+
+        assert primed.remi["volume"] == MOCK_REMI_DATA["volume"]
+
+
+class TestChangeTracking:
+    """Tests for recording which fields and events changed."""
+
+    @pytest.fixture
+    def notified(self, coordinator):
+        coordinator.async_set_updated_data(
+            {"remi": dict(MOCK_REMI_DATA), "events": [dict(event) for event in MOCK_EVENT_DATA]}
+        )
+        return coordinator
+
+    def test_first_update_changes_everything(self, notified):
+        assert notified.changes.everything
+
+    def test_changed_remi_fields(self, notified):
+        notified.async_set_updated_data(
+            {**notified.data, "remi": {**notified.remi, "rssi": -70, "ipv4Address": "10.0.0.2"}}
+        )
+
+        assert notified.changes.remi_fields == {"rssi", "ipv4Address"}
+        assert notified.changes.event_ids == set()
+        assert not notified.changes.affects(("temp",))
+        assert notified.changes.affects(("rssi",))
+
+    def test_changed_and_removed_events(self, notified):
+        notified.async_set_updated_data(
+            {
+                **notified.data,
+                "events": [{"objectId": "new_event", "enabled": True}],
+            }
+        )
+
+        assert notified.changes.event_ids == {"event_id_1", "new_event"}
+        assert notified.changes.affects((), ("event_id_1",))
+        assert not notified.changes.affects(("temp",), ("other_event",))
+
+    async def test_failed_poll_changes_everything(self, notified, mock_api_client):
+        mock_api_client.get_remi.side_effect = RemiApiError("boom")
+
+        await notified.async_refresh()
+
+        assert notified.changes.everything
+
+    async def test_static_change_changes_everything(self, notified, mock_api_client):
+        notified.async_set_updated_data(notified.data)
+        assert not notified.changes.everything
+        mock_api_client.get_config.return_value = {
+            "params": {"default_firmware_update_version": 200}
+        }
+
+        await notified._async_refresh_static(None)
+
+        assert notified.changes.everything
@@ -0,0 +1,140 @@
+"""Tests for the setup and services of the UrbanHello Remi integration."""
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from homeassistant.const import CONF_USERNAME
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.urbanhello_remi_unofficial import (
+    SERVICE_DELETE_ALARM,
+    SERVICE_UPDATE_ALARM,
+    _async_get_dedicated_session,
+    _register_services,
+)
+from custom_components.urbanhello_remi_unofficial.api import (
+    RemiApiError,
+    RemiBatchError,
+    RemiTimeoutError,
+)
+from custom_components.urbanhello_remi_unofficial.const import (
+    DATA_DEDICATED_SESSIONS,
+    DOMAIN,
+)
+
+from .conftest import MOCK_USERNAME
+
+
+@pytest.fixture
+def batch() -> MagicMock:
+    """Return a mock batch returned by the client."""
+    batch = MagicMock()
+    batch.commit = AsyncMock()
+    return batch
+
+
+@pytest.fixture
+def coordinator(hass, batch) -> MagicMock:
+    """Return a mock coordinator with the alarm services registered."""
+    coordinator = MagicMock()
+    coordinator.client.batch = MagicMock(return_value=batch)
+    _register_services(hass, coordinator)
+    return coordinator
+
+
+class TestAlarmServices:
+    """Tests for the update_alarm and delete_alarm services."""
+
+    async def test_update_applies_written_events(self, hass, coordinator, batch):
+        batch.commit.return_value = [{"updatedAt": "t1"}, {"updatedAt": "t2"}]
+
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_UPDATE_ALARM,
+            {"event_id": ["e1", "e2"], "enabled": False},
+            blocking=True,
+        )
+
+        coordinator.async_record_activity.assert_called_once()
+        coordinator.async_expire_events.assert_called_once()
+        assert [c.args for c in coordinator.async_apply_write.call_args_list] == [
+            ("update", "Event", {"enabled": False, "objectId": "e1"}, {"updatedAt": "t1"}),
+            ("update", "Event", {"enabled": False, "objectId": "e2"}, {"updatedAt": "t2"}),
+        ]
+
+    async def test_partial_update_applies_successful_events(self, hass, coordinator, batch):
+        batch.commit.side_effect = RemiBatchError(
+            "1 of 2 batch operations failed",
+            [{"updatedAt": "t1"}, RemiApiError("PUT failed")],
+        )
+
+        with pytest.raises(RemiBatchError):
+            await hass.services.async_call(
+                DOMAIN,
+                SERVICE_UPDATE_ALARM,
+                {"event_id": ["e1", "e2"], "enabled": False},
+                blocking=True,
+            )
+
+        coordinator.async_record_activity.assert_called_once()
+        coordinator.async_expire_events.assert_called_once()
+        coordinator.async_apply_write.assert_called_once_with(
+            "update", "Event", {"enabled": False, "objectId": "e1"}, {"updatedAt": "t1"}
+        )
+
+    async def test_partial_delete_applies_successful_events(self, hass, coordinator, batch):
+        batch.commit.side_effect = RemiBatchError(
+            "1 of 2 batch operations failed", [RemiApiError("DELETE failed"), {}]
+        )
+
+        with pytest.raises(RemiBatchError):
+            await hass.services.async_call(
+                DOMAIN, SERVICE_DELETE_ALARM, {"event_id": ["e1", "e2"]}, blocking=True
+            )
+
+        coordinator.async_apply_write.assert_called_once_with(
+            "delete", "Event", {"objectId": "e2"}, {}
+        )
+
+    async def test_failed_write_still_expires_events(self, hass, coordinator, batch):
+        batch.commit.side_effect = RemiTimeoutError("timed out")
+
+        with pytest.raises(RemiTimeoutError):
+            await hass.services.async_call(
+                DOMAIN, SERVICE_DELETE_ALARM, {"event_id": ["e1"]}, blocking=True
+            )
+
+        coordinator.async_expire_events.assert_called_once()
+        coordinator.async_record_activity.assert_not_called()
+        coordinator.async_apply_write.assert_not_called()
+
+
+class TestDedicatedSession:
+    """Tests for sharing a dedicated session between the entries of an account."""
+
+    async def test_entries_of_an_account_share_one_session(self, hass):
+        entries = [
+            MockConfigEntry(domain=DOMAIN, data={CONF_USERNAME: username})
+            for username in (MOCK_USERNAME, MOCK_USERNAME.upper(), "other@example.com")
+        ]
+        releases = []
+        with patch(
+            "custom_components.urbanhello_remi_unofficial._create_dedicated_session",
+            side_effect=lambda: MagicMock(close=AsyncMock()),
+        ):
+            sessions = []
+            for entry in entries:
+                with patch.object(entry, "async_on_unload", releases.append):
+                    sessions.append(_async_get_dedicated_session(hass, entry))
+
+        first, second, other = sessions
+        assert first is second
+        assert other is not first
+
+        await releases[0]()
+        first.close.assert_not_awaited()
+        await releases[1]()
+        first.close.assert_awaited_once()
+        assert list(hass.data[DATA_DEDICATED_SESSIONS]) == ["other@example.com"]
+        await releases[2]()
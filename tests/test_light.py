@@ -36,7 +36,7 @@ def mock_coordinator_with_lights():
         "background_color": [0, 0, 255],
     }
     coordinator.client = MagicMock()
-    coordinator.client.update_remi = AsyncMock(return_value={})
+    coordinator.async_update_remi = AsyncMock()
     coordinator.async_request_refresh = AsyncMock()
     return coordinator
 
@@ -100,16 +100,16 @@ class TestRemiNightLightEntity:
         entity = RemiNightLightEntity(mock_coordinator_with_lights)
         await entity.async_turn_on(**{ATTR_RGB_COLOR: (100, 150, 200)})
 
-        mock_coordinator_with_lights.client.update_remi.assert_awaited_once_with(
+        mock_coordinator_with_lights.async_update_remi.assert_awaited_once_with(
             {"lightnight": [100, 150, 200]}
         )
-        mock_coordinator_with_lights.async_request_refresh.assert_awaited_once()
+        mock_coordinator_with_lights.async_request_refresh.assert_not_called()
 
     async def test_turn_on_without_rgb_uses_current(self, mock_coordinator_with_lights):
         entity = RemiNightLightEntity(mock_coordinator_with_lights)
         await entity.async_turn_on()
 
-        mock_coordinator_with_lights.client.update_remi.assert_awaited_once_with(
+        mock_coordinator_with_lights.async_update_remi.assert_awaited_once_with(
             {"lightnight": [255, 128, 0]}
         )
 
@@ -118,7 +118,7 @@ class TestRemiNightLightEntity:
         entity = RemiNightLightEntity(mock_coordinator_with_lights)
         await entity.async_turn_on()
 
-        mock_coordinator_with_lights.client.update_remi.assert_awaited_once_with(
+        mock_coordinator_with_lights.async_update_remi.assert_awaited_once_with(
             {"lightnight": [255, 255, 255]}
         )
 
@@ -126,10 +126,10 @@ class TestRemiNightLightEntity:
         entity = RemiNightLightEntity(mock_coordinator_with_lights)
         await entity.async_turn_off()
 
-        mock_coordinator_with_lights.client.update_remi.assert_awaited_once_with(
+        mock_coordinator_with_lights.async_update_remi.assert_awaited_once_with(
             {"lightnight": [0, 0, 0]}
         )
-        mock_coordinator_with_lights.async_request_refresh.assert_awaited_once()
+        mock_coordinator_with_lights.async_request_refresh.assert_not_called()
 
 
 class TestRemiBackgroundLightEntity:
@@ -155,7 +155,7 @@ class TestRemiBackgroundLightEntity:
         entity = RemiBackgroundLightEntity(mock_coordinator_with_lights)
         await entity.async_turn_on(**{ATTR_RGB_COLOR: (255, 0, 128)})
 
-        mock_coordinator_with_lights.client.update_remi.assert_awaited_once_with(
+        mock_coordinator_with_lights.async_update_remi.assert_awaited_once_with(
             {"background_color": [255, 0, 128]}
         )
 
@@ -163,6 +163,6 @@ class TestRemiBackgroundLightEntity:
         entity = RemiBackgroundLightEntity(mock_coordinator_with_lights)
         await entity.async_turn_off()
 
-        mock_coordinator_with_lights.client.update_remi.assert_awaited_once_with(
+        mock_coordinator_with_lights.async_update_remi.assert_awaited_once_with(
             {"background_color": [0, 0, 0]}
         )
@@ -0,0 +1,253 @@
+"""Tests for the Parse LiveQuery push client."""
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+import pytest
+
+from custom_components.urbanhello_remi_unofficial.const import API_APP_ID
+from custom_components.urbanhello_remi_unofficial.livequery import RemiLiveQuery
+
+from .conftest import MOCK_INSTALLATION_ID, MOCK_REMI_ID, MOCK_SESSION_TOKEN
+
+
+class LiveQueryStub:
+    """Minimal Parse LiveQuery server speaking the websocket protocol."""
+
+    def __init__(self) -> None:
+        self.received: list[dict[str, Any]] = []
+        self.connections = 0
+        self.subscribed = asyncio.Event()
+        self.ws: web.WebSocketResponse | None = None
+        self.reject_connect = False
+
+    async def handler(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self.connections += 1
+        async for msg in ws:
+            message = msg.json()
+            self.received.append(message)
+            if message["op"] == "connect":
+                if self.reject_connect:
+                    self.reject_connect = False
+                    await ws.send_json({"op": "error", "code": 1, "error": "Bad", "reconnect": True})
+                    await ws.close()
+                    break
+                await ws.send_json({"op": "connected", "clientId": 1})
+            elif message["op"] == "subscribe":
+                await ws.send_json(
+                    {"op": "subscribed", "clientId": 1, "requestId": message["requestId"]}
+                )
+                if message["requestId"] == 2:
+                    self.ws = ws
+                    self.subscribed.set()
+        return ws
+
+    async def push_raw(self, data: str) -> None:
+        assert self.ws is not None
+        await self.ws.send_str(data)
+
+    async def push(self, op: str, request_id: int, obj: dict[str, Any]) -> None:
+        assert self.ws is not None
+        await self.ws.send_json(
+            {"op": op, "clientId": 1, "requestId": request_id, "object": obj}
+        )
+
+
+@pytest.fixture
+async def live_server(socket_enabled):
+    """Start a local LiveQuery stub server."""
+    stub = LiveQueryStub()
+    app = web.Application()
+    app.router.add_get("/", stub.handler)
+    server = TestServer(app)
+    await server.start_server()
+    stub.url = str(server.make_url("/")).replace("http", "ws", 1)
+    yield stub
+    await server.close()
+
+
+@pytest.fixture(autouse=True)
+def no_reconnect_delay():
+    """Reconnect immediately instead of sleeping between attempts."""
+    with patch(
+        "custom_components.urbanhello_remi_unofficial.livequery.backoff_delay",
+        return_value=0,
+    ):
+        yield
+
+
+@pytest.fixture
+async def live_query(live_server, mock_api_client):
+    """Run a RemiLiveQuery against the stub server."""
+    mock_api_client.installation_id = MOCK_INSTALLATION_ID
+    session = aiohttp.ClientSession()
+    changes: asyncio.Queue = asyncio.Queue()
+    connection_changes: list[bool] = []
+    live = RemiLiveQuery(
+        session,
+        mock_api_client,
+        lambda op, class_name, obj: changes.put_nowait((op, class_name, obj)),
+        connection_changes.append,
+        url=live_server.url,
+    )
+    live.changes = changes
+    live.connection_changes = connection_changes
+    task = asyncio.create_task(live.async_run())
+    yield live
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    await session.close()
+
+
+class TestLiveQuery:
+    """Tests for RemiLiveQuery."""
+
+    async def test_connects_and_subscribes(self, live_server, live_query):
+        await asyncio.wait_for(live_server.subscribed.wait(), 5)
+
+        connect, remi_sub, event_sub = live_server.received
+        assert connect == {
+            "op": "connect",
+            "applicationId": API_APP_ID,
+            "installationId": MOCK_INSTALLATION_ID,
+            "sessionToken": MOCK_SESSION_TOKEN,
+        }
+        assert remi_sub["query"] == {"className": "Remi", "where": {"objectId": MOCK_REMI_ID}}
+        assert event_sub["query"]["className"] == "Event"
+        assert event_sub["query"]["where"]["remi"]["objectId"] == MOCK_REMI_ID
+        assert remi_sub["sessionToken"] == MOCK_SESSION_TOKEN
+
+    async def test_reports_connection(self, live_server, live_query):
+        await asyncio.wait_for(live_server.subscribed.wait(), 5)
+        await live_server.push("update", 1, {"objectId": MOCK_REMI_ID})
+        await asyncio.wait_for(live_query.changes.get(), 5)
+
+        assert live_query.connected
+        assert live_query.connection_changes == [True]
+
+    async def test_dispatches_pushed_changes(self, live_server, live_query):
+        await asyncio.wait_for(live_server.subscribed.wait(), 5)
+
+        await live_server.push(
+            "update", 1,
+            {"__type": "Object", "className": "Remi", "objectId": MOCK_REMI_ID, "face": "x"},
+        )
+        await live_server.push("delete", 2, {"className": "Event", "objectId": "event_1"})
+
+        assert await asyncio.wait_for(live_query.changes.get(), 5) == (
+            "update", "Remi", {"objectId": MOCK_REMI_ID, "face": "x"}
+        )
+        assert await asyncio.wait_for(live_query.changes.get(), 5) == (
+            "delete", "Event", {"objectId": "event_1"}
+        )
+
+    async def test_reconnects_after_close(self, live_server, live_query):
+        await asyncio.wait_for(live_server.subscribed.wait(), 5)
+        live_server.subscribed.clear()
+
+        await live_server.ws.close()
+        await asyncio.wait_for(live_server.subscribed.wait(), 5)
+
+        assert live_server.connections == 2
+        await live_server.push("update", 1, {"objectId": MOCK_REMI_ID})
+        await asyncio.wait_for(live_query.changes.get(), 5)
+        assert live_query.connection_changes == [True, False, True]
+
+    async def test_reconnects_after_rejected_handshake(self, live_server, mock_api_client):
+        live_server.reject_connect = True
+        mock_api_client.installation_id = MOCK_INSTALLATION_ID
+        connection_changes: list[bool] = []
+        async with aiohttp.ClientSession() as session:
+            live = RemiLiveQuery(
+                session, mock_api_client, MagicMock(), connection_changes.append,
+                url=live_server.url,
+            )
+            task = asyncio.create_task(live.async_run())
+            await asyncio.wait_for(live_server.subscribed.wait(), 5)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+        assert live_server.connections == 2
+
+    async def test_malformed_message_is_skipped(self, live_server, live_query):
+        await asyncio.wait_for(live_server.subscribed.wait(), 5)
+
+        await live_server.push_raw("not json")
+        await live_server.push("update", 1, {"objectId": MOCK_REMI_ID})
+
+        assert await asyncio.wait_for(live_query.changes.get(), 5) == (
+            "update", "Remi", {"objectId": MOCK_REMI_ID}
+        )
+        assert live_server.connections == 1
+        assert live_query.connection_changes == [True]
+
+    async def test_failing_change_handler_does_not_drop_later_changes(
+        self, live_server, mock_api_client
+    ):
+        mock_api_client.installation_id = MOCK_INSTALLATION_ID
+        on_change = MagicMock(side_effect=[ValueError("boom"), None])
+        async with aiohttp.ClientSession() as session:
+            live = RemiLiveQuery(
+                session, mock_api_client, on_change, MagicMock(), url=live_server.url
+            )
+            task = asyncio.create_task(live.async_run())
+            await asyncio.wait_for(live_server.subscribed.wait(), 5)
+            await live_server.push("update", 1, {"objectId": MOCK_REMI_ID})
+            await live_server.push("update", 1, {"objectId": MOCK_REMI_ID})
+            async with asyncio.timeout(5):
+                while on_change.call_count < 2:
+                    await asyncio.sleep(0.01)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+        assert live_server.connections == 1
+
+    async def test_reconnects_after_unexpected_error(self, live_server, mock_api_client):
+        mock_api_client.installation_id = MOCK_INSTALLATION_ID
+        connection_changes: list[bool] = []
+
+        def _on_connection_change(connected: bool) -> None:
+            connection_changes.append(connected)
+            if len(connection_changes) == 1:
+                raise RuntimeError("boom")
+
+        async with aiohttp.ClientSession() as session:
+            live = RemiLiveQuery(
+                session, mock_api_client, MagicMock(), _on_connection_change,
+                url=live_server.url,
+            )
+            task = asyncio.create_task(live.async_run())
+            async with asyncio.timeout(5):
+                while connection_changes[-1:] != [True] or len(connection_changes) < 3:
+                    await asyncio.sleep(0.01)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+        assert live_server.connections == 2
+        assert connection_changes == [True, False, True, False]
+
+    async def test_stopping_reports_disconnection(self, live_server, mock_api_client):
+        mock_api_client.installation_id = MOCK_INSTALLATION_ID
+        connection_changes: list[bool] = []
+        async with aiohttp.ClientSession() as session:
+            live = RemiLiveQuery(
+                session, mock_api_client, MagicMock(), connection_changes.append,
+                url=live_server.url,
+            )
+            task = asyncio.create_task(live.async_run())
+            await asyncio.wait_for(live_server.subscribed.wait(), 5)
+            async with asyncio.timeout(5):
+                while not live.connected:
+                    await asyncio.sleep(0.01)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+        assert not live.connected
+        assert connection_changes == [True, False]
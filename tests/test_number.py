@@ -35,9 +35,7 @@ def mock_coordinator():
         "luminosity": 60,
         "noise_notification_threshold": 30,
     }
-    coordinator.client = MagicMock()
-    coordinator.client.update_remi = AsyncMock(return_value={})
-    coordinator.async_request_refresh = AsyncMock()
+    coordinator.async_queue_remi_update = AsyncMock()
     return coordinator
 
 
@@ -91,8 +89,7 @@ class TestRemiNumberEntity:
         entity = RemiNumberEntity(mock_coordinator, NUMBER_DESCRIPTIONS[0])
         await entity.async_set_native_value(80)
 
-        mock_coordinator.client.update_remi.assert_awaited_once_with({"volume": 80})
-        mock_coordinator.async_request_refresh.assert_awaited_once()
+        mock_coordinator.async_queue_remi_update.assert_awaited_once_with({"volume": 80})
 
     def test_luminosity_entity_properties(self, mock_coordinator):
         entity = RemiNumberEntity(mock_coordinator, NUMBER_DESCRIPTIONS[1])
@@ -112,7 +109,7 @@ class TestRemiNumberEntity:
         entity = RemiNumberEntity(mock_coordinator, NUMBER_DESCRIPTIONS[1])
         await entity.async_set_native_value(90)
 
-        mock_coordinator.client.update_remi.assert_awaited_once_with({"luminosity": 90})
+        mock_coordinator.async_queue_remi_update.assert_awaited_once_with({"luminosity": 90})
 
     def test_noise_threshold_entity_properties(self, mock_coordinator):
         entity = RemiNumberEntity(mock_coordinator, NUMBER_DESCRIPTIONS[2])
@@ -132,6 +129,6 @@ class TestRemiNumberEntity:
         entity = RemiNumberEntity(mock_coordinator, NUMBER_DESCRIPTIONS[2])
         await entity.async_set_native_value(45)
 
-        mock_coordinator.client.update_remi.assert_awaited_once_with(
+        mock_coordinator.async_queue_remi_update.assert_awaited_once_with(
             {"noise_notification_threshold": 45}
         )
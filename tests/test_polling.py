@@ -0,0 +1,168 @@
+"""Tests for the poll scheduling policies."""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.urbanhello_remi_unofficial.polling import (
+    AdaptivePollPolicy,
+    AlarmProximityPolicy,
+    PollTier,
+    next_occurrence,
+)
+
+# A Wednesday.
+NOW = datetime(2024, 1, 3, 12, 0, tzinfo=timezone.utc)
+WEEKDAYS = [False, True, True, True, True, True, False]
+
+MONOTONIC = "custom_components.urbanhello_remi_unofficial.polling.time.monotonic"
+
+
+@pytest.fixture
+def clock():
+    """Control the monotonic clock seen by the policies."""
+    now = [1000.0]
+    with patch(MONOTONIC, side_effect=lambda: now[0]):
+        yield now
+
+
+@pytest.fixture
+def policy(clock) -> AdaptivePollPolicy:
+    """Return a policy with round numbers."""
+    return AdaptivePollPolicy(base=60, fast=10, burst=120, idle_after=1800, ceiling=900)
+
+
+class TestAdaptivePollPolicy:
+    """Tests for AdaptivePollPolicy."""
+
+    def test_starts_at_base_rate(self, policy):
+        assert policy.interval == 60
+
+    def test_activity_starts_fast_burst(self, policy, clock):
+        policy.record_activity()
+        assert policy.interval == 10
+
+        clock[0] += 120
+        assert policy.interval == 60
+
+    def test_detected_change_starts_fast_burst(self, policy):
+        policy.record_poll(changed=True, online=True)
+
+        assert policy.interval == 10
+
+    def test_offline_device_backs_off_exponentially(self, policy):
+        intervals = []
+        for _ in range(6):
+            policy.record_poll(changed=False, online=False)
+            intervals.append(policy.interval)
+
+        assert intervals == [120, 240, 480, 900, 900, 900]
+
+    def test_idle_device_backs_off_after_a_while(self, policy, clock):
+        policy.record_poll(changed=False, online=True)
+        assert policy.interval == 60
+
+        clock[0] += 1800
+        policy.record_poll(changed=False, online=True)
+        policy.record_poll(changed=False, online=True)
+
+        assert policy.interval == 240
+
+    def test_activity_returns_to_base_rate(self, policy, clock):
+        for _ in range(5):
+            policy.record_poll(changed=False, online=False)
+
+        policy.record_poll(changed=True, online=True)
+        clock[0] += 120
+
+        assert policy.interval == 60
+
+    def test_long_quiet_period_stays_at_ceiling(self, policy):
+        for _ in range(2000):
+            policy.record_poll(changed=False, online=False)
+
+        assert policy.interval == 900
+
+
+class TestPollTier:
+    """Tests for PollTier."""
+
+    def test_due_until_first_refresh(self, clock):
+        assert PollTier(300).due
+
+    def test_due_again_after_interval(self, clock):
+        tier = PollTier(300)
+        tier.mark_refreshed()
+        assert not tier.due
+
+        clock[0] += 300
+        assert tier.due
+
+    def test_expire_makes_tier_due(self, clock):
+        tier = PollTier(300)
+        tier.mark_refreshed()
+
+        tier.expire()
+
+        assert tier.due
+
+
+def _alarm(hour: int, minute: int, recurrence=None, **fields) -> dict:
+    return {"enabled": True, "event_time": [hour, minute], "recurrence": recurrence, **fields}
+
+
+class TestNextOccurrence:
+    """Tests for next_occurrence."""
+
+    def test_later_today(self):
+        assert next_occurrence(_alarm(13, 15, WEEKDAYS), NOW) == NOW.replace(hour=13, minute=15)
+
+    def test_skips_inactive_days(self):
+        # Friday 18:00 has passed, so the next weekday alarm is on Monday.
+        friday = datetime(2024, 1, 5, 18, 0, tzinfo=timezone.utc)
+
+        assert next_occurrence(_alarm(7, 30, WEEKDAYS), friday) == datetime(
+            2024, 1, 8, 7, 30, tzinfo=timezone.utc
+        )
+
+    def test_one_time_alarm_rings_tomorrow_once_passed(self):
+        assert next_occurrence(_alarm(7, 30), NOW) == datetime(
+            2024, 1, 4, 7, 30, tzinfo=timezone.utc
+        )
+
+    def test_invalid_time_is_ignored(self):
+        assert next_occurrence({"event_time": "07:30"}, NOW) is None
+        assert next_occurrence(_alarm(25, 0), NOW) is None
+
+
+class TestAlarmProximityPolicy:
+    """Tests for AlarmProximityPolicy."""
+
+    @pytest.fixture
+    def alarm_policy(self) -> AlarmProximityPolicy:
+        return AlarmProximityPolicy(dense=10, sparse=300, lead=300, trail=900)
+
+    def test_sparse_without_alarms(self, alarm_policy):
+        assert alarm_policy.interval(60, [], NOW) == 300
+        assert alarm_policy.interval(60, [{**_alarm(13, 0), "enabled": False}], NOW) == 300
+
+    def test_dense_before_alarm(self, alarm_policy):
+        assert alarm_policy.interval(60, [_alarm(12, 4)], NOW) == 10
+
+    def test_dense_until_alarm_ends(self, alarm_policy):
+        # Rang at 11:30 for 20 minutes; the window closes at 12:05.
+        assert alarm_policy.interval(60, [_alarm(11, 30, length_min=20)], NOW) == 10
+        assert alarm_policy.interval(60, [_alarm(11, 30)], NOW) == 300
+
+    def test_sparse_poll_wakes_up_for_window(self, alarm_policy):
+        assert alarm_policy.interval(60, [_alarm(12, 7)], NOW) == 120
+
+    def test_backoff_beyond_sparse_is_kept(self, alarm_policy):
+        assert alarm_policy.interval(900, [_alarm(18, 0)], NOW) == 900
+
+    def test_earliest_window_wins(self, alarm_policy):
+        window = alarm_policy.next_window([_alarm(18, 0), _alarm(13, 0)], NOW)
+
+        assert window == (NOW.replace(hour=12, minute=55), NOW.replace(hour=13, minute=15))
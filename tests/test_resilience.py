@@ -0,0 +1,197 @@
+"""Tests for the retry, hedging and circuit breaking helpers."""
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.urbanhello_remi_unofficial.resilience import (
+    CircuitBreaker,
+    HedgeBudget,
+    LatencyTracker,
+    RateLimiter,
+    backoff_delay,
+    get_circuit_breaker,
+    get_rate_limiter,
+)
+
+MONOTONIC = "custom_components.urbanhello_remi_unofficial.resilience.time.monotonic"
+
+
+class TestBackoffDelay:
+    """Tests for backoff_delay."""
+
+    @pytest.mark.parametrize("attempt", [0, 1, 2, 3])
+    def test_delay_within_exponential_bound(self, attempt):
+        for _ in range(20):
+            assert 0 <= backoff_delay(attempt, base=1, cap=100) <= 2**attempt
+
+    def test_delay_capped(self):
+        for _ in range(20):
+            assert backoff_delay(10, base=1, cap=5) <= 5
+
+
+class TestLatencyTracker:
+    """Tests for LatencyTracker."""
+
+    def test_no_p95_before_min_samples(self):
+        tracker = LatencyTracker(min_samples=5)
+        for _ in range(4):
+            tracker.record(1.0)
+        assert tracker.p95 is None
+        assert tracker.timeout(10) == 10
+
+    def test_p95(self):
+        tracker = LatencyTracker(min_samples=5)
+        for latency in range(1, 21):
+            tracker.record(latency / 10)
+        assert tracker.p95 == pytest.approx(1.9)
+
+    def test_ewma(self):
+        tracker = LatencyTracker(alpha=0.5)
+        tracker.record(1.0)
+        tracker.record(3.0)
+        assert tracker.ewma == pytest.approx(2.0)
+
+    def test_sample_window_drops_old_samples(self):
+        tracker = LatencyTracker(sample_size=5, min_samples=5)
+        for _ in range(5):
+            tracker.record(9.0)
+        for _ in range(5):
+            tracker.record(0.1)
+        assert tracker.p95 == pytest.approx(0.1)
+
+    def test_timeout_scales_and_clamps(self):
+        tracker = LatencyTracker(min_samples=1, alpha=1)
+        tracker.record(0.1)
+        assert tracker.timeout(10, factor=3, minimum=2) == 2
+        tracker.record(1.5)
+        assert tracker.timeout(10, factor=3, minimum=2) == pytest.approx(4.5)
+        tracker.record(5.0)
+        assert tracker.timeout(10, factor=3, minimum=2) == 10
+
+
+class TestHedgeBudget:
+    """Tests for HedgeBudget."""
+
+    def test_limits_hedges_per_window(self):
+        budget = HedgeBudget(limit=2, window=60)
+        with patch(MONOTONIC, return_value=0):
+            assert budget.try_acquire()
+            assert budget.try_acquire()
+            assert not budget.try_acquire()
+
+    def test_budget_refills_after_window(self):
+        budget = HedgeBudget(limit=1, window=60)
+        with patch(MONOTONIC, return_value=0):
+            assert budget.try_acquire()
+        with patch(MONOTONIC, return_value=60):
+            assert budget.try_acquire()
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter."""
+
+    def test_burst_then_wait(self):
+        with patch(MONOTONIC, return_value=0):
+            limiter = RateLimiter(requests_per_minute=60, burst=2)
+            assert limiter.try_acquire() == 0
+            assert limiter.try_acquire() == 0
+            assert limiter.try_acquire() == pytest.approx(1.0)
+
+    def test_tokens_refill_over_time(self):
+        with patch(MONOTONIC, return_value=0):
+            limiter = RateLimiter(requests_per_minute=60, burst=1)
+            limiter.try_acquire()
+        with patch(MONOTONIC, return_value=1):
+            assert limiter.try_acquire() == 0
+
+    def test_pause(self):
+        with patch(MONOTONIC, return_value=0):
+            limiter = RateLimiter()
+            limiter.pause(30)
+            assert limiter.retry_after == 30
+        with patch(MONOTONIC, return_value=30):
+            assert limiter.retry_after == 0
+
+    def test_hourly_budget(self):
+        with patch(MONOTONIC, return_value=0):
+            limiter = RateLimiter(requests_per_minute=6000, hourly_budget=10, burst=10)
+            for _ in range(8):
+                limiter.try_acquire()
+            assert limiter.budget_remaining == 2
+            assert not limiter.budget_low
+            limiter.try_acquire()
+            assert limiter.budget_low
+            assert limiter.budget_resets_in == 3600
+        with patch(MONOTONIC, return_value=3600):
+            assert limiter.budget_remaining == 10
+
+    def test_configure(self):
+        with patch(MONOTONIC, return_value=0):
+            limiter = RateLimiter(requests_per_minute=60, burst=1)
+            limiter.configure(requests_per_minute=30, hourly_budget=100)
+            limiter.try_acquire()
+            assert limiter.try_acquire() == pytest.approx(2.0)
+
+    def test_registry_shares_per_account(self):
+        assert get_rate_limiter("a@example.com") is get_rate_limiter("a@example.com")
+        assert get_rate_limiter("a@example.com") is not get_rate_limiter("b@example.com")
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker."""
+
+    def test_closed_by_default(self):
+        breaker = CircuitBreaker()
+        assert breaker.allow_request()
+        assert breaker.retry_after == 0
+
+    def test_opens_after_threshold(self):
+        breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=30)
+        with patch(MONOTONIC, return_value=100.0):
+            breaker.record_failure()
+            breaker.record_failure()
+            assert breaker.allow_request()
+            breaker.record_failure()
+            assert not breaker.allow_request()
+            assert breaker.retry_after == 30
+
+    def test_success_resets_failure_count(self):
+        breaker = CircuitBreaker(failure_threshold=2)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.allow_request()
+
+    def test_probe_allowed_after_recovery_timeout(self):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=30)
+        with patch(MONOTONIC, return_value=100.0):
+            breaker.record_failure()
+        with patch(MONOTONIC, return_value=131.0):
+            assert breaker.allow_request()
+
+    def test_failed_probe_reopens(self):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=30)
+        with patch(MONOTONIC, return_value=100.0):
+            breaker.record_failure()
+        with patch(MONOTONIC, return_value=131.0):
+            breaker.record_failure()
+            assert not breaker.allow_request()
+
+    def test_successful_probe_closes(self):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=30)
+        breaker.record_failure()
+        breaker.record_success()
+        assert breaker.allow_request()
+        assert not breaker.is_open
+
+
+class TestCircuitBreakerRegistry:
+    """Tests for the per-host registry."""
+
+    def test_same_host_shares_breaker(self):
+        assert get_circuit_breaker("https://a.example") is get_circuit_breaker("https://a.example")
+
+    def test_hosts_have_separate_breakers(self):
+        assert get_circuit_breaker("https://a.example") is not get_circuit_breaker("https://b.example")
@@ -0,0 +1,149 @@
+"""Tests for the priority request scheduler."""
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from custom_components.urbanhello_remi_unofficial.scheduler import (
+    RequestPriority,
+    RequestScheduler,
+    RequestSupersededError,
+    get_request_scheduler,
+)
+
+
+async def _queue(
+    scheduler: RequestScheduler,
+    priority: RequestPriority,
+    order: list,
+    name: str,
+    group=None,
+    generation: int = 0,
+):
+    await scheduler.acquire(priority, group, generation)
+    order.append(name)
+
+
+class TestRequestScheduler:
+    """Tests for RequestScheduler."""
+
+    async def test_concurrency_is_capped(self):
+        scheduler = RequestScheduler(max_concurrent=2)
+
+        assert scheduler.try_acquire()
+        assert scheduler.try_acquire()
+        assert not scheduler.try_acquire()
+        assert scheduler.active == 2
+
+    async def test_waiters_are_served_by_priority(self):
+        scheduler = RequestScheduler(max_concurrent=1)
+        scheduler.try_acquire()
+        order: list[str] = []
+        tasks = [
+            asyncio.create_task(_queue(scheduler, RequestPriority.BACKGROUND, order, "poll")),
+            asyncio.create_task(_queue(scheduler, RequestPriority.INTERACTIVE_READ, order, "read")),
+            asyncio.create_task(_queue(scheduler, RequestPriority.INTERACTIVE_WRITE, order, "write")),
+        ]
+        await asyncio.sleep(0)
+        assert scheduler.queued == 3
+
+        for _ in tasks:
+            scheduler.release()
+            await asyncio.sleep(0)
+
+        assert order == ["write", "read", "poll"]
+        await asyncio.gather(*tasks)
+
+    async def test_same_priority_is_first_in_first_out(self):
+        scheduler = RequestScheduler(max_concurrent=1)
+        scheduler.try_acquire()
+        order: list[str] = []
+        tasks = [
+            asyncio.create_task(_queue(scheduler, RequestPriority.INTERACTIVE_READ, order, name))
+            for name in ("first", "second")
+        ]
+        await asyncio.sleep(0)
+
+        for _ in tasks:
+            scheduler.release()
+            await asyncio.sleep(0)
+
+        assert order == ["first", "second"]
+
+    async def test_newer_generation_supersedes_queued_requests(self):
+        scheduler = RequestScheduler(max_concurrent=1)
+        scheduler.try_acquire()
+        order: list[str] = []
+        old = [
+            asyncio.create_task(
+                _queue(scheduler, RequestPriority.BACKGROUND, order, name, "poll", 1)
+            )
+            for name in ("old remi", "old events")
+        ]
+        await asyncio.sleep(0)
+        new = asyncio.create_task(
+            _queue(scheduler, RequestPriority.BACKGROUND, order, "new", "poll", 2)
+        )
+        await asyncio.sleep(0)
+
+        for task in old:
+            with pytest.raises(RequestSupersededError):
+                await task
+        scheduler.release()
+        await new
+        assert order == ["new"]
+        assert scheduler.active == 1
+
+    async def test_same_generation_does_not_supersede(self):
+        scheduler = RequestScheduler(max_concurrent=1)
+        scheduler.try_acquire()
+        order: list[str] = []
+        tasks = [
+            asyncio.create_task(
+                _queue(scheduler, RequestPriority.BACKGROUND, order, name, "poll", 1)
+            )
+            for name in ("remi", "events")
+        ]
+        await asyncio.sleep(0)
+
+        for _ in tasks:
+            scheduler.release()
+            await asyncio.sleep(0)
+
+        await asyncio.gather(*tasks)
+        assert order == ["remi", "events"]
+
+    async def test_older_generation_is_dropped_on_arrival(self):
+        scheduler = RequestScheduler(max_concurrent=1)
+        scheduler.try_acquire()
+        new = asyncio.create_task(
+            _queue(scheduler, RequestPriority.BACKGROUND, [], "new", "poll", 2)
+        )
+        await asyncio.sleep(0)
+
+        with pytest.raises(RequestSupersededError):
+            await scheduler.acquire(RequestPriority.BACKGROUND, "poll", 1)
+        scheduler.release()
+        await new
+
+    async def test_cancelled_waiter_does_not_leak_a_slot(self):
+        scheduler = RequestScheduler(max_concurrent=1)
+        scheduler.try_acquire()
+        waiter = asyncio.create_task(scheduler.acquire(RequestPriority.BACKGROUND))
+        await asyncio.sleep(0)
+
+        scheduler.release()
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+
+        assert scheduler.active == 0
+        assert scheduler.try_acquire()
+
+
+class TestSchedulerRegistry:
+    """Tests for the per-host scheduler registry."""
+
+    def test_same_host_shares_scheduler(self):
+        assert get_request_scheduler("https://a.example") is get_request_scheduler("https://a.example")
+        assert get_request_scheduler("https://a.example") is not get_request_scheduler("https://b.example")
@@ -42,7 +42,7 @@ def mock_coordinator():
         "musicMode": 1,
     }
     coordinator.client = MagicMock()
-    coordinator.client.update_remi = AsyncMock(return_value={})
+    coordinator.async_update_remi = AsyncMock()
     coordinator.async_request_refresh = AsyncMock()
     return coordinator
 
@@ -107,7 +107,7 @@ class TestRemiFaceSelectEntity:
         entity = RemiFaceSelectEntity(mock_coordinator)
         await entity.async_select_option("Sleepy")
 
-        mock_coordinator.client.update_remi.assert_awaited_once_with(
+        mock_coordinator.async_update_remi.assert_awaited_once_with(
             {
                 "face": {
                     "__type": "Pointer",
@@ -116,13 +116,13 @@ class TestRemiFaceSelectEntity:
                 }
             }
         )
-        mock_coordinator.async_request_refresh.assert_awaited_once()
+        mock_coordinator.async_request_refresh.assert_not_called()
 
     async def test_select_option_ignores_invalid_option(self, mock_coordinator):
         entity = RemiFaceSelectEntity(mock_coordinator)
         await entity.async_select_option("InvalidFace")
 
-        mock_coordinator.client.update_remi.assert_not_called()
+        mock_coordinator.async_update_remi.assert_not_called()
 
 
 class TestRemiClockFormatSelectEntity:
@@ -157,16 +157,16 @@ class TestRemiClockFormatSelectEntity:
         entity = RemiClockFormatSelectEntity(mock_coordinator)
         await entity.async_select_option("24h")
 
-        mock_coordinator.client.update_remi.assert_awaited_once_with(
+        mock_coordinator.async_update_remi.assert_awaited_once_with(
             {"hourFormat24": True}
         )
-        mock_coordinator.async_request_refresh.assert_awaited_once()
+        mock_coordinator.async_request_refresh.assert_not_called()
 
     async def test_select_12h_updates_format(self, mock_coordinator):
         entity = RemiClockFormatSelectEntity(mock_coordinator)
         await entity.async_select_option("12h")
 
-        mock_coordinator.client.update_remi.assert_awaited_once_with(
+        mock_coordinator.async_update_remi.assert_awaited_once_with(
             {"hourFormat24": False}
         )
 
@@ -206,7 +206,7 @@ class TestRemiMusicModeSelectEntity:
 
         await entity.async_select_option(target_name)
 
-        mock_coordinator.client.update_remi.assert_awaited_once_with(
+        mock_coordinator.async_update_remi.assert_awaited_once_with(
             {"musicMode": target_mode}
         )
-        mock_coordinator.async_request_refresh.assert_awaited_once()
+        mock_coordinator.async_request_refresh.assert_not_called()
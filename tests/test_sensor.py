@@ -1,9 +1,17 @@
 """Tests for the Remi sensor platform."""
 from __future__ import annotations
 
+from unittest.mock import patch
+
 import pytest
 
-from custom_components.urbanhello_remi_unofficial.sensor import SENSOR_DESCRIPTIONS
+from custom_components.urbanhello_remi_unofficial.coordinator import (
+    RemiDataUpdateCoordinator,
+)
+from custom_components.urbanhello_remi_unofficial.sensor import (
+    SENSOR_DESCRIPTIONS,
+    RemiSensorEntity,
+)
 
 from .conftest import MOCK_REMI_DATA
 
@@ -141,3 +149,47 @@ class TestCurrentFaceSensor:
     def test_face_from_mock_data(self):
         desc = _get_description("current_face")
         assert desc.value_fn(MOCK_REMI_DATA) == "Awake"
+
+
+class TestFieldTracking:
+    """Tests for the fields sensors register with the coordinator."""
+
+    def test_every_description_declares_fields(self):
+        assert all(desc.fields for desc in SENSOR_DESCRIPTIONS)
+
+    async def test_added_sensor_tracks_its_field(self, hass, mock_api_client):
+        coordinator = RemiDataUpdateCoordinator(hass, mock_api_client)
+        coordinator.data = {"remi": MOCK_REMI_DATA, "events": []}
+        entity = RemiSensorEntity(coordinator, _get_description("rssi"))
+        entity.hass = hass
+
+        await entity.async_added_to_hass()
+
+        assert "rssi" in coordinator.remi_keys
+        assert "name" in coordinator.remi_keys
+
+        await entity.async_will_remove_from_hass()
+        for remove_callback in entity._on_remove or []:
+            remove_callback()
+
+        assert coordinator.remi_keys is None
+
+
+class TestChangeNotifications:
+    """Tests for writing sensor state only when its field changed."""
+
+    async def test_unrelated_change_skips_state_write(self, hass, mock_api_client):
+        coordinator = RemiDataUpdateCoordinator(hass, mock_api_client)
+        coordinator.async_set_updated_data({"remi": MOCK_REMI_DATA, "events": []})
+        temperature = RemiSensorEntity(coordinator, _get_description("temperature"))
+        rssi = RemiSensorEntity(coordinator, _get_description("rssi"))
+        coordinator.async_set_updated_data(
+            {"remi": {**MOCK_REMI_DATA, "rssi": -70}, "events": []}
+        )
+
+        with patch.object(RemiSensorEntity, "async_write_ha_state") as write_state:
+            temperature._handle_coordinator_update()
+            rssi._handle_coordinator_update()
+
+        write_state.assert_called_once()
+        await coordinator.async_shutdown()
@@ -27,6 +27,7 @@ def coordinator(hass, mock_api_client):
     coord.remi = MOCK_REMI_DATA
     coord.events = list(MOCK_EVENT_DATA)
     coord.async_request_refresh = AsyncMock()
+    coord.async_update_event = AsyncMock()
     coord.async_add_listener = MagicMock(return_value=lambda: None)
     return coord
 
@@ -105,18 +106,18 @@ class TestRemiAlarmSwitchEntity:
     async def test_async_turn_on(self, alarm_switch, coordinator, mock_api_client):
         await alarm_switch.async_turn_on()
 
-        mock_api_client.update_event.assert_called_once_with(
+        coordinator.async_update_event.assert_awaited_once_with(
             MOCK_EVENT["objectId"], {"enabled": True}
         )
-        coordinator.async_request_refresh.assert_called_once()
+        coordinator.async_request_refresh.assert_not_called()
 
     async def test_async_turn_off(self, alarm_switch, coordinator, mock_api_client):
         await alarm_switch.async_turn_off()
 
-        mock_api_client.update_event.assert_called_once_with(
+        coordinator.async_update_event.assert_awaited_once_with(
             MOCK_EVENT["objectId"], {"enabled": False}
         )
-        coordinator.async_request_refresh.assert_called_once()
+        coordinator.async_request_refresh.assert_not_called()
 
 
 class TestGetEvent:
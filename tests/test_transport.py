@@ -0,0 +1,190 @@
+"""Tests for the pluggable HTTP transports."""
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any
+
+import pytest
+
+from custom_components.urbanhello_remi_unofficial.api import (
+    RemiApiClient,
+    RemiTimeoutError,
+)
+from custom_components.urbanhello_remi_unofficial.const import API_BASE_URL
+from custom_components.urbanhello_remi_unofficial.coordinator import (
+    RemiDataUpdateCoordinator,
+)
+from custom_components.urbanhello_remi_unofficial.resilience import (
+    CircuitBreaker,
+    RateLimiter,
+)
+from custom_components.urbanhello_remi_unofficial.scheduler import RequestScheduler
+from custom_components.urbanhello_remi_unofficial.transport import (
+    CassetteMissError,
+    RecordingTransport,
+    ReplayTransport,
+    TransportResponse,
+)
+
+from .conftest import (
+    MOCK_EVENT_DATA,
+    MOCK_LOGIN_RESPONSE,
+    MOCK_PASSWORD,
+    MOCK_REMI_DATA,
+    MOCK_USERNAME,
+)
+
+
+# User fields Parse returns with a login.
+MOCK_USER: dict[str, Any] = {
+    "objectId": "user_object_id_1",
+    "username": MOCK_USERNAME,
+    "email": MOCK_USERNAME,
+    "ACL": {"user_object_id_1": {"read": True, "write": True}},
+    "createdAt": "2024-01-01T00:00:00.000Z",
+    "updatedAt": "2024-01-01T00:00:00.000Z",
+}
+
+
+class FakeCloud:
+    """Transport answering logins, Remi and Event queries like the cloud."""
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        payload: dict[str, Any] | None,
+        headers: Any,
+        timeout: float,
+    ) -> TransportResponse:
+        path = url.removeprefix(API_BASE_URL)
+        if path == "/parse/login":
+            body: Any = {**MOCK_USER, **MOCK_LOGIN_RESPONSE}
+        elif path == "/parse/classes/Remi":
+            body = {"results": [MOCK_REMI_DATA]}
+        else:
+            body = {"results": MOCK_EVENT_DATA}
+        return TransportResponse(200, json.dumps(body).encode(), {})
+
+
+def _client(transport: Any) -> RemiApiClient:
+    return RemiApiClient(
+        MOCK_USERNAME,
+        MOCK_PASSWORD,
+        None,
+        circuit_breaker=CircuitBreaker(),
+        scheduler=RequestScheduler(),
+        rate_limiter=RateLimiter(),
+        transport=transport,
+    )
+
+
+async def _session(client: RemiApiClient) -> tuple[Any, ...]:
+    await client.login()
+    return await client.get_remi(), await client.get_events()
+
+
+class TestRecordAndReplay:
+    """Tests for RecordingTransport and ReplayTransport."""
+
+    async def test_replay_reproduces_recorded_session(self):
+        recorder = RecordingTransport(FakeCloud())
+        live = await _session(_client(recorder))
+
+        replayed = await _session(_client(ReplayTransport(recorder.exchanges)))
+
+        assert replayed == live
+        assert [exchange["path"] for exchange in recorder.exchanges] == [
+            "/parse/login",
+            "/parse/classes/Remi",
+            "/parse/classes/Event",
+        ]
+
+    async def test_coordinator_polls_from_cassette(self, hass):
+        recorder = RecordingTransport(FakeCloud())
+        live = await RemiDataUpdateCoordinator(hass, _client(recorder))._async_update_data()
+
+        replay = ReplayTransport(recorder.exchanges)
+        replayed = await RemiDataUpdateCoordinator(hass, _client(replay))._async_update_data()
+
+        assert replayed == live
+        assert replayed["events"] == MOCK_EVENT_DATA
+
+    async def test_secrets_are_not_recorded(self):
+        recorder = RecordingTransport(FakeCloud())
+
+        await _client(recorder).login()
+
+        login = recorder.exchanges[0]
+        assert login["payload"]["password"] != MOCK_PASSWORD
+        assert MOCK_LOGIN_RESPONSE["sessionToken"] not in login["body"]
+
+    async def test_account_details_are_not_recorded(self):
+        recorder = RecordingTransport(FakeCloud())
+
+        await _client(recorder).login()
+
+        login = recorder.exchanges[0]
+        body = json.loads(login["body"])
+        assert login["payload"]["username"] != MOCK_USERNAME
+        for key in ("objectId", "username", "email", "ACL"):
+            assert body[key] != MOCK_USER[key]
+        assert MOCK_USERNAME not in json.dumps(login)
+        assert MOCK_USER["objectId"] not in json.dumps(login)
+        assert body["currentRemi"] == MOCK_LOGIN_RESPONSE["currentRemi"]
+
+    async def test_cassette_file_round_trip(self, tmp_path):
+        recorder = RecordingTransport(FakeCloud())
+        live = await _session(_client(recorder))
+        cassette = tmp_path / "session.jsonl"
+
+        await recorder.async_save(cassette)
+        replay = await asyncio.get_running_loop().run_in_executor(
+            None, ReplayTransport.from_file, cassette
+        )
+
+        assert len(cassette.read_text().splitlines()) == 3
+        assert await _session(_client(replay)) == live
+
+    async def test_last_response_repeats(self):
+        exchanges = [
+            {
+                "method": "GET",
+                "path": "/parse/config",
+                "payload": None,
+                "status": 200,
+                "body": json.dumps({"params": {"n": n}}),
+                "headers": {},
+                "elapsed": 0.0,
+            }
+            for n in (1, 2)
+        ]
+        client = _client(ReplayTransport(exchanges))
+
+        results = [(await client.get_config())["params"]["n"] for _ in range(3)]
+
+        assert results == [1, 2, 2]
+
+    async def test_unrecorded_request_raises(self):
+        client = _client(ReplayTransport([]))
+
+        with pytest.raises(CassetteMissError):
+            await client.get_config()
+
+    async def test_timing_replays_timeouts(self):
+        exchange = {
+            "method": "GET",
+            "path": "/parse/health",
+            "payload": None,
+            "status": 200,
+            "body": "{}",
+            "headers": {},
+            "elapsed": 5.0,
+        }
+        transport = ReplayTransport([exchange], timing=True)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await transport.request("GET", f"{API_BASE_URL}/parse/health", None, {}, 0.01)
+        with pytest.raises(RemiTimeoutError):
+            await _client(transport)._send("GET", "/parse/health", timeout=0.01)
@@ -0,0 +1,163 @@
+"""Tests for the durable offline write queue."""
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+from homeassistant.util import dt as dt_util
+import pytest
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.urbanhello_remi_unofficial.api import (
+    RemiApiError,
+    RemiBatchError,
+    RemiTimeoutError,
+)
+from custom_components.urbanhello_remi_unofficial.write_queue import (
+    RemiWriteQueue,
+    async_drain_write_queue,
+    async_remove_write_queue,
+)
+
+STORAGE_KEY = "urbanhello_remi_unofficial.write_queue.entry_1"
+
+
+@pytest.fixture
+def batch() -> MagicMock:
+    """Return a mock batch returned by the client."""
+    batch = MagicMock()
+    batch.commit = AsyncMock(return_value=[])
+    return batch
+
+
+@pytest.fixture
+def write_queue(hass, mock_api_client, batch) -> RemiWriteQueue:
+    """Return a write queue for a mock client."""
+    mock_api_client.batch = MagicMock(return_value=batch)
+    return RemiWriteQueue(hass, mock_api_client, "entry_1")
+
+
+class TestRemiWriteQueue:
+    """Tests for RemiWriteQueue."""
+
+    async def test_repeated_writes_collapse(self, write_queue, batch):
+        write_queue.queue_remi_update({"volume": 10, "brightness": 20})
+        write_queue.queue_remi_update({"volume": 30})
+        write_queue.queue_event_update("ev1", {"enabled": False})
+        write_queue.queue_event_update("ev1", {"enabled": True})
+        assert len(write_queue) == 2
+
+        await write_queue.async_flush()
+
+        batch.update_remi.assert_called_once_with({"volume": 30, "brightness": 20})
+        batch.update_event.assert_called_once_with("ev1", {"enabled": True})
+        batch.commit.assert_awaited_once()
+        assert len(write_queue) == 0
+
+    async def test_empty_queue_sends_nothing(self, write_queue, mock_api_client):
+        await write_queue.async_flush()
+
+        mock_api_client.batch.assert_not_called()
+
+    async def test_unsent_updates_stay_under_newer_values(self, write_queue, batch):
+        write_queue.queue_remi_update({"volume": 10, "brightness": 20})
+
+        async def _fail() -> None:
+            write_queue.queue_remi_update({"volume": 50})
+            raise RemiTimeoutError("timed out")
+
+        batch.commit.side_effect = _fail
+
+        with pytest.raises(RemiTimeoutError):
+            await write_queue.async_flush()
+
+        batch.commit.side_effect = None
+        await write_queue.async_flush()
+        assert batch.update_remi.call_args.args == ({"volume": 50, "brightness": 20},)
+
+    async def test_rejected_updates_are_dropped(self, write_queue, batch):
+        write_queue.queue_event_update("missing", {"enabled": True})
+        batch.commit.side_effect = RemiBatchError("Object not found.", [RemiApiError()])
+
+        with pytest.raises(RemiBatchError):
+            await write_queue.async_flush()
+
+        assert len(write_queue) == 0
+
+    async def test_pending_updates_are_persisted(self, hass, hass_storage, write_queue):
+        write_queue.queue_event_update("ev1", {"enabled": False})
+
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=5))
+        await hass.async_block_till_done()
+
+        assert hass_storage[STORAGE_KEY]["data"] == {
+            "remi": {},
+            "events": {"ev1": {"enabled": False}},
+        }
+
+    async def test_load_restores_pending_updates(self, hass, hass_storage, mock_api_client, batch):
+        hass_storage[STORAGE_KEY] = {
+            "version": 1,
+            "key": STORAGE_KEY,
+            "data": {"remi": {"volume": 10}, "events": {"ev1": {"enabled": False}}},
+        }
+        mock_api_client.batch = MagicMock(return_value=batch)
+        write_queue = RemiWriteQueue(hass, mock_api_client, "entry_1")
+
+        await write_queue.async_load()
+        await write_queue.async_flush()
+
+        batch.update_remi.assert_called_once_with({"volume": 10})
+        batch.update_event.assert_called_once_with("ev1", {"enabled": False})
+
+    async def test_remove_deletes_stored_queue(self, hass, hass_storage, write_queue, batch):
+        write_queue.queue_remi_update({"volume": 10})
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=5))
+        await hass.async_block_till_done()
+
+        await write_queue.async_remove()
+
+        assert STORAGE_KEY not in hass_storage
+        assert len(write_queue) == 0
+
+    async def test_remove_write_queue_without_loading_it(self, hass, hass_storage):
+        hass_storage[STORAGE_KEY] = {"version": 1, "key": STORAGE_KEY, "data": {}}
+
+        await async_remove_write_queue(hass, "entry_1")
+
+        assert STORAGE_KEY not in hass_storage
+
+
+class TestDrainWriteQueue:
+    """Tests for sending the queue left behind when the option is turned off."""
+
+    @pytest.fixture(autouse=True)
+    def stored_queue(self, hass_storage) -> None:
+        hass_storage[STORAGE_KEY] = {
+            "version": 1,
+            "key": STORAGE_KEY,
+            "data": {"remi": {"volume": 10}, "events": {}},
+        }
+
+    async def test_pending_updates_are_sent_and_store_removed(
+        self, hass, hass_storage, mock_api_client, batch
+    ):
+        mock_api_client.batch = MagicMock(return_value=batch)
+
+        await async_drain_write_queue(hass, mock_api_client, "entry_1")
+        await hass.async_block_till_done()
+
+        batch.update_remi.assert_called_once_with({"volume": 10})
+        assert STORAGE_KEY not in hass_storage
+
+    async def test_unsent_updates_are_logged_and_dropped(
+        self, hass, hass_storage, mock_api_client, batch, caplog
+    ):
+        batch.commit.side_effect = RemiTimeoutError("offline")
+        mock_api_client.batch = MagicMock(return_value=batch)
+
+        await async_drain_write_queue(hass, mock_api_client, "entry_1")
+        await hass.async_block_till_done()
+
+        assert "Dropped queued updates of 1 Remi objects" in caplog.text
+        assert STORAGE_KEY not in hass_storage